@@ -0,0 +1,127 @@
+# %%
+import io
+import contextlib
+from collections import namedtuple
+import concurrent.futures
+from Gaussian_Distribution import Gaussian
+from Binomial_Distribution import Binomial
+
+# Distribution classes that can be fitted by name
+DISTRIBUTIONS = {'gaussian': Gaussian, 'binomial': Binomial}
+
+# Compact result of fitting one file: only the parameters, or the error that stopped the fit
+FitResult = namedtuple('FitResult', ['path', 'kind', 'mean', 'stdev', 'n', 'prob', 'error'])
+
+# Result of rendering one figure: where it was written, or the error that stopped it
+ExportResult = namedtuple('ExportResult', ['output', 'error'])
+
+def fit_file(path: str, kind: str = 'gaussian') -> FitResult:
+    """
+        Function to fit one distribution to a data file and keep only its parameters.
+        Errors are recorded in the result instead of being raised.
+
+        Args:
+            path (str): name of the data file to fit.
+            kind (str): 'gaussian' or 'binomial'.
+
+        Returns:
+            FitResult: the fitted parameters, or the error message
+
+    """
+
+    try:
+        # The constructors report on every file loaded; keep batch runs quiet
+        with contextlib.redirect_stdout(io.StringIO()):
+            distribution = DISTRIBUTIONS[kind](file_name=path)
+    except Exception as error:
+        return FitResult(path, kind, None, None, None, None, f'{type(error).__name__}: {error}')
+
+    return FitResult(path, kind, float(distribution.mean), float(distribution.stdev), int(distribution.n),
+                     float(distribution.prob) if kind == 'binomial' else None, None)
+
+def fit_many(paths: 'list[str]', kind: str = 'gaussian', workers: int or None = None,
+             chunksize: int = 16) -> 'list[FitResult]':
+    """
+        Function to fit one distribution per data file across a process pool.
+        Loading and analyze_data_set run in the workers; only the parameters come back.
+
+        Args:
+            paths (list[str]): names of the data files to fit.
+            kind (str): 'gaussian' or 'binomial'.
+            workers (int or None): number of worker processes. None uses one per CPU,
+            1 fits in the calling process.
+            chunksize (int): number of files sent to a worker at a time.
+
+        Returns:
+            list[FitResult]: one result per file, in the order of paths
+
+    """
+
+    if kind not in DISTRIBUTIONS:
+        raise ValueError(f"kind must be one of {sorted(DISTRIBUTIONS)}, got {kind!r}")
+
+    paths = list(paths)
+    kinds = [kind] * len(paths)
+
+    if workers == 1:
+        return list(map(fit_file, paths, kinds))
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(fit_file, paths, kinds, chunksize=chunksize))
+
+def export_figure(distribution: 'Gaussian or Binomial', output: str, method: str = 'plot_histogram_pdf',
+                  format: 'str or None' = None) -> ExportResult:
+    """
+        Function to render one plot of a distribution to a file without a display.
+        Errors are recorded in the result instead of being raised.
+
+        Args:
+            distribution (Gaussian or Binomial): the distribution to plot.
+            output (str): name of the image file to write.
+            method (str): name of the plot method, e.g. 'plot_histogram' or 'plot_bar_pdf'.
+            format (str or None): image format; None infers it from the file name.
+
+        Returns:
+            ExportResult: the output name, or the error message
+
+    """
+
+    try:
+        getattr(distribution, method)(output=output, format=format)
+    except Exception as error:
+        return ExportResult(output, f'{type(error).__name__}: {error}')
+
+    return ExportResult(output, None)
+
+def export_many(distributions: 'list[Gaussian or Binomial]', outputs: 'list[str]',
+                method: str = 'plot_histogram_pdf', format: 'str or None' = None,
+                workers: int or None = None, chunksize: int = 4) -> 'list[ExportResult]':
+    """
+        Function to render one figure per distribution across a process pool. Figures
+        are drawn with the Agg canvas, so no display is needed.
+
+        Args:
+            distributions (list[Gaussian or Binomial]): the distributions to plot.
+            outputs (list[str]): name of the image file for each distribution.
+            method (str): name of the plot method, e.g. 'plot_histogram' or 'plot_bar_pdf'.
+            format (str or None): image format; None infers it from each file name.
+            workers (int or None): number of worker processes. None uses one per CPU,
+            1 renders in the calling process.
+            chunksize (int): number of figures sent to a worker at a time.
+
+        Returns:
+            list[ExportResult]: one result per figure, in the order of outputs
+
+    """
+
+    distributions, outputs = list(distributions), list(outputs)
+    if len(distributions) != len(outputs):
+        raise ValueError(f"Got {len(distributions)} distributions for {len(outputs)} outputs")
+
+    _methods, _formats = [method] * len(outputs), [format] * len(outputs)
+
+    if workers == 1:
+        return list(map(export_figure, distributions, outputs, _methods, _formats))
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(export_figure, distributions, outputs, _methods, _formats, chunksize=chunksize))
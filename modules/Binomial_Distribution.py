@@ -1,18 +1,136 @@
 # %%
 import os
 import math
-import matplotlib.pyplot as plt
-from scipy.stats import bernoulli, norm
+import functools
 import numpy as np
 import General_Distribution as General_Distribution
+import Plotting as Plotting
+import Sampling as Sampling
+
+# Number of (n, p) cumulative probability tables kept for cdf, sf and ppf queries
+TABLE_CACHE_SIZE = 64
+
+# Log probabilities below this underflow to zero in float64, so the tables stop where the pmf does
+LOG_UNDERFLOW = -746.0
+
+# Standard deviations either side of the mean over which plot_bar_pdf draws the pmf;
+# the probability further out is below 1e-22
+PLOT_TAIL_STDEVS = 10
+
+def _binomial_logpmf(k: 'np.ndarray', n: int, prob: float) -> 'np.ndarray':
+    """
+        Function to evaluate the binomial log probability mass function with log-gamma arithmetic.
+
+        Args:
+            k (np.ndarray): number(s) of successes.
+            n (int): number of trials.
+            prob (float): probability of a success.
+
+        Returns:
+            np.ndarray: log probability mass function output, -inf outside 0..n and for fractional k
+
+    """
+
+    # scipy.special is only needed once a probability is requested; import it on first use
+    from scipy.special import gammaln, xlogy, xlog1py
+
+    k = np.asarray(k, dtype=float)
+
+    # log b(k; n, P) = lgamma(n + 1) - lgamma(k + 1) - lgamma(n - k + 1) + k log(P) + (n - k) log(1 - P)
+    with np.errstate(invalid='ignore'):
+        _log_coefficient = gammaln(n + 1) - gammaln(k + 1) - gammaln(n - k + 1)
+        _log_pmf = _log_coefficient + xlogy(k, prob) + xlog1py(n - k, -prob)
+
+    _in_support = (k >= 0) & (k <= n) & (k == np.floor(k))
+
+    return np.where(_in_support, _log_pmf, -np.inf)
+
+def _support(n: int, prob: float) -> 'int, int':
+    """
+        Function to find the numbers of successes whose probability does not underflow in
+        float64, by bisection on either side of the mode of the unimodal pmf.
+
+        Args:
+            n (int): number of trials.
+            prob (float): probability of a success.
+
+        Returns:
+            int: smallest number of successes with a log probability of at least LOG_UNDERFLOW
+            int: largest number of successes with a log probability of at least LOG_UNDERFLOW
+
+    """
+
+    if not 0 <= prob <= 1:
+        return 0, n
+
+    _mode = min(n, math.floor((n + 1) * prob))
+
+    def inside(k: int) -> bool:
+        return float(_binomial_logpmf(k, n, prob)) >= LOG_UNDERFLOW
+
+    _low, _high = 0, _mode
+    while _low < _high:
+        _middle = (_low + _high) // 2
+        _low, _high = (_low, _middle) if inside(_middle) else (_middle + 1, _high)
+    _first = _low
+
+    _low, _high = _mode, n
+    while _low < _high:
+        _middle = (_low + _high + 1) // 2
+        _low, _high = (_middle, _high) if inside(_middle) else (_low, _middle - 1)
+
+    return _first, _low
+
+@functools.lru_cache(maxsize=TABLE_CACHE_SIZE)
+def _cumulative_tables(n: int, prob: float) -> 'int, np.ndarray, np.ndarray':
+    """
+        Function to build the read-only cumulative probability tables of a binomial distribution.
+        The tables only cover the successes whose probability does not underflow, plus one
+        below them, so their size grows with the standard deviation rather than with n;
+        further out both tables are constant. They are kept in a least recently used cache
+        keyed on (n, prob).
+
+        Args:
+            n (int): number of trials.
+            prob (float): probability of a success.
+
+        Returns:
+            int: number of successes at the start of the tables
+            np.ndarray: P(X <= k) for k = start..end of the support
+            np.ndarray: P(X > k) for the same k, summed from the upper tail to keep small tails accurate
+
+    """
+
+    _first, _last = _support(n, prob)
+    _offset = max(_first - 1, 0)
+    _pmf = np.exp(_binomial_logpmf(np.arange(_offset, _last + 1), n, prob))
+
+    _cdf = np.minimum(np.cumsum(_pmf), 1.0)
+    _sf = np.zeros(len(_pmf))
+    _sf[:-1] = np.cumsum(_pmf[:0:-1])[::-1]
+    _sf = np.minimum(_sf, 1.0)
+
+    _cdf.setflags(write=False)
+    _sf.setflags(write=False)
+
+    return _offset, _cdf, _sf
 
 class Binomial(General_Distribution.Distribution):
 
+    __slots__ = ('n', 'prob', '_successes')
+
+    # Outcomes are 0 or 1, so they are stored one byte each
+    data_dtype = 'uint8'
+
+    # Number of fitted parameters, for information criteria; n is fixed by the design
+    n_parameters = 1
+
     def __init__(self, prob: float = .5, n: int = 25, file_name: str or None = None) -> None:
 
+        self._successes = None
+
         if file_name:
-            self.data = self.read_data_file(file_name)
-            self.n = len(self.data)
+            self.read_data_file(file_name)
             General_Distribution.Distribution.__init__(self)
             self.analyze_data_set()
         else:
@@ -26,10 +144,13 @@ class Binomial(General_Distribution.Distribution):
             Attributes:
                 mean (float): calculates the mean value of the distribution
                 stdev (float): calculates the standard deviation of the distribution
-                data (list[float]): a list of floats extracted from the data file
+                data (np.ndarray): uint8 array of the outcomes extracted from the data file
                 p (float): calculates the probability of a binary event occuring
                 n (int): the number of observations in the data set
 
+            Without a data set (data is None) the class works from the count of
+            successes and n alone; see from_counts.
+
         """
 
     def analyze_data_set(self, sample: bool = False) -> 'float, float, float, int':
@@ -46,16 +167,138 @@ class Binomial(General_Distribution.Distribution):
                 float: the probability of the positive class in the data set
                 int: the number of observations in the data set
         """
-        if sample:
-            self.data = bernoulli(self.prob).rvs(self.n)
+        if sample and self.data is None:
+            # Only the number of successes matters, so draw it as a single binomial count
+            self._successes = int(self.sample())
+        elif sample:
+            self.data = self.sample(self.n, outcomes=True)
+
+        if self.data is None:
+            _successes = getattr(self, '_successes', None)
+            if _successes is None:
+                raise ValueError("There is no data set or count of successes to analyze")
+        else:
+            self.n = len(self.data)    
+            _successes = self._cached('successes', lambda: np.sum(self.data))
 
-        self.n = len(self.data)    
-        self.prob = sum(self.data)/self.n * 1.0
+        self.prob = _successes/self.n * 1.0 if self.n else math.nan
         self.mean = self.calculate_mean()
         self.stdev = self.calculate_stdev()
 
         return self.mean, self.stdev, self.prob, self.n 
 
+    @classmethod
+    def from_counts(cls, successes: int = 0, n: int = 0) -> 'Binomial':
+        """ 
+            Method to build a Binomial from its count of successes and number of trials
+            without storing any outcomes.
+
+            Args:
+                successes (int): number of positive outcomes.
+                n (int): number of trials.
+
+            Returns:
+                Binomial: fitted distribution in counts mode
+        """
+
+        result = cls.__new__(cls)
+        General_Distribution.Distribution.__init__(result)
+        result._successes = int(successes)
+        result.n = int(n)
+        result.analyze_data_set()
+
+        return result
+
+    def add_counts(self, successes: int, n: int) -> 'Binomial':
+        """ 
+            Method to add aggregated outcomes to the counts and refit. A Binomial
+            holding a data set is first reduced to its counts.
+
+            Args:
+                successes (int): number of positive outcomes to add.
+                n (int): number of trials to add.
+
+            Returns:
+                Binomial: the updated distribution
+        """
+
+        if self.data is not None:
+            self._successes = int(self._cached('successes', lambda: np.sum(self.data)))
+            self.n = len(self.data)
+            self.data = None
+        elif getattr(self, '_successes', None) is None:
+            raise ValueError("There is no count of successes to add to, use Binomial.from_counts")
+
+        self._successes += int(successes)
+        self.n += int(n)
+        self.analyze_data_set()
+
+        return self
+
+    def update_counts(self, outcomes: 'np.ndarray') -> 'Binomial':
+        """ 
+            Method to add a chunk of 0/1 outcomes to the counts and refit. Call it once per
+            chunk to ingest a stream; only the counters are kept.
+
+            Args:
+                outcomes (np.ndarray): the outcomes to add.
+
+            Returns:
+                Binomial: the updated distribution
+        """
+
+        outcomes = np.asarray(outcomes)
+
+        return self.add_counts(np.count_nonzero(outcomes), outcomes.size)
+
+    def read_data_file(self, file_name: str, dtype: 'str or None' = None) -> 'np.ndarray or None':
+        """ 
+            Method to read a data file of outcomes. Aggregated value,count files are
+            reduced to the count of successes and n without expanding the outcomes.
+
+            Args:
+                file_name (str): name of a file to read.
+                dtype (str or None): type of the values; also the layout of raw binary files.
+                None stores the outcomes as uint8.
+
+            Returns:
+                np.ndarray or None: the loaded data, None for an aggregated file
+        """
+
+        if not self.is_counts_file(file_name):
+            return General_Distribution.Distribution.read_data_file(self, file_name, dtype)
+
+        values, counts = self.load_counts(file_name, dtype or self.data_dtype)
+        self.data = None
+        self._successes = int(np.dot(values != 0, counts))
+        self.n = int(np.sum(counts))
+
+        if self.n > 0:
+            print("Data loaded properly.")
+        else:
+            print("There was a problem, please try again.")
+
+        return self.data
+
+    def append_data(self, values: 'np.ndarray') -> 'np.ndarray':
+        """ 
+            Method to append outcomes to the data set. The cached count of
+            successes is updated with the new outcomes instead of being recomputed.
+
+            Args:
+                values (np.ndarray): the outcomes to append.
+
+            Returns:
+                np.ndarray: the extended data set
+        """
+
+        successes = self._cache.get('successes')
+        General_Distribution.Distribution.append_data(self, values)
+        if successes is not None:
+            self._cache['successes'] = successes + np.sum(values)
+
+        return self.data
+
     def calculate_mean(self) -> float:
 
         """ 
@@ -88,38 +331,80 @@ class Binomial(General_Distribution.Distribution):
         """
 
         _n = self.n
+
+        if np.any((np.asarray(self.prob) < 0) | (np.asarray(self.prob) > 1)):
+            raise ValueError(f"Probability must be between 0 and 1, got {self.prob}")
     
-        _stdev = math.sqrt(_n * self.prob * (1-self.prob))
+        _stdev = np.sqrt(_n * self.prob * (1-self.prob))
 
         return _stdev
 
-    def plot_bar(self) -> None:
+    def sample(self, size: 'int or tuple or None' = None, rng: 'int or np.random.Generator or None' = None,
+               out: 'np.ndarray or None' = None, threads: int = 1, outcomes: bool = False) -> 'np.ndarray or int':
+        """
+            Method to draw random values from the distribution with NumPy generators.
+            The draws are made in blocks, each from its own stream spawned from rng, so
+            a given seed gives the same values for any number of threads.
+
+            Args:
+                size (int or tuple or None): shape of the sample; None draws a single value
+                unless out is given.
+                rng (int or np.random.Generator or None): seed or generator of the streams;
+                None draws fresh entropy.
+                out (np.ndarray or None): preallocated integer or bool buffer to fill in place.
+                threads (int): number of threads generating blocks at the same time.
+                outcomes (bool): flag to draw the 0/1 outcomes of single trials (uint8)
+                instead of numbers of successes in n trials (int64).
+
+            Returns:
+                np.ndarray or int: the sample, out when it was given
+
+        """
+
+        if size is None and out is None:
+            return int(self.sample(1, rng, outcomes=outcomes)[0])
+
+        _n, _prob = self.n, self.prob
+
+        def draw(generator: 'np.random.Generator', block: 'np.ndarray') -> None:
+            if outcomes:
+                np.less(generator.random(len(block)), _prob, out=block, casting='unsafe')
+            else:
+                block[:] = generator.binomial(_n, _prob, size=len(block))
+
+        return Sampling.fill(Sampling.output_buffer(size, out, 'uint8' if outcomes else 'int64'), draw, rng, threads)
+
+    def plot_bar(self, output: 'str or object or None' = None, format: 'str or None' = None) -> None:
         """
             Function to plot a bar graph of the instance variable 
             using the matplotlib pyplot library.
 
             Args:
-                None
+                output (str or file-like or None): file name or binary file-like object to render
+                the figure to without a display; None shows it.
+                format (str or None): image format when rendering, e.g. 'png' or 'svg'.
             
             Returns:
                 None
            
         """
-        plt.bar(x=['0','1'], height = [(1 - self.prob) * self.n, self.prob * self.n])
-        plt.title('Bar Chart of Outcomes')
-        plt.xlabel('Outcome')
-        plt.ylabel('Count')
-        plt.show()
+
+        fig, axes = Plotting.new_figure(output)
+        axes.bar(x=['0','1'], height = [(1 - self.prob) * self.n, self.prob * self.n])
+        axes.set_title('Bar Chart of Outcomes')
+        axes.set_xlabel('Outcome')
+        axes.set_ylabel('Count')
+        Plotting.finish_figure(fig, output, format)
     
-    def pdf(self, x: float) -> float:
+    def pdf(self, x: 'float or np.ndarray') -> 'float or np.ndarray':
         """
             Probability density function calculator for the bionomial distribution.
 
             Args:
-                x (float): point for calculating the probability density function. Must be x =< n
+                x (float or np.ndarray): point(s) for calculating the probability density function. Must be x =< n
             
             Returns:
-                float: probability density function output
+                float or np.ndarray: probability density function output
         
         """
 
@@ -130,21 +415,166 @@ class Binomial(General_Distribution.Distribution):
         # OR 
         # b(x; n, P) = { n! / [ x! (n - x)! ] } * Px * (1 - P)n - x
         
-        if x <= self.n:
-            a = math.factorial(self.n)/ (math.factorial(x) * (math.factorial(self.n - x)))
-            b = (self.prob ** x) * (1 - self.prob) ** (self.n - x)
-            return a * b
+        if np.all(np.asarray(x) <= self.n):
+            return self.pmf(x)
         else:
             raise ValueError("x must be n or less")
+
+    def logpmf(self, k: 'int or np.ndarray') -> 'float or np.ndarray':
+        """
+            Natural logarithm of the probability mass function for the binomial distribution.
+            The coefficient nCk is evaluated with log-gamma arithmetic so large n does not overflow.
+
+            Args:
+                k (int or np.ndarray): number(s) of successes. Values outside 0..n or that are
+                not whole numbers have a log probability of -inf.
+            
+            Returns:
+                float or np.ndarray: log probability mass function output, with the shape of k
+        
+        """
+
+        return _binomial_logpmf(k, self.n, self.prob)[()]
+
+    def loglik(self, data: 'np.ndarray') -> float:
+        """
+            Log-likelihood of observed numbers of successes, each out of n trials.
+
+            Args:
+                data (np.ndarray): the numbers of successes to score.
+            
+            Returns:
+                float: sum of the log probabilities of the observations, -inf if any is outside 0..n
+        
+        """
+
+        return float(np.sum(self.logpmf(np.asarray(data, dtype=float).ravel())))
+
+    @classmethod
+    def _log_likelihoods(cls, candidates: 'list[Binomial]', data: 'np.ndarray') -> 'np.ndarray':
+        """
+            Method to score one block of observations against many Binomials in a single broadcast pass.
+
+            Args:
+                candidates (list[Binomial]): the distributions to score against.
+                data (np.ndarray): the numbers of successes.
+
+            Returns:
+                np.ndarray: log probabilities, one row per candidate
+
+        """
+
+        _n = np.array([candidate.n for candidate in candidates], dtype=float)[:, None]
+        _prob = np.array([candidate.prob for candidate in candidates], dtype=float)[:, None]
+
+        return _binomial_logpmf(data[None, :], _n, _prob)
+
+    def pmf(self, k: 'int or np.ndarray') -> 'float or np.ndarray':
+        """
+            Probability mass function for the binomial distribution.
+
+            Args:
+                k (int or np.ndarray): number(s) of successes.
+            
+            Returns:
+                float or np.ndarray: probability mass function output, with the shape of k
+        
+        """
+
+        return np.exp(self.logpmf(k))
     
-    def plot_bar_pdf(self, n_spaces: int = 50) -> 'list[float], list[float]':
+    def _table_lookup(self, table: 'np.ndarray', k: 'int or np.ndarray', below: float,
+                      offset: int = 0) -> 'float or np.ndarray':
+        """
+            Method to look up a cumulative probability table at the given numbers of successes.
+
+            Args:
+                table (np.ndarray): cumulative probability for k = offset..offset + len(table) - 1.
+                k (int or np.ndarray): number(s) of successes. Fractions are rounded down.
+                below (float): value of the table for k < 0. Between 0 and offset the value is
+                table[0] and past the end of the table it is table[-1].
+                offset (int): number of successes at the start of the table.
+
+            Returns:
+                float or np.ndarray: table values, with the shape of k
+
+        """
+
+        k = np.floor(np.asarray(k, dtype=float))
+        _index = (np.clip(k, offset, offset + len(table) - 1) - offset).astype(np.int64)
+
+        return np.where(k < 0, below, table[_index])[()]
+
+    def cdf(self, k: 'int or np.ndarray') -> 'float or np.ndarray':
+        """
+            Cumulative distribution function P(X <= k) for the binomial distribution.
+
+            Args:
+                k (int or np.ndarray): number(s) of successes.
+            
+            Returns:
+                float or np.ndarray: cumulative probability, with the shape of k
+        
+        """
+
+        _offset, _cdf, _sf = _cumulative_tables(self.n, self.prob)
+
+        return self._table_lookup(_cdf, k, 0.0, _offset)
+
+    def sf(self, k: 'int or np.ndarray') -> 'float or np.ndarray':
+        """
+            Survival function P(X > k) for the binomial distribution. The tail
+            probability P(X >= k) is sf(k - 1).
+
+            Args:
+                k (int or np.ndarray): number(s) of successes.
+            
+            Returns:
+                float or np.ndarray: tail probability, with the shape of k
+        
+        """
+
+        _offset, _cdf, _sf = _cumulative_tables(self.n, self.prob)
+
+        return self._table_lookup(_sf, k, 1.0, _offset)
+
+    def ppf(self, q: 'float or np.ndarray') -> 'float or np.ndarray':
+        """
+            Percent point function (inverse of cdf) for the binomial distribution.
+
+            Args:
+                q (float or np.ndarray): probability or probabilities between 0 and 1.
+            
+            Returns:
+                float or np.ndarray: smallest number of successes k with P(X <= k) >= q,
+                nan where q is outside 0..1
+        
+        """
+
+        q = np.asarray(q, dtype=float)
+        _offset, _cdf, _sf = _cumulative_tables(self.n, self.prob)
+
+        _k = np.minimum(_offset + np.searchsorted(_cdf, q, side='left'), self.n).astype(float)
+
+        # Rounding can take the cdf to 1 before k = n; the whole support is needed for q = 1,
+        # and none of it below the table for q = 0
+        _k = np.where(q == 1, self.n, np.where(q == 0, 0, _k))
+
+        return np.where((q >= 0) & (q <= 1), _k, np.nan)[()]
+
+    def plot_bar_pdf(self, n_spaces: int = 50, output: 'str or object or None' = None,
+                     format: 'str or None' = None) -> 'list[float], list[float]':
 
         """
             Function to plot the normalied histogram of the data and the probability
-            density function.
+            density function. The pmf is drawn over the successes within PLOT_TAIL_STDEVS
+            standard deviations of the mean, which is the whole support for small n.
 
             Args:
                 n_spaces (int): number of data points to plot
+                output (str or file-like or None): file name or binary file-like object to render
+                the figure to without a display; None shows it.
+                format (str or None): image format when rendering, e.g. 'png' or 'svg'.
             
             Returns:
                 list[float]: x values for pdf plot
@@ -153,11 +583,13 @@ class Binomial(General_Distribution.Distribution):
         """
         
         # Calcuate the x values for ploting
-        _x = [x for x in range(self.n + 1)]
-        _y = [self.pdf(x) for x in _x]
+        _mean = self.n * self.prob
+        _spread = PLOT_TAIL_STDEVS * math.sqrt(self.n * self.prob * (1 - self.prob))
+        _x = np.arange(max(0, math.floor(_mean - _spread)), min(self.n, math.ceil(_mean + _spread)) + 1)
+        _y = self.pmf(_x)
 
         # Create the plots
-        fig, axes = plt.subplots(ncols=1, nrows=2)
+        fig, axes = Plotting.new_figure(output, nrows=2)
         fig.subplots_adjust(hspace=.5)
         axes[0].bar(x=['0','1'], height = [((1 - self.prob) * self.n)/self.n, (self.prob * self.n)/self.n])
         axes[0].set_title('Normalized Bar Chart of Outcomes')
@@ -166,34 +598,25 @@ class Binomial(General_Distribution.Distribution):
         axes[1].plot(_x, _y)
         axes[1].set_title('Distribution of Outcomes')
         axes[1].set_ylabel('Count')
-        plt.show()
+        Plotting.finish_figure(fig, output, format)
 
-        return _x, _y
+        return _x.tolist(), _y.tolist()
 
     def __add__(self, other: type) -> type:
         """
-            Function to add together two Binomial distributions.
+            Function to add together two Binomial distributions. When the probabilities
+            differ the sum follows a Poisson-binomial distribution.
 
             Args:
-                other (Binomial): A instance of the Binomial class.
+                other (Binomial or PoissonBinomial): A instance of the Binomial or PoissonBinomial class.
             
             Returns:
-                type (Binomial): Combination of the two Binomial distributions as a Binomial instance.
+                type (Binomial or PoissonBinomial): Combination of the two distributions as a Binomial
+                instance when the probabilities are equal, otherwise as a PoissonBinomial instance.
         
         """
-        
-        try:
-            assert self.prob == other.prob, 'probabilities are not equal'
-        except AssertionError as error:
-            raise
-
-        result = Binomial()
-        result.n = self.n + other.n
-        result.prob = self.prob
-        result.calculate_mean()
-        result.calculate_stdev()
 
-        return result
+        return sum_many([self, other])
 
     def __repr__(self):
         """
@@ -208,3 +631,29 @@ class Binomial(General_Distribution.Distribution):
         """
 
         return f'Mean: {self.mean}, Standard Deviation: {self.stdev}, Probability: {self.prob:.0%}, N: {self.n}' 
+
+def sum_many(distributions: 'list[Binomial]') -> 'Binomial or PoissonBinomial':
+    """
+        Function to add together many independent Binomial distributions.
+
+        Args:
+            distributions (list[Binomial or PoissonBinomial]): the distributions to add.
+
+        Returns:
+            Binomial or PoissonBinomial: Combination of the distributions as a Binomial instance when
+            all probabilities are equal, otherwise as a PoissonBinomial instance.
+
+    """
+
+    # Imported here as Poisson_Binomial_Distribution builds on this module
+    from Poisson_Binomial_Distribution import PoissonBinomial
+
+    distributions = list(distributions)
+    if len(distributions) == 0:
+        raise ValueError("sum_many needs at least one distribution")
+
+    if all(type(distribution) is Binomial for distribution in distributions) and\
+        len({distribution.prob for distribution in distributions}) == 1:
+        return Binomial(distributions[0].prob, sum(distribution.n for distribution in distributions))
+
+    return PoissonBinomial.from_distributions(distributions)
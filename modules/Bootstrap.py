@@ -0,0 +1,145 @@
+# %%
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+
+# Statistics the bootstrap can estimate, computed along the rows of a block of resamples
+STATISTICS = ('mean', 'stdev')
+
+# Number of replicates drawn from each independent random stream
+CHUNK_SIZE = 1000
+
+# Upper bound on the number of resampled values held in memory at a time per worker
+MAX_BLOCK_ELEMENTS = 2 ** 22
+
+# Data set of a worker process, received once from the pool initializer
+_worker_data = None
+
+def _initialize_worker(data: 'np.ndarray') -> None:
+    """
+        Function to keep the data set in a worker process, so the chunks sent to it only
+        carry their sizes and seeds.
+
+        Args:
+            data (np.ndarray): the original data set.
+
+        Returns:
+            None
+
+    """
+
+    global _worker_data
+    _worker_data = data
+
+def _resample_worker_chunk(statistic: str, n_replicates: int, seed: 'np.random.SeedSequence',
+                           sample: bool) -> 'np.ndarray':
+    """
+        Function to compute a chunk of replicates in a worker process from its data set, see _resample_chunk.
+    """
+
+    return _resample_chunk(_worker_data, statistic, n_replicates, seed, sample)
+
+def _resample_chunk(data: 'np.ndarray', statistic: str, n_replicates: int, seed: 'np.random.SeedSequence',
+                    sample: bool) -> 'np.ndarray':
+    """
+        Function to compute the statistic of a chunk of bootstrap resamples, drawn in
+        blocks of at most MAX_BLOCK_ELEMENTS values.
+
+        Args:
+            data (np.ndarray): the original data set.
+            statistic (str): 'mean' or 'stdev'.
+            n_replicates (int): number of resamples in the chunk.
+            seed (np.random.SeedSequence): seed of the chunk's random stream.
+            sample (bool): flag whether the standard deviation is the sample or population one.
+
+        Returns:
+            np.ndarray: the statistic of each resample
+
+    """
+
+    _rng = np.random.default_rng(seed)
+    _n = len(data)
+    _block_rows = max(1, MAX_BLOCK_ELEMENTS // _n)
+
+    _replicates = np.empty(n_replicates)
+    for start in range(0, n_replicates, _block_rows):
+        _rows = min(_block_rows, n_replicates - start)
+        _resamples = data[_rng.integers(0, _n, size=(_rows, _n))]
+        if statistic == 'mean':
+            _replicates[start:start + _rows] = np.mean(_resamples, axis=1)
+        else:
+            _replicates[start:start + _rows] = np.std(_resamples, axis=1, ddof=1 if sample else 0)
+
+    return _replicates
+
+def bootstrap_replicates(data: 'np.ndarray', statistic: str = 'mean', n_resamples: int = 10000,
+                         seed: 'int or None' = None, workers: int = 1, sample: bool = True) -> 'np.ndarray':
+    """
+        Function to compute the statistic of bootstrap resamples of a data set. The replicates are
+        split into chunks of CHUNK_SIZE, each with its own stream spawned from the seed, so the
+        result for a given seed does not depend on the number of workers.
+
+        Args:
+            data (np.ndarray): the data set.
+            statistic (str): 'mean' or 'stdev'.
+            n_resamples (int): number of bootstrap resamples.
+            seed (int or None): seed of the random streams; None draws fresh entropy.
+            workers (int): number of worker processes; 1 computes in the calling process.
+            Each worker receives the data set once.
+            sample (bool): flag whether the standard deviation is the sample or population one.
+
+        Returns:
+            np.ndarray: the statistic of each resample
+
+    """
+
+    if statistic not in STATISTICS:
+        raise ValueError(f"statistic must be one of {STATISTICS}, got {statistic!r}")
+    if n_resamples <= 0:
+        raise ValueError(f"n_resamples must be positive, got {n_resamples}")
+    if data is None:
+        raise ValueError("There is no data set to bootstrap")
+
+    data = np.asarray(data, dtype=float).ravel()
+    if len(data) == 0:
+        raise ValueError("Cannot bootstrap an empty data set")
+    if not np.all(np.isfinite(data)):
+        raise ValueError("Cannot bootstrap a data set with nan or infinite values")
+
+    _sizes = [min(CHUNK_SIZE, n_resamples - start) for start in range(0, n_resamples, CHUNK_SIZE)]
+    _seeds = np.random.SeedSequence(seed).spawn(len(_sizes))
+    _arguments = ([statistic] * len(_sizes), _sizes, _seeds, [sample] * len(_sizes))
+
+    if workers == 1:
+        _chunks = list(map(_resample_chunk, [data] * len(_sizes), *_arguments))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_initialize_worker, initargs=(data,)) as executor:
+            _chunks = list(executor.map(_resample_worker_chunk, *_arguments))
+
+    return np.concatenate(_chunks)
+
+def bootstrap_interval(data: 'np.ndarray', statistic: str = 'mean', confidence: float = 0.90,
+                       n_resamples: int = 10000, seed: 'int or None' = None, workers: int = 1,
+                       sample: bool = True) -> 'float, float':
+    """
+        Function to estimate a percentile bootstrap confidence interval for the mean
+        or standard deviation of a data set.
+
+        Args:
+            data (np.ndarray): the data set.
+            statistic (str): 'mean' or 'stdev'.
+            confidence (float): share of the bootstrap distribution inside the interval.
+            n_resamples (int): number of bootstrap resamples.
+            seed (int or None): seed of the random streams; None draws fresh entropy.
+            workers (int): number of worker processes; 1 computes in the calling process.
+            sample (bool): flag whether the standard deviation is the sample or population one.
+
+        Returns:
+            float: lower end of the interval
+            float: upper end of the interval
+
+    """
+
+    _replicates = bootstrap_replicates(data, statistic, n_resamples, seed, workers, sample)
+    _lower, _upper = np.quantile(_replicates, [(1 - confidence) / 2, (1 + confidence) / 2])
+
+    return float(_lower), float(_upper)
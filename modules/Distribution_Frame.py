@@ -0,0 +1,205 @@
+# %%
+import numpy as np
+from Running_Moments import RunningMoments
+from Gaussian_Distribution import Gaussian
+from Binomial_Distribution import Binomial
+
+class DistributionFrame():
+
+    __slots__ = ('kind', 'sample', 'prob', 'moments', 'n', 'mean', 'stdev', '_distribution')
+
+    def __init__(self, data: 'np.ndarray', offsets: 'np.ndarray or None' = None, kind: str = 'gaussian',
+                 sample: bool = True, axis: int = 1) -> None:
+
+        """
+            Class to fit one Gaussian or Binomial distribution per series of a columnar data set
+            in a single vectorized pass, without building an object per series.
+
+            Args:
+                data (np.ndarray): 2-D array with one series per row (see axis), or the
+                concatenated values of all series when offsets is given.
+                offsets (np.ndarray or None): start of each series in data followed by len(data),
+                so series i is data[offsets[i]:offsets[i + 1]].
+                kind (str): 'gaussian' or 'binomial'.
+                sample (bool): flag whether the data represents the sample or population.
+                axis (int): axis of the 2-D array that runs along each series.
+
+            Attributes:
+                kind (str): type of the fitted distributions
+                n (np.ndarray): number of observations in each series
+                mean (np.ndarray): mean of each fitted distribution
+                stdev (np.ndarray): standard deviation of each fitted distribution
+                prob (np.ndarray or None): probability of the positive class in each series (binomial only)
+
+        """
+
+        if kind not in ('gaussian', 'binomial'):
+            raise ValueError(f"kind must be 'gaussian' or 'binomial', got {kind!r}")
+
+        self.kind = kind
+        self.sample = sample
+        self.prob = None
+
+        if offsets is None:
+            _count, _mean, _m2 = self._row_moments(data, axis)
+        else:
+            _count, _mean, _m2 = self._ragged_moments(data, offsets)
+
+        # The same formulas as Gaussian.calculate_stdev and Binomial.analyze_data_set, applied per series
+        if kind == 'gaussian':
+            self.moments = RunningMoments(_count, _mean, _m2)
+            self.n = _count
+            self._distribution = Gaussian.from_parameters(_mean[:, None], self.moments.stdev(sample)[:, None])
+        else:
+            self.prob = _mean
+            self._distribution = Binomial(_mean[:, None], _count[:, None])
+            self.n = _count
+
+        self.mean = self._distribution.mean[:, 0]
+        self.stdev = self._distribution.stdev[:, 0]
+
+    @staticmethod
+    def _row_moments(data: 'np.ndarray', axis: int) -> 'np.ndarray, np.ndarray, np.ndarray':
+        """
+            Method to calculate the count, mean and M2 of every series of a 2-D array.
+
+            Args:
+                data (np.ndarray): 2-D array of series.
+                axis (int): axis of the array that runs along each series.
+
+            Returns:
+                np.ndarray: number of observations of each series
+                np.ndarray: mean of each series
+                np.ndarray: sum of squared deviations from the mean of each series
+
+        """
+
+        data = np.asarray(data, dtype=float)
+        if data.ndim != 2:
+            raise ValueError(f"data must be a 2-D array when no offsets are given, got {data.ndim} dimensions")
+        if axis == 0:
+            data = data.T
+
+        _count = np.full(data.shape[0], data.shape[1], dtype=np.int64)
+        _mean = np.mean(data, axis=1)
+        _m2 = np.sum((data - _mean[:, None]) ** 2, axis=1)
+
+        return _count, _mean, _m2
+
+    @staticmethod
+    def _ragged_moments(data: 'np.ndarray', offsets: 'np.ndarray') -> 'np.ndarray, np.ndarray, np.ndarray':
+        """
+            Method to calculate the count, mean and M2 of every series of a ragged array.
+
+            Args:
+                data (np.ndarray): concatenated values of all series.
+                offsets (np.ndarray): start of each series followed by len(data).
+
+            Returns:
+                np.ndarray: number of observations of each series
+                np.ndarray: mean of each series, nan for empty series
+                np.ndarray: sum of squared deviations from the mean of each series, nan for empty series
+
+        """
+
+        data = np.asarray(data, dtype=float).ravel()
+        offsets = np.asarray(offsets, dtype=np.int64)
+        if offsets[0] != 0 or offsets[-1] != len(data) or np.any(np.diff(offsets) < 0):
+            raise ValueError("offsets must increase from 0 to len(data)")
+
+        _count = np.diff(offsets)
+        _starts = offsets[:-1]
+        _filled = _count > 0
+
+        # reduceat returns data[start] for empty segments, so only filled segments are reduced
+        _sum = np.zeros(len(_count))
+        _sum[_filled] = np.add.reduceat(data, _starts[_filled]) if len(data) else 0.0
+        with np.errstate(invalid='ignore', divide='ignore'):
+            _mean = _sum / _count
+
+        _m2 = np.full(len(_count), np.nan)
+        _deviations = (data - np.repeat(_mean, _count)) ** 2
+        _m2[_filled] = np.add.reduceat(_deviations, _starts[_filled]) if len(data) else 0.0
+
+        return _count, _mean, _m2
+
+    def pdf(self, x: 'float or np.ndarray') -> 'np.ndarray':
+        """
+            Probability density (Gaussian) or mass (Binomial) function of every series.
+
+            Args:
+                x (float or np.ndarray): points shared by all series with shape (m,),
+                or one row of points per series with shape (K, m).
+
+            Returns:
+                np.ndarray: output with one row per series
+
+        """
+
+        if self.kind == 'gaussian':
+            return self._distribution.pdf(x)
+
+        return self._distribution.pmf(x)
+
+    def cdf(self, x: 'float or np.ndarray') -> 'np.ndarray':
+        """
+            Cumulative distribution function of every series.
+
+            Args:
+                x (float or np.ndarray): points shared by all series with shape (m,),
+                or one row of points per series with shape (K, m).
+
+            Returns:
+                np.ndarray: output with one row per series
+
+        """
+
+        if self.kind == 'gaussian':
+            return self._distribution.cdf(x)
+
+        # scipy.special is only needed once a probability is requested; import it on first use
+        from scipy.special import bdtr
+
+        k = np.floor(np.asarray(x, dtype=float))
+        _n, _prob = self._distribution.n, self._distribution.prob
+
+        return np.where(k < 0, 0.0, bdtr(np.clip(k, 0, _n), _n, _prob))
+
+    def __len__(self) -> int:
+        """
+            Function to return the number of series.
+        """
+
+        return len(self.n)
+
+    def __getitem__(self, index: int) -> 'Gaussian or Binomial':
+        """
+            Function to return the fitted distribution of one series as a Gaussian or Binomial instance.
+
+            Args:
+                index (int): position of the series.
+
+            Returns:
+                Gaussian or Binomial: parameter-only distribution of the series
+
+        """
+
+        if self.kind == 'gaussian':
+            return Gaussian.from_moments(RunningMoments(int(self.n[index]), float(self.moments.mean[index]),
+                                                        float(self.moments.m2[index])), self.sample)
+
+        return Binomial(float(self.prob[index]), int(self.n[index]))
+
+    def __repr__(self):
+        """
+            Function to return the characteristics of the DistributionFrame instance.
+
+            Args:
+                None
+
+            Returns:
+                str: characteristics of the DistributionFrame instance.
+
+        """
+
+        return f'Kind: {self.kind}, Series: {len(self)}, Observations: {int(np.sum(self.n))}'
@@ -1,22 +1,30 @@
 # %%
 import os
 import math
-from scipy.stats import t, norm, normaltest
 import numpy as np
-import matplotlib.pyplot as plt
 import General_Distribution as General_Distribution
+from Running_Moments import RunningMoments, rolling_moments
+from Quantile_Sketch import QuantileSketch
+import Plotting as Plotting
+import Sampling as Sampling
 
 class Gaussian(General_Distribution.Distribution):
 
-    def __init__(self, mean: float = 0, stdev: float = 0, n: int or None = 25, file_name: str or None = None) -> None:
+    __slots__ = ('n', '_sample_size')
+
+    # Number of fitted parameters, for information criteria
+    n_parameters = 2
+
+    def __init__(self, mean: float = 0, stdev: float = 0, n: int or None = 25, file_name: str or None = None,
+                 dtype: str = 'float64') -> None:
         
         if file_name:
-            self.data = self.read_data_file(file_name)
+            self.data = self.read_data_file(file_name, dtype)
             self.analyze_data_set()
             General_Distribution.Distribution.__init__(self, self.calculate_mean(sample=True), self.calculate_stdev(sample=True))
         else:
             General_Distribution.Distribution.__init__(self, mean, stdev)
-            self.data = np.random.normal(mean, stdev, size=n)
+            self.data = self.sample(n, dtype=dtype)
             self.analyze_data_set()
 
         """ 
@@ -25,11 +33,218 @@ class Gaussian(General_Distribution.Distribution):
             Attributes:
                 mean (float) calculates the mean value of the distribution
                 stdev (float) calculates the standard deviation of the distribution
-                data (list[float]) a list of floats extracted from the data file
+                data (np.ndarray) float64 or float32 array of the values extracted from the data file, chosen with dtype
                 n (int) number of observations in the data set
 
         """
 
+    @classmethod
+    def from_parameters(cls, mean: float = 0, stdev: float = 0, n: int = 25) -> 'Gaussian':
+        """
+            Method to build a Gaussian from its parameters without sampling any data.
+            n observations are drawn from the distribution only when the data is requested.
+
+            Args:
+                mean (float): mean of the distribution.
+                stdev (float): standard deviation of the distribution.
+                n (int): number of observations to sample when the data is requested.
+
+            Returns:
+                Gaussian: distribution with the given parameters
+
+        """
+
+        result = cls.__new__(cls)
+        General_Distribution.Distribution.__init__(result, mean, stdev)
+        result._sample_size = n
+        result.n = n
+
+        return result
+
+    @property
+    def data(self) -> 'np.ndarray':
+        """
+            The loaded data set. A Gaussian built from its parameters samples
+            its data on first access.
+        """
+
+        if self._data is None and self._sample_size is not None:
+            self.data = self.sample(self._sample_size)
+
+        return self._data
+
+    @data.setter
+    def data(self, data: 'np.ndarray') -> None:
+        General_Distribution.Distribution.data.fset(self, data)
+        self._sample_size = None
+
+    @classmethod
+    def from_moments(cls, moments: RunningMoments, sample: bool = True) -> 'Gaussian':
+        """
+            Method to build a Gaussian from a streaming moment accumulator
+            without holding the raw data.
+
+            Args:
+                moments (RunningMoments): accumulated count, mean and M2 of the data.
+                sample (bool): flag whether the data represents the sample 
+                or population.
+
+            Returns:
+                Gaussian: distribution with the accumulated parameters. Its data attribute is None.
+
+        """
+
+        result = cls.__new__(cls)
+        General_Distribution.Distribution.__init__(result, moments.mean, moments.stdev(sample))
+        result.data = None
+        result._cache['moments'] = RunningMoments() + moments
+        result.n = moments.count
+
+        return result
+
+    @classmethod
+    def from_sketch(cls, sketch: QuantileSketch, sample: bool = True) -> 'Gaussian':
+        """
+            Method to build a Gaussian from a streaming quantile sketch without holding
+            the raw data. Quantiles and the plot methods are answered from the sketch.
+
+            Args:
+                sketch (QuantileSketch): sketch of the data.
+                sample (bool): flag whether the data represents the sample 
+                or population.
+
+            Returns:
+                Gaussian: distribution with the sketched parameters. Its data attribute is None.
+
+        """
+
+        result = cls.from_moments(sketch.moments, sample)
+        result._cache['sketch'] = sketch.copy()
+
+        return result
+
+    def moments(self) -> RunningMoments:
+        """
+            Method to summarize the loaded data set as a streaming moment accumulator,
+            which can be updated or merged with the moments of other shards.
+
+            Args:
+                None
+
+            Returns:
+                RunningMoments: count, mean and M2 of the data set
+
+        """
+
+        return RunningMoments() + self._data_moments()
+
+    def _data_moments(self) -> RunningMoments:
+        """
+            Method to return the cached sufficient statistics of the data set.
+
+            Args:
+                None
+
+            Returns:
+                RunningMoments: count, mean and M2 of the data set
+
+        """
+
+        if self.data is None and 'moments' not in self._cache:
+            raise ValueError("There is no data set to analyze")
+
+        _moments = self._cached('moments', lambda: RunningMoments().update_batch(self.data))
+        if _moments.count == 0:
+            raise ValueError("Cannot analyze an empty data set")
+
+        return _moments
+
+    def sketch(self) -> QuantileSketch:
+        """
+            Method to summarize the data set as a streaming quantile sketch, which can be
+            updated or merged with the sketches of other shards. The cached sketch is
+            kept up to date by append_data.
+
+            Args:
+                None
+
+            Returns:
+                QuantileSketch: sketch of the data set
+
+        """
+
+        if self.data is None and 'sketch' not in self._cache:
+            raise ValueError("There is no data set to sketch")
+
+        return self._cached('sketch', lambda: QuantileSketch().update_batch(self.data)).copy()
+
+    def quantile(self, q: 'float or np.ndarray') -> 'float or np.ndarray':
+        """
+            Method to calculate quantiles of the data set, exactly when the data is
+            loaded and approximately from the sketch otherwise.
+
+            Args:
+                q (float or np.ndarray): probability or probabilities between 0 and 1.
+
+            Returns:
+                float or np.ndarray: the quantile(s) of the data
+
+        """
+
+        if self.data is None:
+            if 'sketch' not in self._cache:
+                raise ValueError("There is no data set or sketch to take quantiles of")
+            return self._cache['sketch'].quantile(q)
+
+        return np.quantile(self.data, q)
+
+    def _data_range(self) -> 'float, float':
+        """
+            Method to calculate the smallest and largest value of the data set.
+        """
+
+        if 'sketch' in self._cache:
+            return self._cache['sketch'].min, self._cache['sketch'].max
+        if self.data is None:
+            raise ValueError("There is no data set or sketch to plot")
+
+        return float(np.min(self.data)), float(np.max(self.data))
+
+    def _histogram(self, bins: int, value_range: 'tuple[float, float]', density: bool = False) -> 'np.ndarray, np.ndarray':
+        """
+            Method to bin the data set for plotting, from the sketch when the data is not held.
+        """
+
+        if self.data is None:
+            if 'sketch' not in self._cache:
+                raise ValueError("There is no data set or sketch to plot")
+            return self._cache['sketch'].bins(bins, value_range, density)
+
+        return Plotting.histogram(self.data, bins, value_range, density)
+
+    def append_data(self, values: 'np.ndarray') -> 'np.ndarray':
+        """
+            Method to append values to the data set. The cached moments and
+            sketch are updated with the new values instead of being recomputed.
+
+            Args:
+                values (np.ndarray): the values to append.
+
+            Returns:
+                np.ndarray: the extended data set
+
+        """
+
+        moments = self._cache.get('moments')
+        sketch = self._cache.get('sketch')
+        General_Distribution.Distribution.append_data(self, values)
+        if moments is not None:
+            self._cache['moments'] = moments + RunningMoments().update_batch(values)
+        if sketch is not None:
+            self._cache['sketch'] = sketch.copy().update_batch(values)
+
+        return self.data
+
     def analyze_data_set(self, sample: bool = True) -> 'float, float, int':
         """ 
             Method to populate the variables of the Gaussian class based on the loaded data set
@@ -44,7 +259,7 @@ class Gaussian(General_Distribution.Distribution):
                 int: the number of observations in the dataset
 
         """
-        self.n = len(self.data)
+        self.n = self._data_moments().count
         self.stdev = self.calculate_stdev(sample)
         self.mean = self.calculate_mean(sample)
 
@@ -65,14 +280,17 @@ class Gaussian(General_Distribution.Distribution):
         """
 
         if sample:
-            _mean = sum(self.data)/len(self.data) * 1.0
+            _mean = self._data_moments().mean
         else:
+            # scipy.stats is only needed for the interval estimate; import it on first use
+            from scipy.stats import t, normaltest
+
             statistic, p_value = normaltest(self.data, nan_policy='omit')
             test_statistic = 1e-3
             if (p_value < test_statistic or self.n < 30) and self.n >= 20:
-                _mean = t.interval(alpha=0.90, df=(self.n - 1), loc=self.mean, scale=self.stdev)
+                _mean = t.interval(0.90, df=(self.n - 1), loc=self.mean, scale=self.stdev)
             elif (p_value < test_statistic or self.n > 30) and self.n >= 20:
-                _mean = norm.interval(alpha=0.90, loc=self.mean, scale=self.stdev)
+                _mean = self.interval(0.90)
             else:
                 raise ValueError(f"Could not estimate the parameters of this data set. N ({self.n}) must be >= 20")
         return _mean
@@ -90,53 +308,306 @@ class Gaussian(General_Distribution.Distribution):
 
         """
 
-        if sample:
-            _n = self.n - 1            
-        else:
-            _n = self.n
-
-        _mean = sum(self.data)/len(self.data) * 1.0
-        
-        _stdev = math.sqrt(sum([(x - _mean) ** 2 for x in self.data]) / _n)
+        _stdev = self._data_moments().stdev(sample)
      
         return _stdev      
     
-    def plot_histogram(self) -> None:
+    def rolling_moments(self, window: int, sample: bool = True) -> 'np.ndarray, np.ndarray':
+
+        """ 
+            Method to calculate the mean and standard deviation over every sliding window of the data set.
+
+            Args:
+                window (int): number of observations in each window.
+                sample (bool): flag whether the data represents the sample or population.
+        
+            Returns:
+                np.ndarray: mean of each full window
+                np.ndarray: standard deviation of each full window
+
+        """
+
+        return rolling_moments(self.data, window, sample)
+
+    def bootstrap_interval(self, statistic: str = 'mean', confidence: float = 0.90, n_resamples: int = 10000,
+                           seed: 'int or None' = None, workers: int = 1, sample: bool = True) -> 'float, float':
+
+        """ 
+            Method to estimate a percentile bootstrap confidence interval for the mean or standard
+            deviation of the data set. Unlike calculate_mean(sample=False) it makes no normality
+            assumption and works for small data sets.
+
+            Args:
+                statistic (str): 'mean' or 'stdev'.
+                confidence (float): share of the bootstrap distribution inside the interval.
+                n_resamples (int): number of bootstrap resamples.
+                seed (int or None): seed of the random streams; results are reproducible for a given seed.
+                workers (int): number of worker processes sharing the resamples.
+                sample (bool): flag whether the standard deviation is the sample or population one.
+        
+            Returns:
+                float: lower end of the interval
+                float: upper end of the interval
+
+        """
+
+        # Bootstrap pulls in the multiprocessing machinery; import it on first use
+        import Bootstrap as Bootstrap
+
+        return Bootstrap.bootstrap_interval(self.data, statistic, confidence, n_resamples, seed, workers, sample)
+
+    def sample(self, size: 'int or tuple or None' = None, rng: 'int or np.random.Generator or None' = None,
+               out: 'np.ndarray or None' = None, threads: int = 1, dtype: str = 'float64') -> 'np.ndarray or float':
+        """
+            Method to draw random values from the distribution with NumPy generators.
+            The draws are made in blocks, each from its own stream spawned from rng, so
+            a given seed gives the same values for any number of threads.
+
+            Args:
+                size (int or tuple or None): shape of the sample; None draws a single value
+                unless out is given.
+                rng (int or np.random.Generator or None): seed or generator of the streams;
+                None draws fresh entropy.
+                out (np.ndarray or None): preallocated float32 or float64 buffer to fill in place.
+                threads (int): number of threads generating blocks at the same time.
+                dtype (str): 'float64' or 'float32', the dtype of an allocated sample.
+
+            Returns:
+                np.ndarray or float: the sample, out when it was given
+
+        """
+
+        if size is None and out is None:
+            return float(self.sample(1, rng)[0])
+
+        _mean, _stdev = self.mean, self.stdev
+
+        def draw(generator: 'np.random.Generator', block: 'np.ndarray') -> None:
+            generator.standard_normal(out=block, dtype=block.dtype)
+            block *= _stdev
+            block += _mean
+
+        return Sampling.fill(Sampling.output_buffer(size, out, dtype), draw, rng, threads)
+
+    def plot_histogram(self, bins: int = 10, output: 'str or object or None' = None,
+                       format: 'str or None' = None) -> None:
         """
             Function to plot a histogram of the instance variable 
-            using the matplotlib pyplot library.
+            using the matplotlib pyplot library. The data is binned in one
+            NumPy pass and only the bin counts are drawn.
 
             Args:
-                None
+                bins (int): number of histogram bins.
+                output (str or file-like or None): file name or binary file-like object to render
+                the figure to without a display; None shows it.
+                format (str or None): image format when rendering, e.g. 'png' or 'svg'.
             
             Returns:
                 None
            
         """
-        plt.hist(self.data)
-        plt.title("Histogram")
-        plt.xlabel('data')
-        plt.ylabel('count')
-        plt.show()
+
+        _counts, _edges = self._histogram(bins, self._cached('range', self._data_range))
+
+        fig, axes = Plotting.new_figure(output)
+        axes.stairs(_counts, _edges, fill=True)
+        axes.set_title("Histogram")
+        axes.set_xlabel('data')
+        axes.set_ylabel('count')
+        Plotting.finish_figure(fig, output, format)
     
-    def pdf(self, x: float) -> float:
+    def _parameters(self, mean: 'float or np.ndarray or None', stdev: 'float or np.ndarray or None') -> 'np.ndarray, np.ndarray':
+        """
+            Method to resolve the parameters used by the probability functions.
+
+            Args:
+                mean (float or np.ndarray or None): mean(s) to use; None uses the fitted mean.
+                stdev (float or np.ndarray or None): standard deviation(s) to use; None uses the fitted one.
+
+            Returns:
+                np.ndarray: mean(s)
+                np.ndarray: standard deviation(s)
+
+        """
+
+        if mean is None:
+            mean = self.mean
+        if stdev is None:
+            stdev = self.stdev
+
+        return np.asarray(mean, dtype=float), np.asarray(stdev, dtype=float)
+
+    def pdf(self, x: 'float or np.ndarray', mean: 'float or np.ndarray or None' = None,
+            stdev: 'float or np.ndarray or None' = None) -> 'float or np.ndarray':
         """
             Probability density function calculator for the gaussian distribution.
+            Uses the fitted mean and standard deviation without refitting the data set.
 
             Args:
-                x (float): point for calculating the probability density function.
+                x (float or np.ndarray): point(s) for calculating the probability density function.
+                mean (float or np.ndarray or None): mean(s) broadcast against x; None uses the fitted mean.
+                stdev (float or np.ndarray or None): standard deviation(s) broadcast against x;
+                None uses the fitted standard deviation.
             
             Returns:
-                float: probability density function output
+                float or np.ndarray: probability density function output, with the broadcast shape
         
         """
 
-        # Convert back to the sample parameters
-        self.analyze_data_set(True)
+        x = np.asarray(x, dtype=float)
+        mean, stdev = self._parameters(mean, stdev)
+
+        return (1.0 / (stdev * math.sqrt(2*math.pi))) * np.exp(-0.5*((x - mean) / stdev) ** 2)
+
+    def logpdf(self, x: 'float or np.ndarray', mean: 'float or np.ndarray or None' = None,
+               stdev: 'float or np.ndarray or None' = None) -> 'float or np.ndarray':
+        """
+            Natural logarithm of the probability density function for the gaussian distribution.
+            Stays finite far out in the tails where pdf underflows to zero.
+
+            Args:
+                x (float or np.ndarray): point(s) for calculating the log probability density function.
+                mean (float or np.ndarray or None): mean(s) broadcast against x; None uses the fitted mean.
+                stdev (float or np.ndarray or None): standard deviation(s) broadcast against x;
+                None uses the fitted standard deviation.
+            
+            Returns:
+                float or np.ndarray: log probability density function output, with the broadcast shape
+        
+        """
+
+        x = np.asarray(x, dtype=float)
+        mean, stdev = self._parameters(mean, stdev)
 
-        return (1.0 / (self.stdev * math.sqrt(2*math.pi))) * math.exp(-0.5*((x - self.mean) / self.stdev) ** 2)
+        return -0.5*((x - mean) / stdev) ** 2 - np.log(stdev * math.sqrt(2*math.pi))
+
+    def loglik(self, data: 'np.ndarray') -> float:
+        """
+            Log-likelihood of a data set under the fitted parameters, without refitting.
+
+            Args:
+                data (np.ndarray): the observations to score.
+            
+            Returns:
+                float: sum of the log probability densities of the observations
+        
+        """
+
+        return float(np.sum(self.logpdf(np.asarray(data, dtype=float).ravel())))
+
+    @classmethod
+    def _log_likelihoods(cls, candidates: 'list[Gaussian]', data: 'np.ndarray') -> 'np.ndarray':
+        """
+            Method to score one block of observations against many Gaussians in a single broadcast pass.
+
+            Args:
+                candidates (list[Gaussian]): the distributions to score against.
+                data (np.ndarray): the observations.
+
+            Returns:
+                np.ndarray: log probability densities, one row per candidate
+
+        """
+
+        _mean = np.array([candidate.mean for candidate in candidates], dtype=float)[:, None]
+        _stdev = np.array([candidate.stdev for candidate in candidates], dtype=float)[:, None]
+
+        return candidates[0].logpdf(data[None, :], _mean, _stdev)
+
+    def cdf(self, x: 'float or np.ndarray', mean: 'float or np.ndarray or None' = None,
+            stdev: 'float or np.ndarray or None' = None) -> 'float or np.ndarray':
+        """
+            Cumulative distribution function P(X <= x) for the gaussian distribution.
+
+            Args:
+                x (float or np.ndarray): point(s) for calculating the cumulative probability.
+                mean (float or np.ndarray or None): mean(s) broadcast against x; None uses the fitted mean.
+                stdev (float or np.ndarray or None): standard deviation(s) broadcast against x;
+                None uses the fitted standard deviation.
+            
+            Returns:
+                float or np.ndarray: cumulative probability, with the broadcast shape
+        
+        """
+
+        # scipy.special is only needed once a probability is requested; import it on first use
+        from scipy.special import ndtr
+
+        mean, stdev = self._parameters(mean, stdev)
+
+        return ndtr((np.asarray(x, dtype=float) - mean) / stdev)
+
+    def sf(self, x: 'float or np.ndarray', mean: 'float or np.ndarray or None' = None,
+           stdev: 'float or np.ndarray or None' = None) -> 'float or np.ndarray':
+        """
+            Survival function P(X > x) for the gaussian distribution. Evaluated on the
+            mirrored upper tail so small exceedance probabilities stay accurate.
+
+            Args:
+                x (float or np.ndarray): point(s) for calculating the exceedance probability.
+                mean (float or np.ndarray or None): mean(s) broadcast against x; None uses the fitted mean.
+                stdev (float or np.ndarray or None): standard deviation(s) broadcast against x;
+                None uses the fitted standard deviation.
+            
+            Returns:
+                float or np.ndarray: exceedance probability, with the broadcast shape
+        
+        """
+
+        from scipy.special import ndtr
+
+        mean, stdev = self._parameters(mean, stdev)
+
+        return ndtr((mean - np.asarray(x, dtype=float)) / stdev)
+
+    def ppf(self, q: 'float or np.ndarray', mean: 'float or np.ndarray or None' = None,
+            stdev: 'float or np.ndarray or None' = None) -> 'float or np.ndarray':
+        """
+            Percent point function (inverse of cdf) for the gaussian distribution.
+
+            Args:
+                q (float or np.ndarray): probability or probabilities between 0 and 1.
+                mean (float or np.ndarray or None): mean(s) broadcast against q; None uses the fitted mean.
+                stdev (float or np.ndarray or None): standard deviation(s) broadcast against q;
+                None uses the fitted standard deviation.
+            
+            Returns:
+                float or np.ndarray: quantile(s), with the broadcast shape; nan where q is outside 0..1
+        
+        """
+
+        from scipy.special import ndtri
+
+        mean, stdev = self._parameters(mean, stdev)
+
+        return mean + stdev * ndtri(np.asarray(q, dtype=float))
+
+    def interval(self, confidence: 'float or np.ndarray', mean: 'float or np.ndarray or None' = None,
+                 stdev: 'float or np.ndarray or None' = None) -> 'np.ndarray, np.ndarray':
+        """
+            Central interval holding the given share of the gaussian distribution.
+
+            Args:
+                confidence (float or np.ndarray): share(s) of the distribution inside the interval.
+                mean (float or np.ndarray or None): mean(s) broadcast against confidence; None uses the fitted mean.
+                stdev (float or np.ndarray or None): standard deviation(s) broadcast against confidence;
+                None uses the fitted standard deviation.
+            
+            Returns:
+                float or np.ndarray: lower end(s) of the interval
+                float or np.ndarray: upper end(s) of the interval
+        
+        """
+
+        from scipy.special import ndtri
+
+        mean, stdev = self._parameters(mean, stdev)
+        _half_width = stdev * ndtri(0.5 + np.asarray(confidence, dtype=float) / 2)
+
+        return mean - _half_width, mean + _half_width
     
-    def plot_histogram_pdf(self, n_spaces: int = 50) -> "list[float], list[float]":
+    def plot_histogram_pdf(self, n_spaces: int = 50, bins: int = 10, output: 'str or object or None' = None,
+                           format: 'str or None' = None) -> "list[float], list[float]":
 
         """
             Function to plot the normalied histogram of the data and the probability
@@ -144,6 +615,10 @@ class Gaussian(General_Distribution.Distribution):
 
             Args:
                 n_spaces (int): number of data points to plot
+                bins (int): number of histogram bins.
+                output (str or file-like or None): file name or binary file-like object to render
+                the figure to without a display; None shows it.
+                format (str or None): image format when rendering, e.g. 'png' or 'svg'.
             
             Returns:
                 list[float]: x values for pdf plot
@@ -153,28 +628,30 @@ class Gaussian(General_Distribution.Distribution):
         # Convert back to the sample parameters
         self.analyze_data_set(True)
 
-        mean, stdev, min_range, max_range = self.mean, self.stdev, min(self.data), max(self.data)
+        min_range, max_range = self._cached('range', self._data_range)
 
         # Calculate the interval between x values
         interval = 1.0 * (max_range - min_range) / n_spaces
 
         # Calcuate the x values for ploting
-        _x = [min_range + interval * x for x in range(n_spaces)]
-        _y = [self.pdf(x) for x in _x]
+        _x = min_range + interval * np.arange(n_spaces)
+        _y = self.pdf(_x)
 
         # Create the plots
-        fig, axes = plt.subplots(ncols=1, nrows=2, sharex=True)
+        _density, _edges = self._histogram(bins, (min_range, max_range), density=True)
+
+        fig, axes = Plotting.new_figure(output, nrows=2, sharex=True)
         fig.subplots_adjust(hspace=.5)
-        axes[0].hist(self.data, density=True)
+        axes[0].stairs(_density, _edges, fill=True)
         axes[0].set_title('Normalized Histogram of Data')
         axes[0].set_ylabel('Density')
 
         axes[1].plot(_x, _y)
         axes[1].set_title('Normal Distribution for \n Sample Mean and Sample Standard Deviation')
         axes[1].set_ylabel('Density')
-        plt.show()
+        Plotting.finish_figure(fig, output, format)
 
-        return _x, _y
+        return _x.tolist(), _y.tolist()
 
     def __add__(self, other: type) -> type:
         """
@@ -188,9 +665,7 @@ class Gaussian(General_Distribution.Distribution):
         
         """
         
-        result = Gaussian()
-        result.mean = self.mean + other.mean
-        result.stdev = math.sqrt((self.stdev ** 2) + (other.stdev ** 2))
+        result = Gaussian.from_parameters(self.mean + other.mean, math.sqrt((self.stdev ** 2) + (other.stdev ** 2)))
 
         return result
 
@@ -207,3 +682,25 @@ class Gaussian(General_Distribution.Distribution):
         """
 
         return f'Mean: {self.mean}, Standard Deviation: {self.stdev}, N: {self.n}'
+
+def sum_many(distributions: 'list[Gaussian]') -> Gaussian:
+    """
+        Function to add together many independent Gaussian distributions in one
+        vectorized pass over their parameters.
+
+        Args:
+            distributions (list[Gaussian]): instances of the Gaussian class.
+
+        Returns:
+            Gaussian: Combination of the Gaussian distributions, built from its parameters
+
+    """
+
+    _parameters = np.array([(distribution.mean, distribution.stdev) for distribution in distributions], dtype=float)
+    if len(_parameters) == 0:
+        raise ValueError("sum_many needs at least one distribution")
+
+    _mean = np.sum(_parameters[:, 0])
+    _stdev = math.sqrt(np.dot(_parameters[:, 1], _parameters[:, 1]))
+
+    return Gaussian.from_parameters(_mean, _stdev)
@@ -1,7 +1,38 @@
 # %%
+import os
+import math
+import struct
+import tempfile
+import numpy as np
+
+# Snapshot header: magic, version, flags, kind, data dtype, n, data length, mean, stdev, prob, data offset
+SNAPSHOT_MAGIC = b'DSNP'
+SNAPSHOT_VERSION = 1
+SNAPSHOT_HEADER = struct.Struct('<4sHH32s8sqqdddq')
+
+# Data buffers start on a multiple of this many bytes so they can be mapped with any dtype
+SNAPSHOT_ALIGNMENT = 64
+
+# Snapshot flag set when the data set is stored after the header
+SNAPSHOT_HAS_DATA = 1
+
+# Snapshot flag set when n observations are sampled from the parameters on first access
+SNAPSHOT_SAMPLED = 2
+
+# Snapshot flag set when a Binomial holds only its count of successes, which is prob * n
+SNAPSHOT_COUNTS = 4
 
 class Distribution():
 
+    # Attributes of every distribution; instances carry no __dict__
+    __slots__ = ('mean', 'stdev', '_data', '_cache')
+
+    # File extensions read as raw binary buffers of a single dtype
+    binary_extensions = ('.bin', '.raw')
+
+    # Type of the values read from data files when no dtype is given
+    data_dtype = 'float64'
+
     def __init__(self, mean: float = 0, stdev: float = 0) -> None:
 
         """ 
@@ -10,40 +41,438 @@ class Distribution():
             Attributes:
                 mean (float) calculates the mean value of the distribution
                 stdev (float) calculates the standard deviation of the distribution
-                data (list[float]) a list of floats extracted from the data file
+                data (np.ndarray) the values extracted from the data file
 
         """
 
         self.mean = mean
         self.stdev = stdev
 
-    def read_data_file(self, file_name: str) -> 'list[float]':
+        # Subclasses may load their data before initializing the parameters
+        if not hasattr(self, '_data'):
+            self.data = None
+
+    @property
+    def data(self) -> 'np.ndarray':
+        """
+            The loaded data set. Replacing it drops the cached statistics; values that are
+            not already an array are converted to the data_dtype of the class.
+        """
+
+        return self._data
+
+    @data.setter
+    def data(self, data: 'np.ndarray') -> None:
+        # Arrays, including memory maps, are kept as they are to avoid a copy
+        if data is not None and not isinstance(data, np.ndarray):
+            data = np.asarray(data, dtype=self.data_dtype)
+
+        self._data = data
+        self.invalidate_cache()
+
+    def invalidate_cache(self) -> None:
 
         """ 
-            Method to read a txt format data file. This file should have one number(float) per line. 
-            The numbers are stored in the data attribute.
+            Method to drop the cached statistics of the data set. Called automatically when the
+            data is replaced or appended; call it after modifying the data in place.
 
             Args:
-                file_name (str): name of a file to read.
+                None
 
             Returns:
                 None
 
         """
 
+        self._cache = {}
+
+    def _cached(self, key: str, calculate: 'callable') -> object:
+
+        """ 
+            Method to return a statistic of the data set, calculating it only when it is not cached.
+
+            Args:
+                key (str): name of the statistic.
+                calculate (callable): function without arguments that calculates the statistic.
+
+            Returns:
+                object: the cached statistic
+
+        """
+
+        if key not in self._cache:
+            self._cache[key] = calculate()
+
+        return self._cache[key]
+
+    def append_data(self, values: 'np.ndarray') -> 'np.ndarray':
+
+        """ 
+            Method to append values to the data set. The values are converted to the type
+            of the data set, or to the data_dtype of the class when there is no data yet.
+
+            Args:
+                values (np.ndarray): the values to append.
+
+            Returns:
+                np.ndarray: the extended data set
+
+        """
+
+        _empty = self.data is None or len(self.data) == 0
+        _dtype = np.dtype(self.data_dtype if _empty else self.data.dtype)
+        _values = np.asarray(values).ravel()
+        values = _values.astype(_dtype, copy=False)
+
+        # Integer data sets only take values they can hold exactly
+        if _dtype.kind in 'biu' and not np.array_equal(values, _values):
+            raise ValueError(f"Values that cannot be stored as {_dtype} cannot be appended")
+
+        if _empty:
+            self.data = values
+        else:
+            self.data = np.concatenate([np.asarray(self.data), values])
+
+        return self.data
+
+    @classmethod
+    def load_array(cls, file_name: str, dtype: 'str or None' = None) -> 'np.ndarray':
+
+        """ 
+            Method to parse a data file into a typed NumPy array without storing it.
+            See read_data_file for the supported formats.
+
+            Args:
+                file_name (str): name of a file to read.
+                dtype (str or None): type of the values; also the layout of raw binary files.
+                None uses the data_dtype of the class.
+
+            Returns:
+                np.ndarray: the parsed data
+
+        """
+
+        dtype = dtype or cls.data_dtype
+        _extension = os.path.splitext(file_name)[1].lower()
+
+        if _extension == '.npy':
+            return np.load(file_name, mmap_mode='r')
+        elif _extension in cls.binary_extensions:
+            return np.memmap(file_name, dtype=dtype, mode='r')
+        elif cls.is_counts_file(file_name):
+            values, counts = cls.load_counts(file_name, dtype)
+            return np.repeat(values, counts)
+        else:
+            try:
+                return np.loadtxt(file_name, dtype=dtype, ndmin=1)
+            except ValueError:
+                if np.dtype(dtype).kind not in 'biu':
+                    raise
+
+            # Whole numbers written as floats, e.g. 1.0, are accepted for integer types
+            _values = np.loadtxt(file_name, ndmin=1)
+            _typed = _values.astype(dtype)
+            if not np.array_equal(_typed, _values):
+                raise ValueError(f"{file_name} holds values that cannot be stored as {np.dtype(dtype)}")
+
+            return _typed
+
+    @classmethod
+    def is_counts_file(cls, file_name: str) -> bool:
+
+        """ 
+            Method to check whether a text data file is aggregated, with one value,count pair per line.
+
+            Args:
+                file_name (str): name of a file to check.
+
+            Returns:
+                bool: True for an aggregated file
+
+        """
+
+        if os.path.splitext(file_name)[1].lower() in ('.npy',) + cls.binary_extensions:
+            return False
+
         with open(file_name) as file:
-            data_list = []
             line = file.readline()
-            while line:
-                data_list.append(int(line))
-                line = file.readline()
-        file.close()
 
-        self.data = data_list
+        return ',' in line
+
+    @staticmethod
+    def load_counts(file_name: str, dtype: str = 'float64') -> 'np.ndarray, np.ndarray':
+
+        """ 
+            Method to parse an aggregated data file with one value,count pair per line.
+
+            Args:
+                file_name (str): name of a file to read.
+                dtype (str): type of the values.
+
+            Returns:
+                np.ndarray: the distinct values
+                np.ndarray: the number of times each value occurs
+
+        """
+
+        _table = np.loadtxt(file_name, delimiter=',', ndmin=2)
+
+        return _table[:, 0].astype(dtype), _table[:, 1].astype(np.int64)
+
+    @staticmethod
+    async def aread_data_files(file_names: 'list[str]', concurrency: int = 64, dtype: 'str or None' = None,
+                               return_exceptions: bool = False) -> 'list[np.ndarray]':
+
+        """ 
+            Method to read many data files concurrently. The blocking open and parse of each file
+            runs in a worker thread, with at most concurrency files in flight at a time.
+
+            Args:
+                file_names (list[str]): names of the files to read.
+                concurrency (int): maximum number of files read at the same time.
+                dtype (str or None): type of the values; also the layout of raw binary files.
+                None reads float64.
+                return_exceptions (bool): flag whether a failed file returns its exception
+                instead of raising it.
+
+            Returns:
+                list[np.ndarray]: the parsed data of each file, in the order of file_names
+
+        """
+
+        # asyncio is only needed for concurrent reads; import it on first use
+        import asyncio
+
+        _semaphore = asyncio.Semaphore(concurrency)
+
+        async def read(file_name: str) -> 'np.ndarray':
+            async with _semaphore:
+                return await asyncio.to_thread(Distribution.load_array, file_name, dtype)
 
-        if isinstance(self.data, list) and len(self.data) > 0:
+        return await asyncio.gather(*(read(file_name) for file_name in file_names), return_exceptions=return_exceptions)
+
+    @classmethod
+    def from_data(cls, data: 'np.ndarray') -> 'Distribution':
+
+        """ 
+            Method to build a distribution fitted to an already parsed data set.
+
+            Args:
+                data (np.ndarray): the data set.
+
+            Returns:
+                Distribution: instance of the calling class fitted with analyze_data_set
+
+        """
+
+        result = cls.__new__(cls)
+        result.data = data
+        Distribution.__init__(result)
+        result.analyze_data_set()
+
+        return result
+
+    @classmethod
+    async def afit_data_files(cls, file_names: 'list[str]', concurrency: int = 64,
+                              dtype: 'str or None' = None) -> 'list[Distribution]':
+
+        """ 
+            Method to read many data files concurrently and fit one distribution to each.
+
+            Args:
+                file_names (list[str]): names of the files to read.
+                concurrency (int): maximum number of files read at the same time.
+                dtype (str or None): type of the values; also the layout of raw binary files.
+                None uses the data_dtype of the class.
+
+            Returns:
+                list[Distribution]: one fitted instance of the calling class per file, in the order of file_names
+
+        """
+
+        _arrays = await Distribution.aread_data_files(file_names, concurrency, dtype or cls.data_dtype)
+
+        return [cls.from_data(data) for data in _arrays]
+
+    def read_data_file(self, file_name: str, dtype: 'str or None' = None) -> 'np.ndarray':
+
+        """ 
+            Method to read a data file into a typed NumPy array. Text files should have one number 
+            per line, or one value,count pair per line, and are parsed in bulk. NumPy .npy files 
+            and raw binary files (.bin, .raw) are memory-mapped read-only instead of being copied into memory.
+            The numbers are stored in the data attribute.
+
+            Args:
+                file_name (str): name of a file to read.
+                dtype (str or None): type of the values; also the layout of raw binary files.
+                None uses the data_dtype of the class.
+
+            Returns:
+                np.ndarray: the loaded data
+
+        """
+
+        self.data = self.load_array(file_name, dtype)
+
+        if len(self.data) > 0:
             print("Data loaded properly.")
         else:
             print("There was a problem, please try again.")
         
-        return self.data
\ No newline at end of file
+        return self.data
+
+    def save(self, file_name: str) -> None:
+
+        """ 
+            Method to write a binary snapshot of the distribution: a small header with the
+            parameters and n, followed by the data set as one contiguous typed buffer. The
+            snapshot is written to a temporary file and moved onto file_name, so a data set
+            mapped from the old snapshot, by this or another process, stays intact.
+
+            Args:
+                file_name (str): name of the snapshot file to write.
+
+            Returns:
+                None
+
+        """
+
+        _data = self._data
+        _flags = 0 if _data is None else SNAPSHOT_HAS_DATA
+        if _data is None and getattr(self, '_sample_size', None) is not None:
+            _flags |= SNAPSHOT_SAMPLED
+        if _data is None and getattr(self, '_successes', None) is not None:
+            _flags |= SNAPSHOT_COUNTS
+        _data = np.empty(0) if _data is None else np.asarray(_data)
+        _offset = -(-SNAPSHOT_HEADER.size // SNAPSHOT_ALIGNMENT) * SNAPSHOT_ALIGNMENT
+
+        _header = SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, _flags, type(self).__name__.encode('ascii'),
+                                       _data.dtype.str.encode('ascii'), int(getattr(self, 'n', len(_data))), _data.size,
+                                       float(self.mean), float(self.stdev), float(getattr(self, 'prob', math.nan)), _offset)
+
+        _directory = os.path.dirname(os.path.abspath(file_name))
+        with tempfile.NamedTemporaryFile('wb', dir=_directory, delete=False) as f:
+            try:
+                f.write(_header.ljust(_offset, b'\0'))
+                _data.ravel().tofile(f)
+            except BaseException:
+                f.close()
+                os.remove(f.name)
+                raise
+
+        # Temporary files are private; keep the permissions of the snapshot being replaced
+        os.chmod(f.name, os.stat(file_name).st_mode & 0o777 if os.path.exists(file_name) else 0o644)
+        os.replace(f.name, file_name)
+
+    @classmethod
+    def load(cls, file_name: str) -> 'Distribution':
+
+        """ 
+            Method to read a snapshot written by save. The data set is memory-mapped read-only
+            without copying, so processes loading the same snapshot share its pages.
+
+            Args:
+                file_name (str): name of the snapshot file to read.
+
+            Returns:
+                Distribution: instance of the class recorded in the snapshot
+
+        """
+
+        with open(file_name, 'rb') as f:
+            _header = f.read(SNAPSHOT_HEADER.size)
+        if len(_header) < SNAPSHOT_HEADER.size or _header[:4] != SNAPSHOT_MAGIC:
+            raise ValueError(f"{file_name} is not a distribution snapshot")
+
+        _magic, _version, _flags, _kind, _dtype, _n, _length, _mean, _stdev, _prob, _offset = SNAPSHOT_HEADER.unpack(_header)
+        if _version != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version {_version}")
+
+        _dtype = np.dtype(_dtype.rstrip(b'\0').decode('ascii'))
+        if not _flags & SNAPSHOT_HAS_DATA:
+            data = None
+        elif _length == 0:
+            data = np.empty(0, dtype=_dtype)
+        else:
+            data = np.memmap(file_name, dtype=_dtype, mode='r', offset=_offset, shape=(_length,))
+
+        return cls._restore(_kind.rstrip(b'\0').decode('ascii'), data, _n, _mean, _stdev, _prob,
+                            bool(_flags & SNAPSHOT_SAMPLED), bool(_flags & SNAPSHOT_COUNTS))
+
+    @classmethod
+    def _restore(cls, kind: str, data: 'np.ndarray or None', n: int, mean: float, stdev: float,
+                 prob: float = math.nan, sampled: bool = False, counts: bool = False) -> 'Distribution':
+
+        """ 
+            Method to rebuild a distribution around an existing data buffer without
+            copying or re-analyzing it.
+
+            Args:
+                kind (str): name of the distribution class.
+                data (np.ndarray or None): the data set.
+                n (int): number of observations.
+                mean (float): mean of the distribution.
+                stdev (float): standard deviation of the distribution.
+                prob (float): probability of a success, nan when the class has none.
+                sampled (bool): flag whether the n observations are sampled from the
+                parameters on first access, as for Gaussian.from_parameters.
+                counts (bool): flag whether the distribution holds only its count of
+                successes, as for Binomial.from_counts.
+
+            Returns:
+                Distribution: instance of the named class
+
+        """
+
+        _class = _distribution_classes(cls).get(kind)
+        if _class is None:
+            raise ValueError(f"Expected a {cls.__name__}, got a {kind}")
+
+        result = _class.__new__(_class)
+        result.data = data
+        Distribution.__init__(result, mean, stdev)
+        result.n = n
+        if not math.isnan(prob):
+            result.prob = prob
+        if sampled:
+            result._sample_size = n
+        if counts:
+            result._successes = round(prob * n)
+
+        return result
+
+    def share(self) -> 'SharedData':
+
+        """
+            Method to publish the data set in shared memory, so worker processes can attach
+            to it with Shared_Data.attach instead of receiving a pickled copy.
+
+            Args:
+                None
+
+            Returns:
+                SharedData: owner of the segment, with the handle to send to the workers
+
+        """
+
+        from Shared_Data import SharedData
+
+        return SharedData(self)
+
+def _distribution_classes(cls: type) -> 'dict[str, type]':
+    """
+        Function to find a class and all of its loaded subclasses by name.
+
+        Args:
+            cls (type): the base class.
+
+        Returns:
+            dict[str, type]: the classes keyed on their names
+
+    """
+
+    classes = {cls.__name__: cls}
+    for subclass in cls.__subclasses__():
+        classes.update(_distribution_classes(subclass))
+
+    return classes
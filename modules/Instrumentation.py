@@ -0,0 +1,178 @@
+# %%
+import json
+import time
+import functools
+import threading
+import numpy as np
+import General_Distribution as General_Distribution
+
+# Methods timed while a Profiler is active, wherever a distribution class defines them
+INSTRUMENTED_METHODS = ('read_data_file', 'analyze_data_set', 'calculate_mean', 'calculate_stdev', 'pdf',
+                        'plot_histogram', 'plot_histogram_pdf', 'plot_bar', 'plot_bar_pdf')
+
+# Methods whose element count is the size of their first argument rather than of the data set
+ARGUMENT_METHODS = ('pdf',)
+
+# Profilers currently recording, and the original functions replaced while any is active
+_active = []
+_originals = {}
+_lock = threading.Lock()
+
+def _element_count(distribution: 'General_Distribution.Distribution', name: str, args: tuple) -> int:
+    """
+        Function to count the elements a call worked on: the size of the argument for the
+        probability functions, otherwise the size of the data set after the call.
+    """
+
+    if name in ARGUMENT_METHODS:
+        return int(np.size(args[0])) if args else 0
+
+    _data = getattr(distribution, '_data', None)
+
+    return 0 if _data is None else int(np.size(_data))
+
+def _instrument(function: 'callable') -> 'callable':
+    """
+        Function to wrap a method so every call is recorded by the active profilers.
+
+        Args:
+            function (callable): the original method.
+
+        Returns:
+            callable: the recording wrapper
+
+    """
+
+    _key, _name = function.__qualname__, function.__name__
+
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        _start = time.perf_counter()
+        try:
+            return function(self, *args, **kwargs)
+        finally:
+            _seconds = time.perf_counter() - _start
+            _elements = _element_count(self, _name, args)
+            for profiler in list(_active):
+                profiler.record(_key, _seconds, _elements)
+
+    return wrapper
+
+def _install() -> None:
+    """
+        Function to replace the instrumented methods of every loaded distribution class with recording wrappers.
+    """
+
+    for cls in General_Distribution._distribution_classes(General_Distribution.Distribution).values():
+        for name in INSTRUMENTED_METHODS:
+            if name in cls.__dict__ and (cls, name) not in _originals:
+                _originals[(cls, name)] = cls.__dict__[name]
+                setattr(cls, name, _instrument(cls.__dict__[name]))
+
+def _uninstall() -> None:
+    """
+        Function to put the original methods back, leaving no overhead behind.
+    """
+
+    for (cls, name), function in _originals.items():
+        setattr(cls, name, function)
+    _originals.clear()
+
+class Profiler():
+
+    def __init__(self) -> None:
+
+        """
+            Context manager to record call counts, cumulative wall time and element counts
+            of the hot distribution methods. The methods are only wrapped while at least
+            one profiler is active, so there is no overhead outside the with block.
+            Wall time includes nested instrumented calls, e.g. analyze_data_set
+            includes its calculate_mean call.
+
+            Attributes:
+                stats (dict[str, dict]): calls, seconds and elements keyed on 'Class.method'
+
+        """
+
+        self.stats = {}
+        self._stats_lock = threading.Lock()
+
+    def record(self, key: str, seconds: float, elements: int) -> None:
+
+        """
+            Method to add one call to the statistics.
+
+            Args:
+                key (str): qualified name of the method, e.g. 'Gaussian.pdf'.
+                seconds (float): wall time of the call.
+                elements (int): number of elements the call worked on.
+
+            Returns:
+                None
+
+        """
+
+        with self._stats_lock:
+            _entry = self.stats.setdefault(key, {'calls': 0, 'seconds': 0.0, 'elements': 0})
+            _entry['calls'] += 1
+            _entry['seconds'] += seconds
+            _entry['elements'] += elements
+
+    def snapshot(self) -> 'dict[str, dict]':
+
+        """
+            Method to return a copy of the statistics recorded so far.
+
+            Args:
+                None
+
+            Returns:
+                dict[str, dict]: calls, seconds and elements keyed on 'Class.method'
+
+        """
+
+        with self._stats_lock:
+            return {key: dict(entry) for key, entry in sorted(self.stats.items())}
+
+    def to_json(self, file_name: 'str or None' = None) -> str:
+
+        """
+            Method to export the statistics as JSON.
+
+            Args:
+                file_name (str or None): name of a file to write the JSON to as well.
+
+            Returns:
+                str: the statistics as a JSON document
+
+        """
+
+        _document = json.dumps(self.snapshot(), indent=2)
+        if file_name is not None:
+            with open(file_name, 'w') as file:
+                file.write(_document)
+
+        return _document
+
+    def reset(self) -> None:
+
+        """
+            Method to clear the statistics recorded so far.
+        """
+
+        with self._stats_lock:
+            self.stats = {}
+
+    def __enter__(self) -> 'Profiler':
+        with _lock:
+            if not _active:
+                _install()
+            _active.append(self)
+
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        with _lock:
+            _active.remove(self)
+            if not _active:
+                _uninstall()
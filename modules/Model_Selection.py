@@ -0,0 +1,99 @@
+# %%
+import math
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+# Upper bound on the number of candidate x observation log-likelihoods held in memory per block
+MAX_BLOCK_ELEMENTS = 2 ** 20
+
+# Result of scoring a data set: the best candidate and the per-candidate scores
+ModelSelection = namedtuple('ModelSelection', ['best', 'index', 'loglik', 'aic'])
+
+def _group_candidates(candidates: list) -> 'list[tuple[type, np.ndarray]]':
+    """
+        Function to group the candidates by class, so each group is scored in one broadcast pass.
+
+        Args:
+            candidates (list): the distributions to score.
+
+        Returns:
+            list[tuple[type, np.ndarray]]: each class with the positions of its candidates
+
+    """
+
+    _groups = {}
+    for index, candidate in enumerate(candidates):
+        _groups.setdefault(type(candidate), []).append(index)
+
+    return [(cls, np.array(indices)) for cls, indices in _groups.items()]
+
+def log_likelihoods(data: 'np.ndarray', candidates: list, workers: int = 1) -> 'np.ndarray':
+    """
+        Function to compute the log-likelihood of a data set under each candidate. The
+        candidate x observation matrix is evaluated in blocks of at most MAX_BLOCK_ELEMENTS
+        values and summed per block, so memory does not grow with the data set.
+
+        Args:
+            data (np.ndarray): the observations to score.
+            candidates (list): the fitted distributions, each with a _log_likelihoods classmethod.
+            workers (int): number of threads scoring blocks at the same time.
+
+        Returns:
+            np.ndarray: log-likelihood of the data set under each candidate
+
+    """
+
+    data = np.asarray(data, dtype=float).ravel()
+    _block_size = max(1, MAX_BLOCK_ELEMENTS // max(1, len(candidates)))
+    _starts = range(0, len(data), _block_size)
+    _groups = _group_candidates(candidates)
+
+    def score_block(start: int) -> 'np.ndarray':
+        _block = data[start:start + _block_size]
+        _sums = np.empty(len(candidates))
+        for cls, indices in _groups:
+            _sums[indices] = np.sum(cls._log_likelihoods([candidates[i] for i in indices], _block), axis=1)
+        return _sums
+
+    if workers == 1:
+        _blocks = list(map(score_block, _starts))
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            _blocks = list(executor.map(score_block, _starts))
+
+    # Blocks are added in order so the result does not depend on the number of threads
+    _total = np.zeros(len(candidates))
+    for block in _blocks:
+        _total += block
+
+    return _total
+
+def select_model(data: 'np.ndarray', candidates: list, workers: int = 1) -> ModelSelection:
+    """
+        Function to pick the candidate distribution that best explains a data set by the
+        Akaike information criterion, AIC = 2 k - 2 log L with k the number of fitted parameters.
+
+        Args:
+            data (np.ndarray): the observations to score.
+            candidates (list): the fitted Gaussian and Binomial distributions to compare.
+            workers (int): number of threads scoring blocks at the same time.
+
+        Returns:
+            ModelSelection: the best candidate, its position, and the log-likelihood
+            and AIC of every candidate
+
+    """
+
+    candidates = list(candidates)
+    if not candidates:
+        raise ValueError("At least one candidate is needed")
+
+    _loglik = log_likelihoods(data, candidates, workers)
+    _parameters = np.array([candidate.n_parameters for candidate in candidates], dtype=float)
+    _aic = 2 * _parameters - 2 * _loglik
+
+    # Candidates that cannot produce the data score inf; a nan score (e.g. zero stdev) ranks last too
+    _index = int(np.argmin(np.where(np.isnan(_aic), math.inf, _aic)))
+
+    return ModelSelection(candidates[_index], _index, _loglik, _aic)
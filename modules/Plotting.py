@@ -0,0 +1,76 @@
+# %%
+import numpy as np
+
+def new_figure(output: 'str or object or None' = None, nrows: int = 1, ncols: int = 1,
+               **subplot_kw) -> 'object, object':
+    """
+        Function to create a figure for the plot methods. Without an output the figure is
+        created through pyplot so it can be shown; with an output it is a standalone Agg
+        figure that needs no display.
+
+        Args:
+            output (str or file-like or None): where the figure will be saved, None to show it.
+            nrows (int): number of rows of axes.
+            ncols (int): number of columns of axes.
+            subplot_kw: further arguments for subplots, e.g. sharex.
+
+        Returns:
+            matplotlib.figure.Figure: the figure
+            matplotlib.axes.Axes or np.ndarray: the axes
+
+    """
+
+    if output is None:
+        import matplotlib.pyplot as plt
+
+        return plt.subplots(nrows=nrows, ncols=ncols, **subplot_kw)
+
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    figure = Figure()
+    FigureCanvasAgg(figure)
+
+    return figure, figure.subplots(nrows=nrows, ncols=ncols, **subplot_kw)
+
+def finish_figure(figure: object, output: 'str or object or None' = None, format: 'str or None' = None) -> None:
+    """
+        Function to show a figure, or render it to a file or file-like object.
+
+        Args:
+            figure (matplotlib.figure.Figure): the figure.
+            output (str or file-like or None): file name or binary file-like object such as
+            io.BytesIO to render to, None to show the figure.
+            format (str or None): image format, e.g. 'png' or 'svg'; None infers it from the file name.
+
+        Returns:
+            None
+
+    """
+
+    if output is None:
+        import matplotlib.pyplot as plt
+
+        plt.show()
+    else:
+        figure.savefig(output, format=format)
+
+def histogram(data: 'np.ndarray', bins: int = 10, value_range: 'tuple[float, float] or None' = None,
+              density: bool = False) -> 'np.ndarray, np.ndarray':
+    """
+        Function to bin a data set in a single NumPy pass, so only the bin counts
+        are handed to matplotlib.
+
+        Args:
+            data (np.ndarray): the data set.
+            bins (int): number of equal-width bins.
+            value_range (tuple[float, float] or None): lower and upper edge; None uses the data range.
+            density (bool): flag whether to normalize the counts to a probability density.
+
+        Returns:
+            np.ndarray: count or density of each bin
+            np.ndarray: the bin edges
+
+    """
+
+    return np.histogram(data, bins=bins, range=value_range, density=density)
@@ -0,0 +1,337 @@
+# %%
+import math
+import numpy as np
+import General_Distribution as General_Distribution
+from Binomial_Distribution import Binomial, _binomial_logpmf
+
+# Below this length two pmf arrays are convolved directly instead of with an FFT
+DIRECT_CONVOLUTION_SIZE = 64
+
+def _fft_length(size: int) -> int:
+    """
+        Function to return the smallest power of two that holds size values, a fast FFT length.
+    """
+
+    return 1 << (size - 1).bit_length()
+
+def _convolve(first: 'np.ndarray', second: 'np.ndarray') -> 'np.ndarray':
+    """
+        Function to convolve two probability mass functions.
+
+        Args:
+            first (np.ndarray): pmf of the first count.
+            second (np.ndarray): pmf of the second count.
+
+        Returns:
+            np.ndarray: pmf of the sum of both counts
+
+    """
+
+    if min(len(first), len(second)) < DIRECT_CONVOLUTION_SIZE:
+        return np.convolve(first, second)
+
+    _size = len(first) + len(second) - 1
+    _fft_size = _fft_length(_size)
+    _result = np.fft.irfft(np.fft.rfft(first, _fft_size) * np.fft.rfft(second, _fft_size), _fft_size)[:_size]
+
+    # FFT round-off leaves tiny negative values where the probability is zero
+    return np.maximum(_result, 0.0)
+
+def _convolve_rows(batch: 'np.ndarray') -> 'np.ndarray':
+    """
+        Function to convolve the rows of a batch of equal-length probability mass functions
+        pairwise in a balanced tree, one vectorized pass per level.
+
+        Args:
+            batch (np.ndarray): pmf of each independent count, one per row.
+
+        Returns:
+            np.ndarray: pmf of the sum of all counts
+
+    """
+
+    # The identity rows padding odd levels lengthen the result past the largest possible sum
+    _support = len(batch) * (batch.shape[1] - 1) + 1
+
+    while len(batch) > 1:
+        if len(batch) % 2:
+            # Pad with the pmf of a count that is always zero
+            _identity = np.zeros((1, batch.shape[1]))
+            _identity[0, 0] = 1.0
+            batch = np.vstack([batch, _identity])
+
+        first, second = batch[0::2], batch[1::2]
+        _length = batch.shape[1]
+        _size = 2 * _length - 1
+
+        if _length < DIRECT_CONVOLUTION_SIZE:
+            batch = np.zeros((len(first), _size))
+            for i in range(_length):
+                batch[:, i:i + _length] += first[:, i:i + 1] * second
+        else:
+            _fft_size = _fft_length(_size)
+            batch = np.fft.irfft(np.fft.rfft(first, _fft_size, axis=1) * np.fft.rfft(second, _fft_size, axis=1),
+                                 _fft_size, axis=1)[:, :_size]
+            batch = np.maximum(batch, 0.0)
+
+    return batch[0, :_support]
+
+def _convolve_all(pmfs: 'list[np.ndarray]') -> 'np.ndarray':
+    """
+        Function to convolve many probability mass functions pairwise in a balanced tree,
+        so N Bernoulli trials take O(N log^2 N) operations.
+
+        Args:
+            pmfs (list[np.ndarray]): pmf of each independent count.
+
+        Returns:
+            np.ndarray: pmf of the sum of all counts
+
+    """
+
+    while len(pmfs) > 1:
+        pmfs = [_convolve(pmfs[i], pmfs[i + 1]) if i + 1 < len(pmfs) else pmfs[i] for i in range(0, len(pmfs), 2)]
+
+    return pmfs[0]
+
+class PoissonBinomial(General_Distribution.Distribution):
+
+    __slots__ = ('trials', 'probs', 'n')
+
+    def __init__(self, trials: 'np.ndarray', probs: 'np.ndarray') -> None:
+
+        """
+            Class for the number of successes in independent trials with different probabilities,
+            such as the sum of Binomial distributions with different p.
+
+            Attributes:
+                mean (float): the mean value of the distribution
+                stdev (float): the standard deviation of the distribution
+                trials (np.ndarray): number of trials for each distinct probability
+                probs (np.ndarray): the distinct probabilities, in increasing order
+                n (int): the total number of trials
+
+        """
+
+        # Trials sharing a probability form one binomial component
+        self.probs, _inverse = np.unique(np.asarray(probs, dtype=float), return_inverse=True)
+        self.trials = np.bincount(_inverse.ravel(), weights=np.asarray(trials, dtype=float).ravel(),
+                                  minlength=len(self.probs)).astype(np.int64)
+        _used = self.trials > 0
+        self.probs, self.trials = self.probs[_used], self.trials[_used]
+        self.n = int(np.sum(self.trials))
+
+        General_Distribution.Distribution.__init__(self, float(np.dot(self.trials, self.probs)),
+                                                   math.sqrt(np.dot(self.trials, self.probs * (1 - self.probs))))
+
+    @classmethod
+    def from_probabilities(cls, probs: 'np.ndarray') -> 'PoissonBinomial':
+        """
+            Method to build the distribution of the number of successes in single trials.
+
+            Args:
+                probs (np.ndarray): probability of a success in each trial.
+
+            Returns:
+                PoissonBinomial: distribution of the total number of successes
+
+        """
+
+        probs = np.asarray(probs, dtype=float)
+
+        return cls(np.ones(len(probs), dtype=np.int64), probs)
+
+    @classmethod
+    def from_distributions(cls, distributions: 'list[Binomial or PoissonBinomial]') -> 'PoissonBinomial':
+        """
+            Method to build the distribution of the sum of independent Binomial
+            and PoissonBinomial distributions.
+
+            Args:
+                distributions (list[Binomial or PoissonBinomial]): the distributions to add.
+
+            Returns:
+                PoissonBinomial: distribution of the total number of successes
+
+        """
+
+        trials, probs = [], []
+        for distribution in distributions:
+            if isinstance(distribution, PoissonBinomial):
+                trials.append(distribution.trials)
+                probs.append(distribution.probs)
+            else:
+                trials.append([distribution.n])
+                probs.append([distribution.prob])
+
+        return cls(np.concatenate(trials), np.concatenate(probs))
+
+    def _pmf_table(self) -> 'np.ndarray':
+        """
+            Method to return the cached pmf for 0..n successes. Trials sharing a probability
+            are combined exactly as a binomial pmf before the FFT convolution.
+
+            Args:
+                None
+
+            Returns:
+                np.ndarray: pmf for k = 0..n
+
+        """
+
+        def calculate():
+            # Single trials are reduced together as one batch of [1 - p, p] rows
+            _bernoulli = self.probs[self.trials == 1]
+            pmfs = [np.exp(_binomial_logpmf(np.arange(n + 1), n, prob))
+                    for n, prob in zip(self.trials.tolist(), self.probs.tolist()) if n > 1]
+            if len(_bernoulli):
+                pmfs.append(_convolve_rows(np.column_stack([1 - _bernoulli, _bernoulli])))
+
+            return _convolve_all(pmfs) if pmfs else np.ones(1)
+
+        return self._cached('pmf', calculate)
+
+    def _cdf_table(self) -> 'np.ndarray':
+        """
+            Method to return the cached cdf for 0..n successes.
+        """
+
+        return self._cached('cdf', lambda: np.minimum(np.cumsum(self._pmf_table()), 1.0))
+
+    def _sf_table(self) -> 'np.ndarray':
+        """
+            Method to return the cached survival function for 0..n successes, summed from the upper tail.
+        """
+
+        def calculate():
+            _sf = np.zeros(self.n + 1)
+            _sf[:-1] = np.cumsum(self._pmf_table()[:0:-1])[::-1]
+            return np.minimum(_sf, 1.0)
+
+        return self._cached('sf', calculate)
+
+    def _table_lookup(self, table: 'np.ndarray', k: 'int or np.ndarray', below: float) -> 'float or np.ndarray':
+        """
+            Method to look up a table over 0..n successes, see Binomial._table_lookup.
+        """
+
+        k = np.floor(np.asarray(k, dtype=float))
+        _index = np.clip(k, 0, self.n).astype(np.int64)
+
+        return np.where(k < 0, below, table[_index])[()]
+
+    def pmf(self, k: 'int or np.ndarray') -> 'float or np.ndarray':
+        """
+            Probability mass function for the total number of successes. Probabilities
+            are accurate to about 1e-16 in absolute terms.
+
+            Args:
+                k (int or np.ndarray): number(s) of successes.
+
+            Returns:
+                float or np.ndarray: probability mass function output, with the shape of k
+
+        """
+
+        k = np.asarray(k, dtype=float)
+        _in_support = (k >= 0) & (k <= self.n) & (k == np.floor(k))
+
+        return np.where(_in_support, self._table_lookup(self._pmf_table(), k, 0.0), 0.0)[()]
+
+    def logpmf(self, k: 'int or np.ndarray') -> 'float or np.ndarray':
+        """
+            Natural logarithm of the probability mass function for the total number of successes.
+
+            Args:
+                k (int or np.ndarray): number(s) of successes.
+
+            Returns:
+                float or np.ndarray: log probability mass function output, with the shape of k
+
+        """
+
+        with np.errstate(divide='ignore'):
+            return np.log(self.pmf(k))
+
+    def cdf(self, k: 'int or np.ndarray') -> 'float or np.ndarray':
+        """
+            Cumulative distribution function P(X <= k).
+
+            Args:
+                k (int or np.ndarray): number(s) of successes.
+
+            Returns:
+                float or np.ndarray: cumulative probability, with the shape of k
+
+        """
+
+        return self._table_lookup(self._cdf_table(), k, 0.0)
+
+    def sf(self, k: 'int or np.ndarray') -> 'float or np.ndarray':
+        """
+            Survival function P(X > k). The tail probability P(X >= k) is sf(k - 1).
+
+            Args:
+                k (int or np.ndarray): number(s) of successes.
+
+            Returns:
+                float or np.ndarray: tail probability, with the shape of k
+
+        """
+
+        return self._table_lookup(self._sf_table(), k, 1.0)
+
+    def ppf(self, q: 'float or np.ndarray') -> 'float or np.ndarray':
+        """
+            Percent point function (inverse of cdf).
+
+            Args:
+                q (float or np.ndarray): probability or probabilities between 0 and 1.
+
+            Returns:
+                float or np.ndarray: smallest number of successes k with P(X <= k) >= q,
+                nan where q is outside 0..1
+
+        """
+
+        q = np.asarray(q, dtype=float)
+
+        _k = np.minimum(np.searchsorted(self._cdf_table(), q, side='left'), self.n).astype(float)
+        _k = np.where(q == 1, self.n, _k)
+
+        return np.where((q >= 0) & (q <= 1), _k, np.nan)[()]
+
+    def save(self, file_name: str) -> None:
+        """
+            Snapshots hold a single set of parameters, which cannot describe the components.
+        """
+
+        raise TypeError("PoissonBinomial snapshots are not supported")
+
+    def __add__(self, other: 'Binomial or PoissonBinomial') -> 'PoissonBinomial':
+        """
+            Function to add a Binomial or PoissonBinomial distribution to this one.
+
+            Args:
+                other (Binomial or PoissonBinomial): the distribution to add.
+
+            Returns:
+                PoissonBinomial: distribution of the total number of successes
+
+        """
+
+        return PoissonBinomial.from_distributions([self, other])
+
+    def __repr__(self):
+        """
+            Function to return the characteristics of the PoissonBinomial instance.
+
+            Args:
+                None
+
+            Returns:
+                str: characteristics of the PoissonBinomial instance.
+
+        """
+
+        return f'Mean: {self.mean}, Standard Deviation: {self.stdev}, N: {self.n}, Components: {len(self.probs)}'
@@ -0,0 +1,376 @@
+# %%
+import math
+import numpy as np
+from Running_Moments import RunningMoments
+
+# Default bound on the error of the quantiles, relative to their distance from the reference
+RELATIVE_ACCURACY = 0.01
+
+# Default number of buckets kept per side of the reference; beyond it the buckets nearest the reference are merged
+MAX_BUCKETS = 2048
+
+# Distances from the reference below this are counted as zero
+MIN_MAGNITUDE = 1e-300
+
+class _Buckets():
+
+    __slots__ = ('offset', 'counts')
+
+    def __init__(self) -> None:
+
+        """
+            Class for the dense counts of consecutive logarithmic bucket indices.
+
+            Attributes:
+                offset (int): index of the first bucket
+                counts (np.ndarray): number of values in each bucket
+
+        """
+
+        self.offset = 0
+        self.counts = np.zeros(0, dtype=np.int64)
+
+    def _extend(self, low: int, high: int) -> None:
+        """
+            Method to grow the counts so they cover bucket indices low..high.
+        """
+
+        if len(self.counts) == 0:
+            self.offset, self.counts = low, np.zeros(high - low + 1, dtype=np.int64)
+            return
+
+        _low, _high = min(low, self.offset), max(high, self.offset + len(self.counts) - 1)
+        if (_low, _high) != (self.offset, self.offset + len(self.counts) - 1):
+            _counts = np.zeros(_high - _low + 1, dtype=np.int64)
+            _counts[self.offset - _low:self.offset - _low + len(self.counts)] = self.counts
+            self.offset, self.counts = _low, _counts
+
+    def add(self, indices: 'np.ndarray', max_buckets: int, weights: 'np.ndarray or None' = None) -> None:
+        """
+            Method to count values by their bucket indices, each once or weights times.
+        """
+
+        if len(indices) == 0:
+            return
+
+        self._extend(int(indices.min()), int(indices.max()))
+        _counts = np.bincount(indices - self.offset, weights, minlength=len(self.counts))
+        self.counts += _counts.astype(np.int64) if weights is not None else _counts
+        self.collapse(max_buckets)
+
+    def merge(self, other: '_Buckets', max_buckets: int) -> None:
+        """
+            Method to add the counts of another set of buckets.
+        """
+
+        if len(other.counts) == 0:
+            return
+
+        self._extend(other.offset, other.offset + len(other.counts) - 1)
+        self.counts[other.offset - self.offset:other.offset - self.offset + len(other.counts)] += other.counts
+        self.collapse(max_buckets)
+
+    def collapse(self, max_buckets: int) -> None:
+        """
+            Method to merge the buckets nearest the reference until at most max_buckets remain.
+        """
+
+        _excess = len(self.counts) - max_buckets
+        if _excess > 0:
+            self.counts[_excess] += self.counts[:_excess].sum()
+            self.counts = self.counts[_excess:].copy()
+            self.offset += _excess
+
+class QuantileSketch():
+
+    __slots__ = ('relative_accuracy', 'max_buckets', 'reference', '_gamma', '_log_gamma', 'moments', 'min', 'max',
+                 'zero_count', '_positive', '_negative')
+
+    def __init__(self, relative_accuracy: float = RELATIVE_ACCURACY, max_buckets: int = MAX_BUCKETS,
+                 reference: 'float or None' = None) -> None:
+
+        """
+            Class to summarize a data stream in logarithmic buckets (DDSketch) with bounded memory.
+            The buckets are laid out on the distance of each value from a reference point, so a
+            quantile is within relative_accuracy times its distance from the reference of a value
+            of the data, as long as fewer than max_buckets buckets per side are needed. Centring
+            on the data keeps the error proportional to the spread rather than to the location.
+            Sketches with the same settings and reference merge exactly, so shards can be
+            summarized separately; sketches with different references are merged approximately.
+
+            Attributes:
+                relative_accuracy (float): bound on the relative error of the distances from the reference
+                max_buckets (int): number of buckets kept per side of the reference
+                reference (float or None): centre of the buckets; None takes the mean of the first batch
+                moments (RunningMoments): count, mean and M2 of the values
+                min (float): smallest value seen
+                max (float): largest value seen
+                zero_count (int): number of values counted at the reference
+
+        """
+
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(f"relative_accuracy must be between 0 and 1, got {relative_accuracy}")
+
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.reference = reference
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+
+        self.moments = RunningMoments()
+        self.min = math.inf
+        self.max = -math.inf
+        self.zero_count = 0
+        self._positive = _Buckets()
+        self._negative = _Buckets()
+
+    @property
+    def count(self) -> int:
+        """
+            The number of values seen.
+        """
+
+        return self.moments.count
+
+    def update(self, x: float) -> 'QuantileSketch':
+
+        """
+            Method to add a single value to the sketch.
+
+            Args:
+                x (float): the new value.
+
+            Returns:
+                QuantileSketch: the updated sketch
+
+        """
+
+        return self.update_batch(np.array([x], dtype=float))
+
+    def update_batch(self, data: 'np.ndarray') -> 'QuantileSketch':
+
+        """
+            Method to add a batch of values to the sketch in one vectorized pass.
+
+            Args:
+                data (np.ndarray): the new values.
+
+            Returns:
+                QuantileSketch: the updated sketch
+
+        """
+
+        if data is None:
+            raise ValueError("There are no values to add to the sketch")
+
+        data = np.asarray(data, dtype=float).ravel()
+        if len(data) == 0:
+            return self
+
+        if self.reference is None:
+            self.reference = float(np.mean(data))
+
+        self.moments.update_batch(data)
+        self.min = min(self.min, float(np.min(data)))
+        self.max = max(self.max, float(np.max(data)))
+        self._count(data - self.reference)
+
+        return self
+
+    def _count(self, distances: 'np.ndarray', weights: 'np.ndarray or None' = None) -> None:
+        """
+            Method to add values to the buckets by their signed distances from the reference.
+
+            Args:
+                distances (np.ndarray): the values minus the reference.
+                weights (np.ndarray or None): number of values at each distance; None counts each once.
+
+            Returns:
+                None
+
+        """
+
+        _magnitude = np.abs(distances)
+        _nonzero = _magnitude >= MIN_MAGNITUDE
+        if weights is None:
+            self.zero_count += int(len(distances) - np.count_nonzero(_nonzero))
+        else:
+            self.zero_count += int(weights[~_nonzero].sum())
+            weights = weights[_nonzero]
+
+        _indices = np.ceil(np.log(_magnitude[_nonzero]) / self._log_gamma).astype(np.int64)
+        _positive = distances[_nonzero] > 0
+        self._positive.add(_indices[_positive], self.max_buckets, None if weights is None else weights[_positive])
+        self._negative.add(_indices[~_positive], self.max_buckets, None if weights is None else weights[~_positive])
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+
+        """
+            Method to combine the counts of another sketch into this one. The counts of a sketch
+            with a different reference are moved into the buckets of this one by their
+            representative values, which adds at most one more bucket width of error.
+
+            Args:
+                other (QuantileSketch): the sketch to merge in, with the same relative accuracy.
+
+            Returns:
+                QuantileSketch: the updated sketch
+
+        """
+
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Only sketches with the same relative accuracy can be merged")
+
+        if other.count == 0:
+            return self
+        if self.count == 0 and self.reference is None:
+            self.reference = other.reference
+
+        self.moments.merge(other.moments)
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+        if other.reference == self.reference:
+            self.zero_count += other.zero_count
+            self._positive.merge(other._positive, self.max_buckets)
+            self._negative.merge(other._negative, self.max_buckets)
+        else:
+            _distances, _counts = other._distances()
+            self._count(_distances + (other.reference - self.reference), _counts)
+
+        return self
+
+    def copy(self) -> 'QuantileSketch':
+
+        """
+            Method to return an independent copy of the sketch.
+
+            Args:
+                None
+
+            Returns:
+                QuantileSketch: the copy
+
+        """
+
+        return QuantileSketch(self.relative_accuracy, self.max_buckets, self.reference).merge(self)
+
+    def _distances(self) -> 'np.ndarray, np.ndarray':
+        """
+            Method to return the representative distance from the reference and the count of
+            every bucket, in increasing order.
+
+            Args:
+                None
+
+            Returns:
+                np.ndarray: representative distance of each bucket
+                np.ndarray: number of values in each bucket
+
+        """
+
+        def values(buckets: _Buckets) -> 'np.ndarray':
+            _indices = np.arange(buckets.offset, buckets.offset + len(buckets.counts), dtype=float)
+            return 2 * np.exp(_indices * self._log_gamma) / (self._gamma + 1)
+
+        _values = np.concatenate([-values(self._negative)[::-1], [0.0], values(self._positive)])
+        _counts = np.concatenate([self._negative.counts[::-1], [self.zero_count], self._positive.counts])
+
+        return _values, _counts
+
+    def _buckets(self) -> 'np.ndarray, np.ndarray':
+        """
+            Method to return the representative value and count of every bucket, in increasing order.
+
+            Args:
+                None
+
+            Returns:
+                np.ndarray: representative value of each bucket
+                np.ndarray: number of values in each bucket
+
+        """
+
+        _distances, _counts = self._distances()
+        _reference = 0.0 if self.reference is None else self.reference
+
+        return np.clip(_distances + _reference, self.min, self.max), _counts
+
+    def quantile(self, q: 'float or np.ndarray') -> 'float or np.ndarray':
+
+        """
+            Method to estimate quantiles of the values seen.
+
+            Args:
+                q (float or np.ndarray): probability or probabilities between 0 and 1.
+
+            Returns:
+                float or np.ndarray: the estimated quantile(s), nan for an empty sketch
+
+        """
+
+        q = np.asarray(q, dtype=float)
+        if np.any((q < 0) | (q > 1)):
+            raise ValueError("Quantiles must be between 0 and 1")
+        if self.count == 0:
+            return np.full(q.shape, np.nan)[()]
+
+        _values, _counts = self._buckets()
+        _index = np.searchsorted(np.cumsum(_counts), q * (self.count - 1), side='right')
+
+        _quantile = _values[np.minimum(_index, len(_values) - 1)]
+
+        # The extremes are tracked exactly
+        return np.where(q == 0, self.min, np.where(q == 1, self.max, _quantile))[()]
+
+    def bins(self, bins: int = 10, value_range: 'tuple[float, float] or None' = None,
+             density: bool = False) -> 'np.ndarray, np.ndarray':
+
+        """
+            Method to approximate a histogram of the values seen from the bucket counts.
+
+            Args:
+                bins (int): number of equal-width bins.
+                value_range (tuple[float, float] or None): lower and upper edge; None uses min and max.
+                density (bool): flag whether to normalize the counts to a probability density.
+
+            Returns:
+                np.ndarray: count or density of each bin
+                np.ndarray: the bin edges
+
+        """
+
+        _values, _counts = self._buckets()
+        if value_range is None:
+            value_range = (self.min, self.max)
+
+        return np.histogram(_values, bins=bins, range=value_range, weights=_counts, density=density)
+
+    def __add__(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """
+            Function to combine two sketches without modifying either of them.
+
+            Args:
+                other (QuantileSketch): A instance of the QuantileSketch class.
+
+            Returns:
+                QuantileSketch: sketch of the values of both inputs.
+
+        """
+
+        return self.copy().merge(other)
+
+    def __repr__(self):
+        """
+            Function to return the characteristics of the QuantileSketch instance.
+
+            Args:
+                None
+
+            Returns:
+                str: characteristics of the QuantileSketch instance.
+
+        """
+
+        return f'Count: {self.count}, Min: {self.min}, Max: {self.max}, Reference: {self.reference}, Relative Accuracy: {self.relative_accuracy}'
@@ -0,0 +1,356 @@
+# %%
+from collections import deque
+import numpy as np
+
+# Number of values reduced at a time by update_batch, small enough for the cache
+REDUCTION_BLOCK = 2 ** 16
+
+class RunningMoments():
+
+    __slots__ = ('count', 'mean', 'm2')
+
+    def __init__(self, count: int = 0, mean: float = 0.0, m2: float = 0.0) -> None:
+
+        """
+            Class to accumulate the moments of a data stream without holding the data
+            (Welford's online algorithm). Partial states from different shards can be merged exactly.
+
+            Attributes:
+                count (int): number of observations seen so far
+                mean (float): running mean of the observations
+                m2 (float): running sum of squared deviations from the mean
+
+        """
+
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+
+    def update(self, x: float) -> 'RunningMoments':
+
+        """
+            Method to add a single observation to the accumulator.
+
+            Args:
+                x (float): the new observation.
+
+            Returns:
+                RunningMoments: the updated accumulator
+
+        """
+
+        self.count += 1
+        _delta = x - self.mean
+        self.mean += _delta / self.count
+        self.m2 += _delta * (x - self.mean)
+
+        return self
+
+    def remove(self, x: float) -> 'RunningMoments':
+
+        """
+            Method to take a previously added observation back out of the accumulator.
+
+            Args:
+                x (float): the observation to remove.
+
+            Returns:
+                RunningMoments: the updated accumulator
+
+        """
+
+        if self.count <= 1:
+            self.count, self.mean, self.m2 = 0, 0.0, 0.0
+            return self
+
+        self.count -= 1
+        _delta = x - self.mean
+        self.mean -= _delta / self.count
+        self.m2 = max(self.m2 - _delta * (x - self.mean), 0.0)
+
+        return self
+
+    def update_batch(self, data: 'np.ndarray') -> 'RunningMoments':
+
+        """
+            Method to add a batch of observations to the accumulator. The moments are
+            reduced in float64 one block of REDUCTION_BLOCK values at a time through a
+            single reused buffer, so no temporary the size of the data is created for
+            any input dtype.
+
+            Args:
+                data (np.ndarray): the new observations.
+
+            Returns:
+                RunningMoments: the updated accumulator
+
+        """
+
+        data = np.asarray(data).ravel()
+        if len(data) == 0:
+            return self
+
+        _buffer = np.empty(min(len(data), REDUCTION_BLOCK))
+        for start in range(0, len(data), REDUCTION_BLOCK):
+            _block = data[start:start + REDUCTION_BLOCK]
+            _centered = _buffer[:len(_block)]
+            _mean = float(np.add.reduce(_block, dtype=np.float64)) / len(_block)
+            np.subtract(_block, _mean, out=_centered, dtype=np.float64)
+            self.merge(RunningMoments(len(_block), _mean, float(np.dot(_centered, _centered))))
+
+        return self
+
+    def merge(self, other: 'RunningMoments') -> 'RunningMoments':
+
+        """
+            Method to combine the state of another accumulator into this one
+            (Chan et al. parallel update).
+
+            Args:
+                other (RunningMoments): the accumulator to merge in.
+
+            Returns:
+                RunningMoments: the updated accumulator
+
+        """
+
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            return self
+
+        _count = self.count + other.count
+        _delta = other.mean - self.mean
+        self.mean += _delta * other.count / _count
+        self.m2 += other.m2 + _delta ** 2 * self.count * other.count / _count
+        self.count = _count
+
+        return self
+
+    def variance(self, sample: bool = True) -> float:
+
+        """
+            Method to calculate the variance of the observations seen so far.
+            Works element-wise when the state holds arrays, one entry per series.
+
+            Args:
+                sample (bool): flag whether the data represents the sample or population.
+
+            Returns:
+                float: variance of the observations, nan when there are too few of them
+
+        """
+
+        if sample:
+            _n = self.count - 1
+        else:
+            _n = self.count
+
+        # Too few observations give nan instead of dividing by zero or a negative count
+        _n = np.asarray(_n)
+        return np.where(_n > 0, self.m2 / np.maximum(_n, 1), np.nan)[()]
+
+    def stdev(self, sample: bool = True) -> float:
+
+        """
+            Method to calculate the standard deviation of the observations seen so far.
+
+            Args:
+                sample (bool): flag whether the data represents the sample or population.
+
+            Returns:
+                float: standard deviation of the observations
+
+        """
+
+        return np.sqrt(self.variance(sample))
+
+    def __add__(self, other: 'RunningMoments') -> 'RunningMoments':
+        """
+            Function to combine two accumulators without modifying either of them.
+
+            Args:
+                other (RunningMoments): A instance of the RunningMoments class.
+
+            Returns:
+                RunningMoments: accumulator holding the moments of both inputs.
+
+        """
+
+        return RunningMoments(self.count, self.mean, self.m2).merge(other)
+
+    def __repr__(self):
+        """
+            Function to return the characteristics of the RunningMoments instance.
+
+            Args:
+                None
+
+            Returns:
+                str: characteristics of the RunningMoments instance.
+
+        """
+
+        return f'Count: {self.count}, Mean: {self.mean}, M2: {self.m2}'
+
+class RollingMoments(RunningMoments):
+
+    __slots__ = ('window', '_values', '_evictions')
+
+    def __init__(self, window: int) -> None:
+
+        """
+            Class to track the moments of the last window observations of a stream, with O(1)
+            append and evict. The moments are recomputed from the window once every window
+            evictions, which bounds the rounding drift at O(1) amortized cost.
+
+            Attributes:
+                window (int): maximum number of observations kept
+                count (int): number of observations in the window
+                mean (float): mean of the observations in the window
+                m2 (float): sum of squared deviations from the mean in the window
+
+        """
+
+        if window < 1:
+            raise ValueError(f"window must be at least 1, got {window}")
+
+        RunningMoments.__init__(self)
+        self.window = window
+        self._values = deque()
+        self._evictions = 0
+
+    def update(self, x: float) -> 'RollingMoments':
+
+        """
+            Method to add an observation, evicting the oldest one when the window is full.
+
+            Args:
+                x (float): the new observation.
+
+            Returns:
+                RollingMoments: the updated accumulator
+
+        """
+
+        if len(self._values) == self.window:
+            self.evict()
+
+        self._values.append(x)
+        RunningMoments.update(self, x)
+
+        return self
+
+    append = update
+
+    def update_batch(self, data: 'np.ndarray') -> 'RollingMoments':
+
+        """
+            Method to add a batch of observations one at a time.
+
+            Args:
+                data (np.ndarray): the new observations.
+
+            Returns:
+                RollingMoments: the updated accumulator
+
+        """
+
+        for x in np.asarray(data, dtype=float).ravel()[-self.window:].tolist():
+            self.update(x)
+
+        return self
+
+    def evict(self) -> float:
+
+        """
+            Method to remove the oldest observation from the window.
+
+            Args:
+                None
+
+            Returns:
+                float: the removed observation
+
+        """
+
+        x = self._values.popleft()
+        RunningMoments.remove(self, x)
+
+        self._evictions += 1
+        if self._evictions >= self.window:
+            self._evictions = 0
+            _exact = RunningMoments().update_batch(np.fromiter(self._values, dtype=float, count=len(self._values)))
+            self.count, self.mean, self.m2 = _exact.count, _exact.mean, _exact.m2
+
+        return x
+
+    def merge(self, other: RunningMoments) -> 'RollingMoments':
+
+        """
+            A window holds consecutive observations, so it cannot absorb another accumulator.
+        """
+
+        raise TypeError("RollingMoments cannot be merged; use update or update_batch")
+
+    def __add__(self, other: RunningMoments) -> 'RollingMoments':
+
+        """
+            Windows cannot be combined either; see merge.
+        """
+
+        raise TypeError("RollingMoments cannot be added; use update or update_batch")
+
+def rolling_moments(data: 'np.ndarray', window: int, sample: bool = True) -> 'np.ndarray, np.ndarray':
+    """
+        Function to compute the mean and standard deviation of every full window of a series in
+        vectorized passes. The windows are taken in blocks of window consecutive windows; each
+        block's segment of 2 window - 1 values is shifted by its own mean before the cumulative
+        sums, so the cancellation in the variance stays small under drifts and level shifts.
+
+        Args:
+            data (np.ndarray): the series.
+            window (int): number of observations in each window.
+            sample (bool): flag whether the data represents the sample or population.
+
+        Returns:
+            np.ndarray: mean of the window ending at each of positions window - 1 .. len(data) - 1
+            np.ndarray: standard deviation of the same windows
+
+    """
+
+    data = np.asarray(data, dtype=float).ravel()
+    if window < 1 or window > len(data):
+        raise ValueError(f"window must be between 1 and {len(data)}, got {window}")
+
+    _n_windows = len(data) - window + 1
+    _n_blocks = -(-_n_windows // window)
+
+    # Repeating the last value completes the final segment without entering any kept window
+    _padded = np.pad(data, (0, _n_blocks * window + window - 1 - len(data)), mode='edge')
+    _segments = np.lib.stride_tricks.sliding_window_view(_padded, 2 * window - 1)[::window]
+
+    _mean = np.empty(_n_blocks * window)
+    _m2 = np.empty(_n_blocks * window)
+    _rows = max(1, REDUCTION_BLOCK // (2 * window - 1))
+
+    for start in range(0, _n_blocks, _rows):
+        _segment = _segments[start:start + _rows]
+        _shift = _segment.mean(axis=1, keepdims=True)
+        _centered = _segment - _shift
+
+        _sum = np.zeros((len(_segment), 2 * window))
+        _sum_squares = np.zeros((len(_segment), 2 * window))
+        np.cumsum(_centered, axis=1, out=_sum[:, 1:])
+        np.cumsum(_centered * _centered, axis=1, out=_sum_squares[:, 1:])
+        _window_sum = _sum[:, window:] - _sum[:, :window]
+        _window_sum_squares = _sum_squares[:, window:] - _sum_squares[:, :window]
+
+        _slice = slice(start * window, (start + len(_segment)) * window)
+        _mean[_slice] = (_shift + _window_sum / window).ravel()
+        _m2[_slice] = np.maximum(_window_sum_squares - _window_sum * _window_sum / window, 0.0).ravel()
+
+    _mean, _m2 = _mean[:_n_windows], _m2[:_n_windows]
+
+    return _mean, RunningMoments(window, _mean, _m2).stdev(sample)
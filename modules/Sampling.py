@@ -0,0 +1,86 @@
+# %%
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+# Number of draws generated from each independent random stream
+BLOCK_SIZE = 2 ** 20
+
+def seed_sequence(rng: 'int or np.random.SeedSequence or np.random.Generator or None') -> 'np.random.SeedSequence':
+    """
+        Function to resolve the rng argument of the sample methods to a seed sequence.
+
+        Args:
+            rng (int or np.random.SeedSequence or np.random.Generator or None): a seed, a seed
+            sequence, or a generator to draw the seed from; None draws fresh entropy.
+
+        Returns:
+            np.random.SeedSequence: the root of the block streams
+
+    """
+
+    if isinstance(rng, np.random.SeedSequence):
+        return rng
+    if isinstance(rng, np.random.Generator):
+        # Advancing the generator gives every call on it a new set of streams
+        return np.random.SeedSequence(rng.integers(0, 2 ** 63, size=4))
+
+    return np.random.SeedSequence(rng)
+
+def output_buffer(size: 'int or tuple or None', out: 'np.ndarray or None', dtype: str) -> 'np.ndarray':
+    """
+        Function to allocate the output of a sample method, or check the one passed in.
+
+        Args:
+            size (int or tuple or None): shape of the output; ignored when out is given.
+            out (np.ndarray or None): preallocated C-contiguous buffer to fill.
+            dtype (str): dtype of an allocated output.
+
+        Returns:
+            np.ndarray: the buffer to fill
+
+    """
+
+    if out is None:
+        return np.empty(size, dtype=dtype)
+
+    if size is not None and np.shape(out) != ((size,) if np.ndim(size) == 0 else tuple(size)):
+        raise ValueError(f"out has shape {np.shape(out)}, expected {size}")
+    if not out.flags.c_contiguous or not out.flags.writeable:
+        raise ValueError("out must be a writeable C-contiguous array")
+
+    return out
+
+def fill(out: 'np.ndarray', draw: 'callable', rng: 'int or np.random.SeedSequence or np.random.Generator or None' = None,
+         threads: int = 1) -> 'np.ndarray':
+    """
+        Function to fill a buffer with random draws in blocks of BLOCK_SIZE. Every block has its
+        own stream spawned from the seed, so the result for a given seed does not depend on the
+        number of threads.
+
+        Args:
+            out (np.ndarray): C-contiguous buffer to fill.
+            draw (callable): function filling a 1-D block in place from a np.random.Generator,
+            called as draw(generator, block).
+            rng (int or np.random.SeedSequence or np.random.Generator or None): seed of the streams.
+            threads (int): number of threads filling blocks at the same time.
+
+        Returns:
+            np.ndarray: out
+
+    """
+
+    _flat = out.reshape(-1)
+    _starts = range(0, len(_flat), BLOCK_SIZE)
+    _seeds = seed_sequence(rng).spawn(len(_starts))
+
+    def fill_block(start: int, seed: 'np.random.SeedSequence') -> None:
+        draw(np.random.default_rng(seed), _flat[start:start + BLOCK_SIZE])
+
+    if threads == 1:
+        for start, seed in zip(_starts, _seeds):
+            fill_block(start, seed)
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            list(executor.map(fill_block, _starts, _seeds))
+
+    return out
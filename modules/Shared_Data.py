@@ -0,0 +1,120 @@
+# %%
+import math
+from collections import namedtuple
+from multiprocessing import shared_memory
+import numpy as np
+import General_Distribution as General_Distribution
+
+# Picklable description of a published data set: the segment name, its layout and the parameters
+SharedHandle = namedtuple('SharedHandle', ['name', 'kind', 'dtype', 'length', 'n', 'mean', 'stdev', 'prob'])
+
+# Segments opened by attach in this process, kept open while views may use them
+_attached = {}
+
+class SharedData():
+
+    def __init__(self, distribution: 'General_Distribution.Distribution') -> None:
+
+        """
+            Class owning a shared memory segment that holds a copy of a distribution's data
+            set. Worker processes attach to it through the lightweight handle instead of
+            receiving a pickled copy of the data. The owner must call unlink (or use the
+            instance as a context manager) once the workers are done.
+
+            Attributes:
+                handle (SharedHandle): picklable description of the segment for attach
+                segment (shared_memory.SharedMemory): the owned segment
+
+        """
+
+        _data = distribution.data
+        if _data is None:
+            raise ValueError("The distribution has no data set to share")
+
+        _data = np.ascontiguousarray(_data).ravel()
+
+        # Segments cannot be empty, so an empty data set still takes one byte
+        self.segment = shared_memory.SharedMemory(create=True, size=max(_data.nbytes, 1))
+        np.ndarray(_data.shape, dtype=_data.dtype, buffer=self.segment.buf)[:] = _data
+
+        self.handle = SharedHandle(self.segment.name, type(distribution).__name__, _data.dtype.str, len(_data),
+                                   int(getattr(distribution, 'n', len(_data))), float(distribution.mean),
+                                   float(distribution.stdev), float(getattr(distribution, 'prob', math.nan)))
+
+    def unlink(self) -> None:
+
+        """
+            Method to close and remove the segment. Processes still attached keep their
+            mapping until they detach, but no new process can attach.
+
+            Args:
+                None
+
+            Returns:
+                None
+
+        """
+
+        if self.segment is not None:
+            self.segment.close()
+            self.segment.unlink()
+            self.segment = None
+
+    def __enter__(self) -> 'SharedData':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.unlink()
+
+    def __repr__(self):
+        """
+            Function to return the characteristics of the SharedData instance.
+
+            Args:
+                None
+
+            Returns:
+                str: characteristics of the SharedData instance.
+
+        """
+
+        return f'Segment: {self.handle.name}, Kind: {self.handle.kind}, Length: {self.handle.length}'
+
+def attach(handle: SharedHandle) -> 'General_Distribution.Distribution':
+    """
+        Function to rebuild a distribution from a handle without copying its data. The data
+        set is a read-only view of the shared segment, which stays open in this process
+        until detach is called.
+
+        Args:
+            handle (SharedHandle): the handle of a SharedData segment.
+
+        Returns:
+            Distribution: read-only view of the shared distribution
+
+    """
+
+    if handle.name not in _attached:
+        _attached[handle.name] = shared_memory.SharedMemory(name=handle.name)
+
+    data = np.ndarray((handle.length,), dtype=np.dtype(handle.dtype), buffer=_attached[handle.name].buf)
+    data.flags.writeable = False
+
+    return General_Distribution.Distribution._restore(handle.kind, data, handle.n, handle.mean, handle.stdev, handle.prob)
+
+def detach(handle: SharedHandle) -> None:
+    """
+        Function to close this process's mapping of a shared segment. Views returned by
+        attach must be dropped first.
+
+        Args:
+            handle (SharedHandle): the handle passed to attach.
+
+        Returns:
+            None
+
+    """
+
+    _segment = _attached.pop(handle.name, None)
+    if _segment is not None:
+        _segment.close()
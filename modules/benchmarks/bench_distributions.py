@@ -0,0 +1,263 @@
+# %%
+import io
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import tracemalloc
+import contextlib
+import numpy as np
+
+# Add the distribution modules to the system path
+sys.path.insert(0, os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)))
+from General_Distribution import Distribution
+from Gaussian_Distribution import Gaussian
+from Binomial_Distribution import Binomial
+
+# Default data sizes; pass --sizes up to 100000000 for the full sweep
+DEFAULT_SIZES = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6]
+
+def _gaussian(data: 'np.ndarray') -> Gaussian:
+    """
+        Function to build a Gaussian fitted to the given data.
+    """
+
+    gaussian = Gaussian.__new__(Gaussian)
+    gaussian.data = data
+    Distribution.__init__(gaussian)
+    gaussian.analyze_data_set()
+
+    return gaussian
+
+def _binomial(data: 'np.ndarray') -> Binomial:
+    """
+        Function to build a Binomial fitted to the given 0/1 outcomes.
+    """
+
+    binomial = Binomial.__new__(Binomial)
+    binomial.data = data
+    Distribution.__init__(binomial)
+    binomial.analyze_data_set()
+
+    return binomial
+
+def bench_read_data_file(size: int, directory: str) -> 'callable':
+    """
+        Benchmark of Distribution.read_data_file on a text file with one value per line.
+    """
+
+    file_name = os.path.join(directory, f'numbers_{size}.txt')
+    if not os.path.exists(file_name):
+        np.savetxt(file_name, np.random.default_rng(0).normal(size=size), fmt='%.6f')
+    distribution = Distribution()
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            distribution.read_data_file(file_name)
+
+    return run
+
+def bench_analyze_data_set(size: int, directory: str) -> 'callable':
+    """
+        Benchmark of an uncached Gaussian.analyze_data_set.
+    """
+
+    gaussian = _gaussian(np.random.default_rng(0).normal(size=size))
+
+    def run():
+        gaussian.invalidate_cache()
+        gaussian.analyze_data_set()
+
+    return run
+
+def bench_calculate_stdev(size: int, directory: str) -> 'callable':
+    """
+        Benchmark of an uncached Gaussian.calculate_stdev.
+    """
+
+    gaussian = _gaussian(np.random.default_rng(0).normal(size=size))
+
+    def run():
+        gaussian.invalidate_cache()
+        gaussian.calculate_stdev()
+
+    return run
+
+def bench_gaussian_pdf(size: int, directory: str) -> 'callable':
+    """
+        Benchmark of Gaussian.pdf over an array of points.
+    """
+
+    gaussian = _gaussian(np.random.default_rng(0).normal(size=1000))
+    points = np.random.default_rng(1).normal(size=size)
+
+    return lambda: gaussian.pdf(points)
+
+def bench_binomial_pdf(size: int, directory: str) -> 'callable':
+    """
+        Benchmark of Binomial.pdf over an array of success counts.
+    """
+
+    binomial = _binomial((np.random.default_rng(0).random(size) < .3).astype(float))
+    points = np.random.default_rng(1).integers(0, binomial.n + 1, size=size)
+
+    return lambda: binomial.pdf(points)
+
+def bench_plot_histogram_pdf(size: int, directory: str) -> 'callable':
+    """
+        Benchmark of Gaussian.plot_histogram_pdf rendered with the Agg backend.
+    """
+
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    gaussian = _gaussian(np.random.default_rng(0).normal(size=size))
+
+    def run():
+        gaussian.plot_histogram_pdf()
+        plt.close('all')
+
+    return run
+
+def bench_add(size: int, directory: str) -> 'callable':
+    """
+        Benchmark of size additions of two Gaussians.
+    """
+
+    first = _gaussian(np.random.default_rng(0).normal(size=100))
+    second = _gaussian(np.random.default_rng(1).normal(size=100))
+
+    def run():
+        for _ in range(size):
+            first + second
+
+    return run
+
+def bench_sample(size: int, directory: str) -> 'callable':
+    """
+        Benchmark of Gaussian.sample into a preallocated buffer on all cores.
+    """
+
+    gaussian = _gaussian(np.random.default_rng(0).normal(size=100))
+    out = np.empty(size)
+
+    return lambda: gaussian.sample(out=out, rng=0, threads=os.cpu_count() or 1)
+
+# Benchmarks by name; each builds a callable that processes size elements
+BENCHMARKS = {
+    'read_data_file': bench_read_data_file,
+    'analyze_data_set': bench_analyze_data_set,
+    'calculate_stdev': bench_calculate_stdev,
+    'gaussian_pdf': bench_gaussian_pdf,
+    'binomial_pdf': bench_binomial_pdf,
+    'plot_histogram_pdf': bench_plot_histogram_pdf,
+    'add': bench_add,
+    'sample': bench_sample,
+}
+
+def run_benchmark(name: str, size: int, directory: str, repeat: int = 3) -> dict:
+    """
+        Function to time one benchmark at one data size.
+
+        Args:
+            name (str): name of the benchmark in BENCHMARKS.
+            size (int): number of elements processed per run.
+            directory (str): folder for generated data files.
+            repeat (int): number of timed runs; the fastest is reported.
+
+        Returns:
+            dict: seconds, throughput in elements per second and peak traced memory in bytes
+
+    """
+
+    run = BENCHMARKS[name](size, directory)
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+
+    # Memory is traced in a separate run so tracing does not slow the timed runs
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    seconds = min(timings)
+    return {'name': name, 'size': size, 'seconds': seconds,
+            'throughput': size / seconds if seconds > 0 else float('inf'), 'peak_bytes': peak}
+
+def compare(results: 'list[dict]', baseline: 'list[dict]', threshold: float) -> 'list[str]':
+    """
+        Function to find the runs that are slower than the stored baseline.
+
+        Args:
+            results (list[dict]): output of run_benchmark.
+            baseline (list[dict]): results of an earlier run.
+            threshold (float): allowed slowdown as a fraction, e.g. 0.25 for 25%.
+
+        Returns:
+            list[str]: description of each regression
+
+    """
+
+    expected = {(entry['name'], entry['size']): entry['seconds'] for entry in baseline}
+    regressions = []
+    for result in results:
+        key = (result['name'], result['size'])
+        if key in expected and result['seconds'] > expected[key] * (1 + threshold):
+            regressions.append(f"{key[0]} at {key[1]}: {result['seconds']:.6f}s vs baseline {expected[key]:.6f}s")
+
+    return regressions
+
+def main(argv: 'list[str] or None' = None) -> int:
+    """
+        Function to run the benchmark suite and check it against a baseline.
+
+        Args:
+            argv (list[str] or None): command line arguments.
+
+        Returns:
+            int: exit code, non-zero when a run regressed beyond the threshold
+
+    """
+
+    parser = argparse.ArgumentParser(description='Benchmark the distribution hot paths.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help='data sizes to time')
+    parser.add_argument('--benchmarks', nargs='+', choices=sorted(BENCHMARKS), default=list(BENCHMARKS),
+                        help='benchmarks to run')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per benchmark')
+    parser.add_argument('--output', help='write the results to this JSON file')
+    parser.add_argument('--baseline', help='JSON results of an earlier run to compare against')
+    parser.add_argument('--threshold', type=float, default=0.25, help='allowed slowdown against the baseline')
+    args = parser.parse_args(argv)
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for name in args.benchmarks:
+            for size in args.sizes:
+                result = run_benchmark(name, size, directory, args.repeat)
+                results.append(result)
+                print(f"{name:>20} {size:>11,d} {result['seconds']:>10.6f}s "
+                      f"{result['throughput']:>14,.0f}/s {result['peak_bytes'] / 2 ** 20:>10.2f} MiB")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        for regression in regressions:
+            print(f'Regression: {regression}', file=sys.stderr)
+        if regressions:
+            return 1
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
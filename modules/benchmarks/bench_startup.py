@@ -0,0 +1,90 @@
+# %%
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+# Directory holding the distribution modules
+MODULES_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+# Modules the distribution classes imported at load time before plotting and scipy were deferred
+EAGER_IMPORTS = ['numpy', 'scipy.stats', 'scipy.special', 'matplotlib.pyplot']
+
+# Modules that must not be loaded by importing the distribution classes
+DEFERRED_PREFIXES = ('scipy', 'matplotlib', 'asyncio', 'multiprocessing')
+
+def time_import(statement: str, repeat: int = 5) -> 'float, list[str]':
+    """
+        Function to time an import statement in fresh interpreter processes.
+
+        Args:
+            statement (str): python import statement to time.
+            repeat (int): number of fresh processes to time.
+
+        Returns:
+            float: median import time in seconds
+            list[str]: deferred modules that were loaded by the statement
+
+    """
+
+    code = (
+        'import sys, time, json\n'
+        f'sys.path.insert(0, {MODULES_DIR!r})\n'
+        '_start = time.perf_counter()\n'
+        f'{statement}\n'
+        '_elapsed = time.perf_counter() - _start\n'
+        f'_loaded = sorted(m for m in sys.modules if m.startswith({DEFERRED_PREFIXES!r}))\n'
+        'print(json.dumps([_elapsed, _loaded]))\n'
+    )
+
+    timings = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True).stdout
+        elapsed, loaded = json.loads(output)
+        timings.append(elapsed)
+
+    return statistics.median(timings), loaded
+
+def main(argv: 'list[str] or None' = None) -> int:
+    """
+        Function to compare the start-up cost of the distribution modules with the
+        cost of the plotting and scipy imports they defer.
+
+        Args:
+            argv (list[str] or None): command line arguments.
+
+        Returns:
+            int: exit code, non-zero when a deferred module is loaded at import time
+            or the saving is below the threshold
+
+    """
+
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('--repeat', type=int, default=5, help='fresh processes per measurement')
+    parser.add_argument('--min-saving', type=float, default=0.0, help='minimum saving in seconds')
+    parser.add_argument('--output', help='write the measurements to this JSON file')
+    args = parser.parse_args(argv)
+
+    distributions, loaded = time_import('import Gaussian_Distribution, Binomial_Distribution', args.repeat)
+    eager, _ = time_import('import ' + ', '.join(EAGER_IMPORTS), args.repeat)
+    saving = eager - distributions
+
+    report = {'distributions_import_s': distributions, 'eager_dependencies_import_s': eager,
+              'saving_s': saving, 'deferred_modules_loaded': loaded}
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if loaded:
+        print(f'Deferred modules loaded at import time: {loaded}', file=sys.stderr)
+        return 1
+    if saving < args.min_saving:
+        print(f'Saving of {saving:.3f}s is below the threshold of {args.min_saving:.3f}s', file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,68 @@
+# %%
+import sys
+import unittest
+import datetime
+import os
+import tempfile
+
+# Add the Batch Processing Module to the system path and import the package to test
+sys.path.insert(0, os.path.normpath(os.getcwd() + os.sep + os.pardir))
+import Batch_Processing as bp
+from Gaussian_Distribution import Gaussian
+
+# Code for the unittest class
+class TestBatchProcessing(unittest.TestCase):
+    def setUp(self) -> None:
+        self.paths = ['numbers_gaussian.txt', 'missing_file.txt', 'numbers_binomial.txt']
+
+    def test_fit_many_gaussian(self) -> None:
+        results = bp.fit_many(self.paths, kind='gaussian', workers=2, chunksize=1)
+        self.assertEqual([result.path for result in results], self.paths, 'results are not in input order')
+        self.assertEqual(round(results[0].mean, 2), 78.09, 'incorrect mean')
+        self.assertEqual(round(results[0].stdev, 2), 92.87, 'incorrect standard deviation')
+        self.assertEqual(results[0].n, 11, 'incorrect number of observations')
+        self.assertIsNone(results[0].error, 'unexpected error')
+        self.assertIsNone(results[1].mean, 'failed file should not have parameters')
+        self.assertIn('FileNotFoundError', results[1].error, 'error was not collected')
+        self.assertEqual(results[2].n, 13, 'batch stopped after a failed file')
+
+    def test_fit_many_binomial(self) -> None:
+        results = bp.fit_many(self.paths, kind='binomial', workers=1)
+        self.assertEqual(round(results[2].prob, 2), 0.62, 'incorrect probability')
+        self.assertEqual(round(results[2].mean, 1), 8.0, 'incorrect mean')
+        self.assertEqual(results, bp.fit_many(self.paths, kind='binomial', workers=2), 'pool and serial results differ')
+
+    def test_export_many(self) -> None:
+        distributions = [Gaussian(file_name='numbers_gaussian.txt'), Gaussian(25, 2)]
+        with tempfile.TemporaryDirectory() as directory:
+            outputs = [os.path.join(directory, f'figure_{i}.png') for i in range(len(distributions))]
+            results = bp.export_many(distributions, outputs, workers=2)
+            self.assertEqual([result.output for result in results], outputs, 'results are not in input order')
+            self.assertIsNone(results[0].error, 'unexpected error')
+            self.assertGreater(os.path.getsize(outputs[0]), 0, 'figure was not written')
+            self.assertIsNone(results[1].error, 'unexpected error')
+            results = bp.export_many(distributions[:1], outputs[:1], method='plot_bar', workers=1)
+            self.assertIn('AttributeError', results[0].error, 'error was not collected')
+        with self.assertRaises(ValueError):
+            bp.export_many(distributions, outputs[:1])
+
+    def test_unknown_kind(self) -> None:
+        with self.assertRaises(ValueError):
+            bp.fit_many(self.paths, kind='poisson')
+
+# Run the test
+if __name__ == "__main__":
+    
+    tests = TestBatchProcessing()
+
+    tests_loaded = unittest.TestLoader().loadTestsFromModule(tests)
+
+    result = unittest.TextTestRunner().run(tests_loaded)
+    result = ", ".join(str(result).split()[1:]).replace(">","")
+
+    # Add to the log file
+    filepath = os.path.join('../logs/', 'log_file.txt')
+    new_line = '\n'
+    with open(filepath, 'a') as f:
+        f.write(f'Batch Processing - {str(datetime.datetime.now())}, {result}{new_line}')
+        f.close()
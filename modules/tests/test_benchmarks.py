@@ -0,0 +1,56 @@
+# %%
+import sys
+import unittest
+import datetime
+import os
+import json
+import tempfile
+
+# Add the benchmarks folder to the system path and import the benchmark suite
+sys.path.insert(0, os.path.normpath(os.getcwd() + os.sep + os.pardir + os.sep + 'benchmarks'))
+import bench_distributions as bd
+
+# Code for the unittest class
+class TestBenchmarks(unittest.TestCase):
+    def test_run_benchmarks(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            for name in bd.BENCHMARKS:
+                result = bd.run_benchmark(name, 100, directory, repeat=1)
+                self.assertEqual((result['name'], result['size']), (name, 100), 'incorrect benchmark result')
+                self.assertGreater(result['peak_bytes'], 0, f'{name} did not report peak memory')
+
+    def test_compare(self) -> None:
+        baseline = [{'name': 'add', 'size': 10, 'seconds': 1.0}]
+        self.assertEqual(bd.compare([{'name': 'add', 'size': 10, 'seconds': 1.2}], baseline, .25), [],\
+            'run within the threshold reported as a regression')
+        self.assertEqual(len(bd.compare([{'name': 'add', 'size': 10, 'seconds': 1.3}], baseline, .25)), 1,\
+            'regression was not reported')
+
+    def test_main(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, 'results.json')
+            arguments = ['--sizes', '100', '--benchmarks', 'gaussian_pdf', '--repeat', '1', '--output', output]
+            self.assertEqual(bd.main(arguments), 0, 'benchmark run failed')
+            with open(output) as f:
+                results = json.load(f)
+            results[0]['seconds'] = 0.0
+            with open(output, 'w') as f:
+                json.dump(results, f)
+            self.assertEqual(bd.main(arguments[:-2] + ['--baseline', output]), 1, 'regression did not fail the run')
+
+# Run the test
+if __name__ == "__main__":
+    
+    tests = TestBenchmarks()
+
+    tests_loaded = unittest.TestLoader().loadTestsFromModule(tests)
+
+    result = unittest.TextTestRunner().run(tests_loaded)
+    result = ", ".join(str(result).split()[1:]).replace(">","")
+
+    # Add to the log file
+    filepath = os.path.join('../logs/', 'log_file.txt')
+    new_line = '\n'
+    with open(filepath, 'a') as f:
+        f.write(f'Benchmarks - {str(datetime.datetime.now())}, {result}{new_line}')
+        f.close()
@@ -4,9 +4,12 @@ import unittest
 import datetime
 import os
 import math
+import tempfile
+import io
 
 # Add the Gaussian Module to the system path and import the package to test
 sys.path.insert(0, os.path.normpath(os.getcwd() + os.sep + os.pardir))
+import numpy as np
 import Binomial_Distribution as b
 
 # Code for the unittest class
@@ -18,6 +21,21 @@ class TestBinomialClass(unittest.TestCase):
         self.assertEqual(self.binomial.prob, .5, 'incorrect probability')
         self.assertEqual(self.binomial.n, 2, 'incorrect standard deviation')
 
+    def test_slots_and_dtype(self) -> None:
+        self.assertFalse(hasattr(self.binomial, '__dict__'), 'instances should use slots')
+        self.binomial.read_data_file('numbers_binomial.txt')
+        self.assertEqual(self.binomial.data.dtype, np.uint8, 'outcomes should be stored as uint8')
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, 'outcomes.txt')
+            with open(file_name, 'w') as f:
+                f.write('1.0\n0.0\n1.0\n')
+            self.assertEqual(self.binomial.read_data_file(file_name).tolist(), [1, 0, 1], 'incorrect outcomes written as floats')
+            with open(file_name, 'w') as f:
+                f.write('1\n0.5\n')
+            with self.assertRaises(ValueError):
+                self.binomial.read_data_file(file_name)
+            self.assertEqual(self.binomial.read_data_file(file_name, 'float64').tolist(), [1, .5], 'dtype was not applied')
+
     def test_analyzedataset(self) -> None:
         self.binomial.read_data_file('numbers_binomial.txt')
         self.binomial.analyze_data_set(False)
@@ -33,6 +51,61 @@ class TestBinomialClass(unittest.TestCase):
         self.assertNotEqual(self.binomial.prob, 0.6153846153846154, 'incorrect probability')
         self.assertEqual(round(self.binomial.n, 3), 13, 'incorrect number of observations')
     
+    def test_cached_successes(self) -> None:
+        self.binomial.read_data_file('numbers_binomial.txt')
+        self.binomial.analyze_data_set(False)
+        self.assertEqual(self.binomial._cache['successes'], 8, 'count of successes was not cached')
+        self.binomial.append_data([1, 1, 0])
+        self.binomial.analyze_data_set(False)
+        self.assertEqual((self.binomial.n, self.binomial.prob), (16, 10 / 16), 'cache was not updated when data was appended')
+        self.assertEqual(self.binomial.data.dtype, b.np.uint8, 'appending outcomes changed the data type')
+        self.binomial.data = [0, 1]
+        self.binomial.analyze_data_set(False)
+        self.assertEqual(self.binomial.prob, .5, 'cache was not dropped when data was replaced')
+        self.assertEqual(self.binomial.data.dtype, b.np.uint8, 'data was not converted to the class data type')
+        with self.assertRaises(ValueError):
+            self.binomial.append_data([.5])
+
+    def test_counts_mode(self) -> None:
+        binomial = b.Binomial.from_counts(8, 13)
+        self.assertIsNone(binomial.data, 'counts mode should not store outcomes')
+        self.assertEqual((binomial.n, round(binomial.prob, 2), round(binomial.mean, 1)), (13, .62, 8.0), 'incorrect fit from counts')
+
+        for chunk in b.np.array_split(b.np.tile(b.np.array([1, 0, 0, 1], dtype=b.np.uint8), 250), 7):
+            binomial.update_counts(chunk)
+        self.assertEqual((binomial.n, binomial._successes), (1013, 508), 'incorrect counts after streaming chunks')
+        self.assertEqual(binomial.prob, 508 / 1013, 'distribution was not refitted')
+
+        binomial.add_counts(5 * 10 ** 8, 10 ** 9)
+        self.assertEqual(binomial.n, 10 ** 9 + 1013, 'incorrect number of trials')
+        self.assertAlmostEqual(binomial.prob, .5, 5, 'incorrect probability')
+
+        # A data set is reduced to its counts
+        self.binomial.read_data_file('numbers_binomial.txt')
+        self.binomial.update_counts([1, 1])
+        self.assertEqual((self.binomial.data, self.binomial.n, self.binomial._successes), (None, 15, 10), 'data was not reduced to counts')
+
+        with self.assertRaises(ValueError):
+            b.Binomial(.5, 10).update_counts([1])
+
+    def test_counts_sampling(self) -> None:
+        binomial = b.Binomial.from_counts(600, 1000)
+        binomial.analyze_data_set(True)
+        self.assertIsNone(binomial.data, 'sampling should not generate outcomes')
+        self.assertEqual(binomial.n, 1000, 'incorrect number of trials')
+        self.assertTrue(.5 < binomial.prob < .7, 'sampled count does not follow the distribution')
+
+    def test_read_counts_file(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, 'counts.txt')
+            with open(file_name, 'w') as f:
+                f.write('0,5\n1,8\n')
+            binomial = b.Binomial(file_name=file_name)
+            expanded = b.General_Distribution.Distribution().read_data_file(file_name)
+        self.assertIsNone(binomial.data, 'aggregated file should not be expanded')
+        self.assertEqual((binomial.n, round(binomial.prob, 2), round(binomial.stdev, 2)), (13, .62, 1.75), 'incorrect fit from counts file')
+        self.assertEqual(expanded.tolist(), [0.0] * 5 + [1.0] * 8, 'aggregated file was not expanded for other distributions')
+
     def test_meancalculation(self) -> None:
         self.binomial.read_data_file('numbers_binomial.txt')
         self.binomial.analyze_data_set(False)
@@ -50,10 +123,76 @@ class TestBinomialClass(unittest.TestCase):
         self.assertEqual(round(self.binomial.pdf(2), 2), 0.25,\
             'pdf function does not give expected result')
 
+    def test_pmf(self) -> None:
+        self.assertEqual(self.binomial.pmf(b.np.array([0, 1, 2])).tolist(), [0.25, 0.5, 0.25],\
+            'vectorized pmf does not give expected result')
+        self.assertEqual(self.binomial.pmf([-1, 0.5, 3]).tolist(), [0.0, 0.0, 0.0],\
+            'pmf outside the support should be zero')
+
+    def test_logpmf_large_n(self) -> None:
+        binomial = b.Binomial(.3, 10 ** 7)
+        k = b.np.arange(2999000, 3001000)
+        expected = b.np.array([math.lgamma(10 ** 7 + 1) - math.lgamma(x + 1) - math.lgamma(10 ** 7 - x + 1)\
+            + x * math.log(.3) + (10 ** 7 - x) * math.log(.7) for x in k.tolist()])
+        self.assertTrue(b.np.all(b.np.isfinite(binomial.logpmf(k))), 'logpmf overflowed')
+        self.assertTrue(b.np.allclose(binomial.logpmf(k), expected, rtol=0, atol=1e-6), 'logpmf is not accurate')
+
+    def test_cdf_sf(self) -> None:
+        self.assertEqual(self.binomial.cdf(b.np.array([-1, 0, 1, 1.5, 2, 3])).tolist(), [0.0, 0.25, 0.75, 0.75, 1.0, 1.0],\
+            'cdf does not give expected result')
+        self.assertEqual(self.binomial.sf(b.np.array([-1, 0, 1, 2, 3])).tolist(), [1.0, 0.75, 0.25, 0.0, 0.0],\
+            'sf does not give expected result')
+
+        binomial = b.Binomial(.3, 1000)
+        k = b.np.arange(0, 1001)
+        pmf = binomial.pmf(k)
+        self.assertTrue(b.np.allclose(binomial.cdf(k), b.np.cumsum(pmf), rtol=1e-10), 'cdf is not the sum of the pmf')
+        self.assertAlmostEqual(binomial.sf(700) / pmf[701:].sum(), 1.0, 10, 'sf is not accurate in the upper tail')
+
+    def test_ppf(self) -> None:
+        self.assertEqual(self.binomial.ppf(b.np.array([0, .25, .5, .75, .9, 1])).tolist(), [0.0, 0.0, 1.0, 1.0, 2.0, 2.0],\
+            'ppf does not give expected result')
+        self.assertTrue(b.np.isnan(self.binomial.ppf(1.5)), 'ppf outside 0..1 should be nan')
+
+        binomial = b.Binomial(.3, 1000)
+        q = b.np.linspace(.001, .999, 101)
+        k = binomial.ppf(q)
+        self.assertTrue(b.np.all(binomial.cdf(k) >= q) and b.np.all(binomial.cdf(k - 1) < q), 'ppf is not the inverse of cdf')
+        self.assertEqual(binomial.ppf(1), 1000, 'ppf(1) should be n')
+
+    def test_table_cache(self) -> None:
+        b._cumulative_tables.cache_clear()
+        binomial = b.Binomial(.3, 1000)
+        binomial.cdf(10)
+        binomial.sf(b.np.arange(10))
+        binomial.ppf(.5)
+        self.assertEqual(b._cumulative_tables.cache_info().misses, 1, 'table was not reused between queries')
+
+        binomial = b.Binomial(.5, 10**8)
+        offset, cdf, sf = b._cumulative_tables(binomial.n, binomial.prob)
+        self.assertLess(len(cdf), 10**6, 'table should only cover the non-negligible support')
+        self.assertEqual((binomial.cdf(offset - 10), binomial.sf(offset - 10)), (0, sf[0]), 'incorrect lower tail outside the table')
+        self.assertEqual((binomial.cdf(10**8 - 1), binomial.sf(10**8 - 1)), (cdf[-1], 0), 'incorrect upper tail outside the table')
+        self.assertEqual(binomial.ppf(0), 0, 'ppf(0) should be 0')
+        self.assertAlmostEqual(binomial.cdf(5 * 10**7), .5, 4, 'incorrect cdf at the mean')
+
+    def test_add(self) -> None:
+        result = self.binomial + b.Binomial(.5, 3)
+        self.assertIsInstance(result, b.Binomial, 'equal probabilities should give a Binomial')
+        self.assertEqual((result.n, result.prob, result.mean), (5, .5, 2.5), 'incorrect sum of Binomials')
+
     def test_plotbarpdf(self) -> None:
         self.assertEqual(self.binomial.plot_bar_pdf(2), ([0, 1, 2], [0.25, 0.5, 0.25]),
         'x and y are incorrect')
 
+    def test_plot_to_output(self) -> None:
+        buffer = io.BytesIO()
+        self.binomial.plot_bar(output=buffer, format='png')
+        self.assertEqual(buffer.getvalue()[:8], b'\x89PNG\r\n\x1a\n', 'figure was not rendered to the buffer')
+        x, y = b.Binomial(.5, 10 ** 8).plot_bar_pdf(output=io.BytesIO(), format='png')
+        self.assertLess(len(x), 10 ** 6, 'pmf should only be drawn around the mean')
+        self.assertAlmostEqual(sum(y), 1.0, 6, 'plotted pmf misses probability mass')
+
 # Run the test
 if __name__ == "__main__":
     
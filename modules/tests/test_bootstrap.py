@@ -0,0 +1,81 @@
+# %%
+import sys
+import unittest
+import datetime
+import os
+
+# Add the Bootstrap Module to the system path and import the package to test
+sys.path.insert(0, os.path.normpath(os.getcwd() + os.sep + os.pardir))
+import numpy as np
+import Bootstrap as bs
+import Gaussian_Distribution as g
+
+# Code for the unittest class
+class TestBootstrap(unittest.TestCase):
+    def setUp(self) -> None:
+        self.data = np.loadtxt('numbers_gaussian.txt')
+
+    def test_reproducible(self) -> None:
+        first = bs.bootstrap_replicates(self.data, n_resamples=2500, seed=42)
+        self.assertEqual(len(first), 2500, 'incorrect number of replicates')
+        self.assertTrue(np.array_equal(first, bs.bootstrap_replicates(self.data, n_resamples=2500, seed=42)),\
+            'same seed gave different replicates')
+        self.assertTrue(np.array_equal(first, bs.bootstrap_replicates(self.data, n_resamples=2500, seed=42, workers=2)),\
+            'replicates depend on the number of workers')
+        self.assertFalse(np.array_equal(first, bs.bootstrap_replicates(self.data, n_resamples=2500, seed=43)),\
+            'different seeds gave the same replicates')
+
+    def test_bounded_blocks(self) -> None:
+        default = bs.MAX_BLOCK_ELEMENTS
+        try:
+            bs.MAX_BLOCK_ELEMENTS = 25
+            blocked = bs.bootstrap_replicates(self.data, 'stdev', n_resamples=100, seed=1)
+        finally:
+            bs.MAX_BLOCK_ELEMENTS = default
+        self.assertTrue(np.allclose(blocked, bs.bootstrap_replicates(self.data, 'stdev', n_resamples=100, seed=1)),\
+            'block size changed the replicates')
+
+    def test_interval(self) -> None:
+        data = np.random.default_rng(0).normal(10, 2, size=400)
+        lower, upper = bs.bootstrap_interval(data, 'mean', .9, n_resamples=4000, seed=0)
+        half_width = 1.6448536269514722 * np.std(data, ddof=1) / np.sqrt(len(data))
+        self.assertAlmostEqual(lower, np.mean(data) - half_width, 1, 'incorrect lower end')
+        self.assertAlmostEqual(upper, np.mean(data) + half_width, 1, 'incorrect upper end')
+
+        lower, upper = bs.bootstrap_interval(data, 'stdev', .9, n_resamples=2000, seed=0)
+        self.assertTrue(lower < np.std(data, ddof=1) < upper, 'stdev interval does not cover the estimate')
+
+        with self.assertRaises(ValueError):
+            bs.bootstrap_interval(data, 'median')
+        for bad in (None, [1.0, np.nan, 2.0], [1.0, np.inf]):
+            with self.assertRaises(ValueError):
+                bs.bootstrap_replicates(bad)
+        with self.assertRaises(ValueError):
+            bs.bootstrap_replicates(data, n_resamples=0)
+        gaussian = g.Gaussian.from_parameters(10, 2)
+        gaussian.data = None
+        with self.assertRaises(ValueError):
+            gaussian.bootstrap_interval()
+
+    def test_gaussian_bootstrap_interval(self) -> None:
+        gaussian = g.Gaussian(file_name='numbers_gaussian.txt')
+        lower, upper = gaussian.bootstrap_interval(seed=7, n_resamples=2000)
+        self.assertTrue(lower < gaussian.mean < upper, 'interval does not cover the mean')
+        self.assertEqual((lower, upper), bs.bootstrap_interval(self.data, seed=7, n_resamples=2000), 'incorrect Gaussian interval')
+
+# Run the test
+if __name__ == "__main__":
+    
+    tests = TestBootstrap()
+
+    tests_loaded = unittest.TestLoader().loadTestsFromModule(tests)
+
+    result = unittest.TextTestRunner().run(tests_loaded)
+    result = ", ".join(str(result).split()[1:]).replace(">","")
+
+    # Add to the log file
+    filepath = os.path.join('../logs/', 'log_file.txt')
+    new_line = '\n'
+    with open(filepath, 'a') as f:
+        f.write(f'Bootstrap - {str(datetime.datetime.now())}, {result}{new_line}')
+        f.close()
@@ -1,11 +1,19 @@
-# Add the Gaussian Module to the system path and import the package to test
-sys.path.insert(0, os.path.normpath(os.getcwd() + os.sep + os.pardir))
-
+# %%
 import sys
 import unittest
 import datetime
 import os
+import tempfile
+import asyncio
+import time
+from unittest import mock
+
+# Add the Gaussian Module to the system path and import the package to test
+sys.path.insert(0, os.path.normpath(os.getcwd() + os.sep + os.pardir))
+import numpy as np
 import General_Distribution as d
+import Gaussian_Distribution as g
+import Binomial_Distribution as b
 
 # Code for the unittest class
 class TestDistributionClass(unittest.TestCase):
@@ -22,6 +30,112 @@ class TestDistributionClass(unittest.TestCase):
         self.distribution.read_data_file('numbers_binomial.txt')
         self.assertEqual(len(self.distribution.data), 13, 'data did not load correctly')
 
+    def test_read_float_file(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, 'floats.txt')
+            with open(file_name, 'w') as f:
+                f.write('1.5\n-2.25\n3e2\n')
+            data = self.distribution.read_data_file(file_name)
+        self.assertEqual(data.dtype, np.float64, 'data should be a typed array')
+        self.assertEqual(data.tolist(), [1.5, -2.25, 300.0], 'floats did not load correctly')
+
+    def test_read_memory_mapped_file(self) -> None:
+        values = np.arange(1000, dtype=np.float32)
+        with tempfile.TemporaryDirectory() as directory:
+            npy_name = os.path.join(directory, 'numbers.npy')
+            np.save(npy_name, values)
+            data = self.distribution.read_data_file(npy_name)
+            self.assertIsInstance(data, np.memmap, '.npy files should be memory-mapped')
+            self.assertEqual(data.dtype, np.float32, 'dtype of the .npy file was not kept')
+            self.assertTrue(np.array_equal(data, values), '.npy data did not load correctly')
+
+            raw_name = os.path.join(directory, 'numbers.bin')
+            values.tofile(raw_name)
+            data = self.distribution.read_data_file(raw_name, dtype='float32')
+            self.assertIsInstance(data, np.memmap, 'raw binary files should be memory-mapped')
+            self.assertTrue(np.array_equal(data, values), 'raw binary data did not load correctly')
+            del data
+            self.distribution.data = None
+
+    def test_aread_data_files(self) -> None:
+        file_names = ['numbers_gaussian.txt', 'numbers_binomial.txt'] * 10
+        load_array = d.Distribution.load_array
+
+        # Simulate network latency with a blocking delay on every file
+        def slow_load_array(file_name, dtype='float64'):
+            time.sleep(.1)
+            return load_array(file_name, dtype)
+
+        with mock.patch.object(d.Distribution, 'load_array', side_effect=slow_load_array):
+            start = time.perf_counter()
+            arrays = asyncio.run(d.Distribution.aread_data_files(file_names, concurrency=10))
+            elapsed = time.perf_counter() - start
+
+        self.assertEqual([len(array) for array in arrays], [11, 13] * 10, 'files were not returned in order')
+        self.assertLess(elapsed, 1.0, 'reads did not overlap')
+
+        with self.assertRaises(FileNotFoundError):
+            asyncio.run(d.Distribution.aread_data_files(['missing_file.txt']))
+        results = asyncio.run(d.Distribution.aread_data_files(['missing_file.txt'], return_exceptions=True))
+        self.assertIsInstance(results[0], FileNotFoundError, 'exception was not returned')
+
+    def test_afit_data_files(self) -> None:
+        gaussians = asyncio.run(g.Gaussian.afit_data_files(['numbers_gaussian.txt'] * 3, concurrency=2))
+        self.assertEqual([round(gaussian.stdev, 2) for gaussian in gaussians], [92.87] * 3, 'incorrect fitted Gaussians')
+        binomials = asyncio.run(b.Binomial.afit_data_files(['numbers_binomial.txt']))
+        self.assertEqual((binomials[0].n, round(binomials[0].prob, 2)), (13, .62), 'incorrect fitted Binomial')
+
+    def test_snapshot(self) -> None:
+        gaussian = g.Gaussian(file_name='numbers_gaussian.txt')
+        binomial = b.Binomial(file_name='numbers_binomial.txt')
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, 'gaussian.snapshot')
+            gaussian.save(file_name)
+            loaded = d.Distribution.load(file_name)
+            self.assertIsInstance(loaded, g.Gaussian, 'snapshot did not restore the class')
+            self.assertEqual((loaded.mean, loaded.stdev, loaded.n), (gaussian.mean, gaussian.stdev, gaussian.n), 'incorrect parameters')
+            self.assertIsInstance(loaded.data, np.memmap, 'data should be memory-mapped')
+            self.assertEqual(loaded.data.ctypes.data % d.SNAPSHOT_ALIGNMENT, 0, 'data buffer is not aligned')
+            self.assertTrue(np.array_equal(loaded.data, gaussian.data), 'incorrect data')
+
+            loaded.mean = 1.0
+            loaded.save(file_name)
+            self.assertTrue(np.array_equal(loaded.data, gaussian.data), 'saving over the snapshot changed the mapped data')
+            reloaded = d.Distribution.load(file_name)
+            self.assertEqual(reloaded.mean, 1.0, 'snapshot was not updated')
+            self.assertTrue(np.array_equal(reloaded.data, gaussian.data), 'saving over the snapshot corrupted the data')
+            del reloaded
+            with self.assertRaises(ValueError):
+                b.Binomial.load(file_name)
+            del loaded
+
+            file_name = os.path.join(directory, 'binomial.snapshot')
+            binomial.data = binomial.data.astype(np.uint8)
+            binomial.save(file_name)
+            loaded = b.Binomial.load(file_name)
+            self.assertEqual((loaded.prob, loaded.n, loaded.data.dtype), (binomial.prob, 13, np.uint8), 'incorrect Binomial snapshot')
+            del loaded
+
+            b.Binomial.from_counts(600, 1000).save(file_name)
+            loaded = b.Binomial.load(file_name)
+            self.assertEqual(loaded.add_counts(400, 1000).prob, 0.5, 'counts were not restored from the snapshot')
+            self.assertEqual(loaded.analyze_data_set()[3], 2000, 'incorrect number of trials after adding counts')
+
+            file_name = os.path.join(directory, 'parameters.snapshot')
+            g.Gaussian.from_parameters(3, 2, 10).save(file_name)
+            loaded = g.Gaussian.load(file_name)
+            self.assertEqual((loaded.mean, loaded.stdev, loaded.n, loaded._data), (3, 2, 10, None), 'incorrect parameter-only snapshot')
+            self.assertEqual(loaded.analyze_data_set()[2], 10, 'parameter-only snapshot should sample its data on access')
+
+            g.Gaussian.from_moments(gaussian.moments()).save(file_name)
+            loaded = g.Gaussian.load(file_name)
+            self.assertIsNone(loaded.data, 'moment-only snapshot should not sample data')
+            with self.assertRaises(ValueError):
+                loaded.analyze_data_set()
+
+            with self.assertRaises(ValueError):
+                d.Distribution.load('numbers_gaussian.txt')
+
 # Run the test
 if __name__ == "__main__":
     
@@ -0,0 +1,81 @@
+# %%
+import sys
+import unittest
+import datetime
+import os
+import math
+
+# Add the Distribution Frame Module to the system path and import the package to test
+sys.path.insert(0, os.path.normpath(os.getcwd() + os.sep + os.pardir))
+import numpy as np
+import Distribution_Frame as df
+import Gaussian_Distribution as g
+import Binomial_Distribution as b
+
+# Code for the unittest class
+class TestDistributionFrameClass(unittest.TestCase):
+    def setUp(self) -> None:
+        self.data = np.random.default_rng(0).normal(5, 2, size=(50, 30))
+        self.frame = df.DistributionFrame(self.data)
+
+    def test_gaussian_fit(self) -> None:
+        self.assertEqual(len(self.frame), 50, 'incorrect number of series')
+        self.assertTrue(np.allclose(self.frame.mean, self.data.mean(axis=1)), 'incorrect means')
+        self.assertTrue(np.allclose(self.frame.stdev, self.data.std(axis=1, ddof=1)), 'incorrect standard deviations')
+        self.assertTrue(np.all(self.frame.n == 30), 'incorrect number of observations')
+
+        gaussian = g.Gaussian.__new__(g.Gaussian)
+        gaussian.data = self.data[7]
+        self.assertAlmostEqual(self.frame.stdev[7], gaussian.calculate_stdev(True), 12, 'does not match Gaussian.calculate_stdev')
+        self.assertAlmostEqual(self.frame[7].stdev, self.frame.stdev[7], 12, 'series distribution does not match the frame')
+
+        transposed = df.DistributionFrame(self.data.T, axis=0)
+        self.assertTrue(np.allclose(transposed.mean, self.frame.mean), 'axis was not respected')
+
+    def test_gaussian_pdf_cdf(self) -> None:
+        x = np.linspace(0, 10, 7)
+        pdf = self.frame.pdf(x)
+        self.assertEqual(pdf.shape, (50, 7), 'pdf should have one row per series')
+        self.assertTrue(np.allclose(pdf[3], self.frame[3].pdf(x)), 'incorrect pdf of a series')
+        self.assertTrue(np.allclose(self.frame.cdf(x)[3], self.frame[3].cdf(x)), 'incorrect cdf of a series')
+        self.assertEqual(self.frame.pdf(np.zeros((50, 2))).shape, (50, 2), 'per series points were not accepted')
+
+    def test_ragged_binomial(self) -> None:
+        outcomes = np.array([1, 0, 1, 1, 0, 0, 0, 1, 1, 1, 1, 0])
+        offsets = [0, 4, 4, 12]
+        frame = df.DistributionFrame(outcomes, offsets, kind='binomial')
+        self.assertEqual(frame.n.tolist(), [4, 0, 8], 'incorrect number of observations')
+        self.assertEqual(frame.prob[[0, 2]].tolist(), [.75, .5], 'incorrect probabilities')
+        self.assertTrue(math.isnan(frame.prob[1]), 'empty series should have no probability')
+
+        binomial = b.Binomial()
+        binomial.data = outcomes[4:]
+        binomial.analyze_data_set()
+        self.assertEqual((frame.mean[2], frame.stdev[2]), (binomial.mean, binomial.stdev), 'does not match Binomial.analyze_data_set')
+        self.assertTrue(np.allclose(frame.pdf([0, 3, 4])[2], binomial.pmf([0, 3, 4])), 'incorrect pmf of a series')
+        self.assertTrue(np.allclose(frame.cdf([-1, 3, 8])[2], binomial.cdf([-1, 3, 8])), 'incorrect cdf of a series')
+
+    def test_ragged_gaussian(self) -> None:
+        values = self.data.ravel()[:45]
+        frame = df.DistributionFrame(values, [0, 30, 45])
+        self.assertTrue(np.allclose(frame.mean, [values[:30].mean(), values[30:].mean()]), 'incorrect ragged means')
+        self.assertTrue(np.allclose(frame.stdev, [values[:30].std(ddof=1), values[30:].std(ddof=1)]), 'incorrect ragged standard deviations')
+        with self.assertRaises(ValueError):
+            df.DistributionFrame(values, [0, 30, 40])
+
+# Run the test
+if __name__ == "__main__":
+    
+    tests = TestDistributionFrameClass()
+
+    tests_loaded = unittest.TestLoader().loadTestsFromModule(tests)
+
+    result = unittest.TextTestRunner().run(tests_loaded)
+    result = ", ".join(str(result).split()[1:]).replace(">","")
+
+    # Add to the log file
+    filepath = os.path.join('../logs/', 'log_file.txt')
+    new_line = '\n'
+    with open(filepath, 'a') as f:
+        f.write(f'Distribution Frame - {str(datetime.datetime.now())}, {result}{new_line}')
+        f.close()
@@ -1,12 +1,17 @@
-# Add the Gaussian Module to the system path and import the package to test
-sys.path.insert(0, os.path.normpath(os.getcwd() + os.sep + os.pardir))
-
+# %%
 import sys
 import unittest
 import datetime
 import os
 import math
+import tempfile
+import io
+
+# Add the Gaussian Module to the system path and import the package to test
+sys.path.insert(0, os.path.normpath(os.getcwd() + os.sep + os.pardir))
+import numpy as np
 import Gaussian_Distribution as g
+from Running_Moments import RunningMoments
 
 # Code for the unittest class
 class TestGaussianClass(unittest.TestCase):
@@ -16,6 +21,15 @@ class TestGaussianClass(unittest.TestCase):
     def test_initialization(self) -> None:
         self.assertIsInstance(self.gaussian.mean, float, 'incorrect mean')
         self.assertIsInstance(self.gaussian.stdev, float, 'incorrect standard deviation')
+
+    def test_slots_and_dtype(self) -> None:
+        self.assertFalse(hasattr(self.gaussian, '__dict__'), 'instances should use slots')
+        with self.assertRaises(AttributeError):
+            self.gaussian.unknown = 1
+        gaussian = g.Gaussian(file_name='numbers_gaussian.txt', dtype='float32')
+        self.assertEqual(gaussian.data.dtype, np.float32, 'incorrect dtype of the data')
+        self.assertAlmostEqual(gaussian.mean, 78.09, 2, 'incorrect mean of float32 data')
+        self.assertEqual(g.Gaussian(0, 1, 10, dtype='float32').data.dtype, np.float32, 'incorrect dtype of the sample')
     
     def test_analyzedataset(self) -> None:
         self.gaussian.read_data_file('numbers_gaussian.txt')
@@ -32,6 +46,41 @@ class TestGaussianClass(unittest.TestCase):
         self.assertEqual(round(self.gaussian.stdev, 2), 88.55, 'incorrect standard deviation')
         self.assertEqual(round(self.gaussian.n, 2), 11, 'incorrect number of observations')
 
+    def test_memory_mapped_file(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, 'numbers.npy')
+            g.np.save(file_name, g.np.loadtxt('numbers_gaussian.txt'))
+            gaussian = g.Gaussian(file_name=file_name)
+            self.assertIsInstance(gaussian.data, g.np.memmap, 'data should stay memory-mapped')
+            self.assertEqual(round(gaussian.mean, 2), 78.09, 'incorrect mean')
+            self.assertEqual(round(gaussian.stdev, 2), 92.87, 'incorrect standard deviation')
+            del gaussian
+
+    def test_cached_statistics(self) -> None:
+        self.gaussian.read_data_file('numbers_gaussian.txt')
+        self.assertEqual(self.gaussian.analyze_data_set(True), self.gaussian.analyze_data_set(True), 'cached fit differs')
+        self.assertIn('moments', self.gaussian._cache, 'sufficient statistics were not cached')
+
+        # Replacing the data drops the cache
+        self.gaussian.data = g.np.array([1.0, 2.0, 3.0])
+        self.assertEqual(self.gaussian.analyze_data_set(True), (2.0, 1.0, 3), 'cache was not dropped when data was replaced')
+
+        # Appending updates the cached statistics
+        self.gaussian.append_data([4.0, 5.0])
+        mean, stdev, n = self.gaussian.analyze_data_set(True)
+        self.assertEqual((mean, n), (3.0, 5), 'cache was not updated when data was appended')
+        self.assertAlmostEqual(stdev, g.np.std([1, 2, 3, 4, 5], ddof=1), 12, 'incorrect standard deviation after append')
+
+        # In place changes need an explicit invalidation
+        self.gaussian.data[0] = 6.0
+        self.gaussian.invalidate_cache()
+        self.assertEqual(self.gaussian.calculate_mean(True), 4.0, 'cache was not dropped on invalidation')
+
+    def test_moments_round_trip(self) -> None:
+        self.gaussian.read_data_file('numbers_gaussian.txt')
+        gaussian = g.Gaussian.from_moments(self.gaussian.moments())
+        self.assertEqual(gaussian.analyze_data_set(True), self.gaussian.analyze_data_set(True), 'fit from moments differs')
+
     def test_meancalculation(self) -> None:
         self.gaussian.read_data_file('numbers_gaussian.txt')
         self.assertEqual(self.gaussian.calculate_mean(True),\
@@ -62,6 +111,72 @@ class TestGaussianClass(unittest.TestCase):
     def test_pdf(self) -> None:
         self.assertIsInstance(self.gaussian.pdf(25), float, 'pdf function does not give expected result')
     
+    def test_pdf_array(self) -> None:
+        points = [20.0, 25.0, 30.0]
+        expected = [self.gaussian.pdf(x) for x in points]
+        self.assertTrue(g.np.allclose(self.gaussian.pdf(g.np.array(points)), expected, rtol=1e-14, atol=0),\
+            'vectorized pdf does not match scalar pdf')
+
+        # pdf should score against the fitted parameters without refitting the data set
+        self.gaussian.data = [1, 2, 3]
+        self.assertTrue(g.np.isclose(self.gaussian.pdf(25), expected[1], rtol=1e-14, atol=0), 'pdf refitted the data set')
+
+    def test_logpdf(self) -> None:
+        points = g.np.linspace(15, 35, 11)
+        self.assertTrue(g.np.allclose(self.gaussian.logpdf(points), g.np.log(self.gaussian.pdf(points))),\
+            'logpdf does not match log of pdf')
+        self.assertTrue(g.np.isfinite(self.gaussian.logpdf(1e6)), 'logpdf underflowed in the tail')
+
+    def test_cdf_sf_ppf(self) -> None:
+        gaussian = g.Gaussian.from_moments(RunningMoments(100, 3.0, 99 * 4.0))
+        x = g.np.array([-1.0, 3.0, 5.0, 40.0])
+        self.assertTrue(g.np.allclose(gaussian.cdf(x), [0.022750131948179, 0.5, 0.841344746068543, 1.0]),\
+            'cdf does not give expected result')
+        self.assertTrue(g.np.allclose(gaussian.sf(x), 1 - gaussian.cdf(x)), 'sf is not the complement of cdf')
+        self.assertGreater(gaussian.sf(40.0), 0.0, 'sf underflowed in the upper tail')
+        self.assertTrue(g.np.allclose(gaussian.ppf(gaussian.cdf(x[:3])), x[:3]), 'ppf is not the inverse of cdf')
+        self.assertTrue(g.np.isnan(gaussian.ppf(1.5)), 'ppf outside 0..1 should be nan')
+
+    def test_parameter_broadcasting(self) -> None:
+        means = g.np.array([0.0, 1.0, 2.0])
+        stdevs = g.np.array([1.0, 2.0, 3.0])
+        x = g.np.linspace(-5, 5, 11)[:, None]
+        cdf = self.gaussian.cdf(x, mean=means, stdev=stdevs)
+        self.assertEqual(cdf.shape, (11, 3), 'cdf did not broadcast over the parameters')
+        self.assertTrue(g.np.allclose(cdf[:, 1], self.gaussian.cdf(x[:, 0], mean=1.0, stdev=2.0)), 'incorrect broadcast cdf')
+        self.assertTrue(g.np.allclose(self.gaussian.pdf(x, mean=means, stdev=stdevs),\
+            g.np.exp(self.gaussian.logpdf(x, mean=means, stdev=stdevs))), 'incorrect broadcast pdf')
+
+    def test_interval(self) -> None:
+        lower, upper = self.gaussian.interval(g.np.array([.5, .9]), mean=10.0, stdev=2.0)
+        self.assertTrue(g.np.allclose(lower, [8.651020499607837, 6.710292746097053]), 'incorrect lower end')
+        self.assertTrue(g.np.allclose(upper, [11.348979500392163, 13.289707253902947]), 'incorrect upper end')
+
+    def test_from_parameters(self) -> None:
+        gaussian = g.Gaussian.from_parameters(10, 2, 1000)
+        self.assertIsNone(gaussian._data, 'data should not be sampled before it is requested')
+        self.assertEqual((gaussian.mean, gaussian.stdev, gaussian.n), (10, 2, 1000), 'incorrect parameters')
+        self.assertEqual(gaussian.pdf(10), 1 / (2 * math.sqrt(2 * math.pi)), 'pdf should use the given parameters')
+        self.assertEqual(len(gaussian.data), 1000, 'data was not sampled on request')
+        self.assertAlmostEqual(gaussian.calculate_mean(), 10, 0, 'sampled data does not follow the parameters')
+
+    def test_add(self) -> None:
+        result = self.gaussian + g.Gaussian.from_parameters(5, 1.5)
+        self.assertEqual(result.mean, self.gaussian.mean + 5, 'incorrect mean of the sum')
+        self.assertEqual(result.stdev, math.sqrt(self.gaussian.stdev ** 2 + 1.5 ** 2), 'incorrect standard deviation of the sum')
+        self.assertIsNone(result._data, 'adding should not sample data')
+
+    def test_sum_many(self) -> None:
+        distributions = [g.Gaussian.from_parameters(mean, stdev) for mean, stdev in zip(range(100), g.np.linspace(1, 2, 100))]
+        result = g.sum_many(distributions)
+        expected = distributions[0]
+        for distribution in distributions[1:]:
+            expected = expected + distribution
+        self.assertAlmostEqual(result.mean, expected.mean, 9, 'incorrect mean of the sum')
+        self.assertAlmostEqual(result.stdev, expected.stdev, 9, 'incorrect standard deviation of the sum')
+        with self.assertRaises(ValueError):
+            g.sum_many([])
+
     def test_plothistogrampdf(self) -> None:
         self.gaussian.read_data_file('numbers_gaussian.txt')
         self.gaussian.analyze_data_set(True)
@@ -73,6 +188,17 @@ class TestGaussianClass(unittest.TestCase):
             self.gaussian.analyze_data_set(False)
         self.assertEqual(str(exception_context.exception), "Could not estimate the parameters of this data set. N (11) must be >= 20")
 
+    def test_plot_to_output(self) -> None:
+        self.gaussian.read_data_file('numbers_gaussian.txt')
+        buffer = io.BytesIO()
+        x, y = self.gaussian.plot_histogram_pdf(5, output=buffer, format='png')
+        self.assertEqual(buffer.getvalue()[:8], b'\x89PNG\r\n\x1a\n', 'figure was not rendered to the buffer')
+        self.assertEqual(len(x), 5, 'incorrect number of x values')
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, 'histogram.svg')
+            self.gaussian.plot_histogram(bins=4, output=file_name)
+            self.assertGreater(os.path.getsize(file_name), 0, 'figure was not written to the file')
+
 # Run the test
 if __name__ == "__main__":
     
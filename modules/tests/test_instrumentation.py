@@ -0,0 +1,76 @@
+# %%
+import sys
+import unittest
+import datetime
+import os
+import io
+import json
+import tempfile
+import contextlib
+
+# Add the Instrumentation Module to the system path and import the package to test
+sys.path.insert(0, os.path.normpath(os.getcwd() + os.sep + os.pardir))
+import numpy as np
+import Instrumentation as ins
+import Gaussian_Distribution as g
+import Binomial_Distribution as b
+
+# Code for the unittest class
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self) -> None:
+        self.gaussian = g.Gaussian(25, 2)
+
+    def test_records_calls(self) -> None:
+        with ins.Profiler() as profiler, contextlib.redirect_stdout(io.StringIO()):
+            self.gaussian.read_data_file('numbers_gaussian.txt')
+            self.gaussian.analyze_data_set(True)
+            self.gaussian.pdf(np.zeros(100))
+            b.Binomial(.5, 2).pdf([0, 1])
+        stats = profiler.snapshot()
+        self.assertEqual(stats['Gaussian.analyze_data_set']['calls'], 1, 'incorrect call count')
+        self.assertEqual(stats['Gaussian.calculate_mean']['elements'], 11, 'incorrect element count')
+        self.assertEqual(stats['Gaussian.pdf']['elements'], 100, 'incorrect element count')
+        self.assertEqual(stats['Binomial.pdf']['elements'], 2, 'incorrect element count')
+        self.assertGreaterEqual(stats['Gaussian.analyze_data_set']['seconds'], stats['Gaussian.calculate_mean']['seconds'],\
+            'wall time should include nested calls')
+
+    def test_disabled(self) -> None:
+        original = g.Gaussian.__dict__['pdf']
+        with ins.Profiler() as outer:
+            self.assertIsNot(g.Gaussian.__dict__['pdf'], original, 'methods are not instrumented')
+            with ins.Profiler() as inner:
+                self.gaussian.pdf(25)
+            self.gaussian.pdf(25)
+        self.assertIs(g.Gaussian.__dict__['pdf'], original, 'methods were not restored')
+        self.gaussian.pdf(25)
+        self.assertEqual(inner.snapshot()['Gaussian.pdf']['calls'], 1, 'inner profiler recorded outside its block')
+        self.assertEqual(outer.snapshot()['Gaussian.pdf']['calls'], 2, 'outer profiler missed calls')
+
+    def test_to_json(self) -> None:
+        with ins.Profiler() as profiler:
+            self.gaussian.pdf([24, 25, 26])
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, 'stats.json')
+            document = profiler.to_json(file_name)
+            with open(file_name) as file:
+                self.assertEqual(json.load(file), json.loads(document), 'file and document differ')
+        self.assertEqual(json.loads(document), profiler.snapshot(), 'JSON does not match the snapshot')
+        profiler.reset()
+        self.assertEqual(profiler.snapshot(), {}, 'statistics were not cleared')
+
+# Run the test
+if __name__ == "__main__":
+
+    tests = TestInstrumentation()
+
+    tests_loaded = unittest.TestLoader().loadTestsFromModule(tests)
+
+    result = unittest.TextTestRunner().run(tests_loaded)
+    result = ", ".join(str(result).split()[1:]).replace(">","")
+
+    # Add to the log file
+    filepath = os.path.join('../logs/', 'log_file.txt')
+    new_line = '\n'
+    with open(filepath, 'a') as f:
+        f.write(f'Instrumentation - {str(datetime.datetime.now())}, {result}{new_line}')
+        f.close()
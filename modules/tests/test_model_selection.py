@@ -0,0 +1,70 @@
+# %%
+import sys
+import unittest
+import datetime
+import os
+
+# Add the Model Selection Module to the system path and import the package to test
+sys.path.insert(0, os.path.normpath(os.getcwd() + os.sep + os.pardir))
+import numpy as np
+import Model_Selection as ms
+import Gaussian_Distribution as g
+import Binomial_Distribution as b
+
+# Code for the unittest class
+class TestModelSelection(unittest.TestCase):
+    def setUp(self) -> None:
+        self.data = np.random.default_rng(3).normal(10, 2, size=5000)
+        self.candidates = [g.Gaussian.from_parameters(mean, stdev) for mean, stdev in [(0, 1), (10, 2), (10, 5), (12, 2)]]
+
+    def test_loglik(self) -> None:
+        gaussian = self.candidates[1]
+        self.assertAlmostEqual(gaussian.loglik(self.data), float(np.sum(np.log(gaussian.pdf(self.data)))), 6,\
+            'incorrect Gaussian log-likelihood')
+        binomial = b.Binomial(.5, 2)
+        self.assertAlmostEqual(binomial.loglik([0, 1, 1]), np.log(.25 * .5 * .5), 12, 'incorrect Binomial log-likelihood')
+        self.assertEqual(binomial.loglik([3]), -np.inf, 'impossible outcome should have -inf log-likelihood')
+
+    def test_select_model(self) -> None:
+        result = ms.select_model(self.data, self.candidates)
+        self.assertEqual(result.index, 1, 'incorrect best candidate')
+        self.assertIs(result.best, self.candidates[1], 'incorrect best candidate')
+        expected = [candidate.loglik(self.data) for candidate in self.candidates]
+        self.assertTrue(np.allclose(result.loglik, expected, rtol=1e-12), 'incorrect log-likelihoods')
+        self.assertTrue(np.allclose(result.aic, 4 - 2 * np.array(expected), rtol=1e-12), 'incorrect AIC')
+
+    def test_blocks_and_threads(self) -> None:
+        default = ms.MAX_BLOCK_ELEMENTS
+        try:
+            ms.MAX_BLOCK_ELEMENTS = 100
+            blocked = ms.log_likelihoods(self.data, self.candidates, workers=3)
+        finally:
+            ms.MAX_BLOCK_ELEMENTS = default
+        self.assertTrue(np.allclose(blocked, ms.log_likelihoods(self.data, self.candidates), rtol=1e-12),\
+            'block size changed the log-likelihoods')
+
+    def test_mixed_candidates(self) -> None:
+        counts = np.random.default_rng(4).binomial(20, .3, size=500)
+        candidates = [b.Binomial(.5, 20), g.Gaussian.from_parameters(6, 2), b.Binomial(.3, 20), b.Binomial(.3, 5)]
+        result = ms.select_model(counts, candidates)
+        self.assertEqual(result.index, 2, 'incorrect best candidate')
+        self.assertEqual(result.loglik[3], -np.inf, 'impossible candidate should have -inf log-likelihood')
+        with self.assertRaises(ValueError):
+            ms.select_model(counts, [])
+
+# Run the test
+if __name__ == "__main__":
+
+    tests = TestModelSelection()
+
+    tests_loaded = unittest.TestLoader().loadTestsFromModule(tests)
+
+    result = unittest.TextTestRunner().run(tests_loaded)
+    result = ", ".join(str(result).split()[1:]).replace(">","")
+
+    # Add to the log file
+    filepath = os.path.join('../logs/', 'log_file.txt')
+    new_line = '\n'
+    with open(filepath, 'a') as f:
+        f.write(f'Model Selection - {str(datetime.datetime.now())}, {result}{new_line}')
+        f.close()
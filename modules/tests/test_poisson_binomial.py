@@ -0,0 +1,90 @@
+# %%
+import sys
+import unittest
+import datetime
+import os
+import math
+
+# Add the Poisson Binomial Module to the system path and import the package to test
+sys.path.insert(0, os.path.normpath(os.getcwd() + os.sep + os.pardir))
+import numpy as np
+import Binomial_Distribution as b
+import Poisson_Binomial_Distribution as pb
+
+def direct_pmf(probs: 'list[float]') -> 'np.ndarray':
+    """
+        Function to calculate the Poisson-binomial pmf one trial at a time.
+    """
+
+    pmf = np.array([1.0])
+    for prob in probs:
+        pmf = np.convolve(pmf, [1 - prob, prob])
+    return pmf
+
+# Code for the unittest class
+class TestPoissonBinomialClass(unittest.TestCase):
+    def setUp(self) -> None:
+        self.distribution = b.Binomial(.3, 10) + b.Binomial(.6, 5)
+
+    def test_initialization(self) -> None:
+        self.assertIsInstance(self.distribution, pb.PoissonBinomial, 'different probabilities should give a PoissonBinomial')
+        self.assertEqual(self.distribution.n, 15, 'incorrect number of trials')
+        self.assertAlmostEqual(self.distribution.mean, 6.0, 12, 'incorrect mean')
+        self.assertAlmostEqual(self.distribution.stdev, math.sqrt(10 * .3 * .7 + 5 * .6 * .4), 12, 'incorrect standard deviation')
+        self.assertEqual(self.distribution.trials.tolist(), [10, 5], 'incorrect components')
+        with self.assertRaises(TypeError):
+            self.distribution.save('poisson_binomial.snapshot')
+
+    def test_pmf_cdf(self) -> None:
+        expected = direct_pmf([.3] * 10 + [.6] * 5)
+        k = np.arange(-1, 17)
+        self.assertTrue(np.allclose(self.distribution.pmf(k), np.concatenate([[0], expected, [0]]), rtol=0, atol=1e-15),\
+            'pmf does not match the direct convolution')
+        self.assertTrue(np.allclose(self.distribution.cdf(k), np.concatenate([[0], np.cumsum(expected), [1]]), atol=1e-15),\
+            'cdf does not match the direct convolution')
+        self.assertTrue(np.allclose(self.distribution.sf(k), 1 - self.distribution.cdf(k), atol=1e-15), 'sf is not the complement of cdf')
+        self.assertEqual(self.distribution.ppf(1), 15, 'ppf(1) should be n')
+
+    def test_odd_single_trials(self) -> None:
+        for distribution in (pb.PoissonBinomial.from_probabilities([.1, .2, .3]),
+                             b.sum_many([b.Binomial(prob, 1) for prob in (.1, .2, .3)])):
+            expected = direct_pmf([.1, .2, .3])
+            k = np.arange(-1, 5)
+            self.assertEqual(len(distribution._pmf_table()), 4, 'pmf table should cover 0..n')
+            self.assertTrue(np.allclose(distribution.cdf(k), np.concatenate([[0], np.cumsum(expected), [1]]), atol=1e-15),\
+                'cdf does not match the direct convolution')
+            self.assertTrue(np.allclose(distribution.sf(k), 1 - distribution.cdf(k), atol=1e-15), 'sf is not the complement of cdf')
+            self.assertEqual((distribution.ppf(.5), distribution.ppf(.9), distribution.ppf(1)), (0, 1, 3), 'incorrect ppf')
+
+    def test_many_trials(self) -> None:
+        probs = np.random.default_rng(0).random(5000)
+        distribution = pb.PoissonBinomial.from_probabilities(probs)
+        self.assertTrue(np.allclose(distribution.pmf(np.arange(5001)), direct_pmf(probs), rtol=0, atol=1e-14),\
+            'FFT pmf does not match the direct convolution')
+
+    def test_sum_many(self) -> None:
+        binomials = [b.Binomial(.3, 10), b.Binomial(.6, 5), b.Binomial(.3, 2)]
+        result = b.sum_many(binomials)
+        self.assertEqual((result.trials.tolist(), result.probs.tolist()), ([12, 5], [.3, .6]), 'equal probabilities were not combined')
+        self.assertTrue(np.allclose(result.pmf(np.arange(18)), direct_pmf([.3] * 12 + [.6] * 5), atol=1e-15),\
+            'incorrect pmf of the sum')
+        self.assertIsInstance(b.sum_many([b.Binomial(.3, 10), b.Binomial(.3, 5)]), b.Binomial,\
+            'equal probabilities should give a Binomial')
+        self.assertEqual((self.distribution + b.Binomial(.1, 3)).n, 18, 'incorrect sum with a Binomial')
+
+# Run the test
+if __name__ == "__main__":
+    
+    tests = TestPoissonBinomialClass()
+
+    tests_loaded = unittest.TestLoader().loadTestsFromModule(tests)
+
+    result = unittest.TextTestRunner().run(tests_loaded)
+    result = ", ".join(str(result).split()[1:]).replace(">","")
+
+    # Add to the log file
+    filepath = os.path.join('../logs/', 'log_file.txt')
+    new_line = '\n'
+    with open(filepath, 'a') as f:
+        f.write(f'Poisson Binomial - {str(datetime.datetime.now())}, {result}{new_line}')
+        f.close()
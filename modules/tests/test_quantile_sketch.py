@@ -0,0 +1,108 @@
+# %%
+import sys
+import unittest
+import datetime
+import os
+import io
+
+# Add the Quantile Sketch Module to the system path and import the package to test
+sys.path.insert(0, os.path.normpath(os.getcwd() + os.sep + os.pardir))
+import numpy as np
+import Quantile_Sketch as qs
+import Gaussian_Distribution as g
+
+# Code for the unittest class
+class TestQuantileSketch(unittest.TestCase):
+    def setUp(self) -> None:
+        self.data = np.random.default_rng(5).normal(3, 4, size=20000)
+        self.probabilities = np.array([0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99])
+
+    def test_quantiles(self) -> None:
+        sketch = qs.QuantileSketch(0.01).update_batch(self.data)
+        exact = np.quantile(self.data, self.probabilities, method='lower')
+        self.assertTrue(np.all(np.abs(sketch.quantile(self.probabilities) - exact) <= 0.01 * np.abs(exact - sketch.reference) + 1e-12),\
+            'quantiles are outside the relative accuracy')
+        self.assertEqual((sketch.min, sketch.max), (self.data.min(), self.data.max()), 'incorrect min and max')
+        self.assertEqual((sketch.quantile(0), sketch.quantile(1)), (self.data.min(), self.data.max()), 'incorrect extremes')
+        self.assertEqual(sketch.count, len(self.data), 'incorrect count')
+        with self.assertRaises(ValueError):
+            sketch.quantile(1.5)
+        with self.assertRaises(ValueError):
+            sketch.update_batch(None)
+
+    def test_merge(self) -> None:
+        whole = qs.QuantileSketch().update_batch(self.data)
+        shards = [qs.QuantileSketch(reference=whole.reference).update_batch(shard) for shard in np.array_split(self.data, 4)]
+        merged = shards[0] + shards[1] + shards[2] + shards[3]
+        self.assertTrue(np.array_equal(merged.quantile(self.probabilities), whole.quantile(self.probabilities)),\
+            'merged sketch differs from the sketch of the whole data')
+        self.assertEqual(shards[0].count, 5000, 'addition modified its inputs')
+
+        shards = [qs.QuantileSketch().update_batch(shard) for shard in np.array_split(self.data, 4)]
+        merged = shards[0] + shards[1] + shards[2] + shards[3]
+        exact = np.quantile(self.data, self.probabilities, method='lower')
+        self.assertTrue(np.all(np.abs(merged.quantile(self.probabilities) - exact) <= 0.03 * np.abs(exact - whole.reference) + 0.01),\
+            'sketches with different references merged too coarsely')
+        with self.assertRaises(ValueError):
+            whole.merge(qs.QuantileSketch(0.05))
+
+    def test_large_offset(self) -> None:
+        data = np.random.default_rng(6).normal(1000, 1, size=20000)
+        sketch = qs.QuantileSketch(0.01).update_batch(data)
+        exact = np.quantile(data, self.probabilities, method='lower')
+        self.assertTrue(np.all(np.abs(sketch.quantile(self.probabilities) - exact) <= 0.01 * np.abs(exact - sketch.reference) + 1e-9),\
+            'quantiles are outside the accuracy relative to the spread')
+        counts, edges = sketch.bins(10)
+        self.assertLess(np.abs(counts - np.histogram(data, 10)[0]).max(), 0.02 * len(data), 'bin counts are too far off')
+
+    def test_bounded_buckets(self) -> None:
+        data = np.logspace(-50, 50, 1000)
+        sketch = qs.QuantileSketch(0.01, max_buckets=64).update_batch(data)
+        self.assertLessEqual(len(sketch._positive.counts), 64, 'too many buckets kept')
+        exact = np.quantile(data, 0.999, method='lower')
+        self.assertLessEqual(abs(sketch.quantile(0.999) - exact), 0.01 * exact, 'upper quantiles lost accuracy')
+
+    def test_bins(self) -> None:
+        sketch = qs.QuantileSketch(0.001).update_batch(self.data)
+        counts, edges = sketch.bins(8)
+        exact, exact_edges = np.histogram(self.data, 8)
+        self.assertTrue(np.allclose(edges, exact_edges), 'incorrect bin edges')
+        self.assertEqual(counts.sum(), len(self.data), 'bins lost values')
+        self.assertLess(np.abs(counts - exact).max(), 0.02 * len(self.data), 'bin counts are too far off')
+
+    def test_gaussian(self) -> None:
+        gaussian = g.Gaussian.from_sketch(qs.QuantileSketch().update_batch(self.data))
+        self.assertIsNone(gaussian.data, 'data should not be held')
+        self.assertAlmostEqual(gaussian.mean, np.mean(self.data), 9, 'incorrect mean')
+        self.assertAlmostEqual(gaussian.quantile(0.5), np.median(self.data), 1, 'incorrect median')
+        x, y = gaussian.plot_histogram_pdf(5, output=io.BytesIO(), format='png')
+        self.assertEqual(x[0], self.data.min(), 'plot range should come from the sketch')
+        loaded = g.Gaussian.from_parameters(0, 1, 1000)
+        loaded.sketch()
+        loaded.append_data(self.data)
+        self.assertEqual(loaded.sketch().count, 21000, 'sketch was not updated by append_data')
+        self.assertEqual(loaded.quantile(0.5), np.median(loaded.data), 'loaded data should give exact quantiles')
+        empty = g.Gaussian.from_moments(gaussian.moments())
+        with self.assertRaises(ValueError):
+            empty.sketch()
+        with self.assertRaises(ValueError):
+            empty.plot_histogram(output=io.BytesIO(), format='png')
+        with self.assertRaises(ValueError):
+            empty.plot_histogram_pdf(output=io.BytesIO(), format='png')
+
+# Run the test
+if __name__ == "__main__":
+
+    tests = TestQuantileSketch()
+
+    tests_loaded = unittest.TestLoader().loadTestsFromModule(tests)
+
+    result = unittest.TextTestRunner().run(tests_loaded)
+    result = ", ".join(str(result).split()[1:]).replace(">","")
+
+    # Add to the log file
+    filepath = os.path.join('../logs/', 'log_file.txt')
+    new_line = '\n'
+    with open(filepath, 'a') as f:
+        f.write(f'Quantile Sketch - {str(datetime.datetime.now())}, {result}{new_line}')
+        f.close()
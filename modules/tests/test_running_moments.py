@@ -0,0 +1,143 @@
+# %%
+import sys
+import unittest
+import datetime
+import os
+
+# Add the Running Moments Module to the system path and import the package to test
+sys.path.insert(0, os.path.normpath(os.getcwd() + os.sep + os.pardir))
+import numpy as np
+import Running_Moments as r
+import Gaussian_Distribution as g
+
+# Code for the unittest class
+class TestRunningMomentsClass(unittest.TestCase):
+    def setUp(self) -> None:
+        self.data = np.loadtxt('numbers_gaussian.txt')
+        self.moments = r.RunningMoments()
+
+    def test_update(self) -> None:
+        for x in self.data:
+            self.moments.update(x)
+        self.assertEqual(self.moments.count, 11, 'incorrect count')
+        self.assertAlmostEqual(self.moments.mean, np.mean(self.data), 10, 'incorrect mean')
+        self.assertAlmostEqual(self.moments.stdev(True), np.std(self.data, ddof=1), 10, 'incorrect sample standard deviation')
+        self.assertAlmostEqual(self.moments.stdev(False), np.std(self.data), 10, 'incorrect population standard deviation')
+
+    def test_update_batch(self) -> None:
+        self.moments.update_batch(self.data[:4]).update_batch(self.data[4:])
+        self.assertEqual(self.moments.count, 11, 'incorrect count')
+        self.assertAlmostEqual(self.moments.mean, np.mean(self.data), 10, 'incorrect mean')
+        self.assertAlmostEqual(self.moments.variance(True), np.var(self.data, ddof=1), 8, 'incorrect variance')
+
+    def test_update_batch_blocks(self) -> None:
+        data = np.random.default_rng(2).normal(1e4, 3, size=3 * r.REDUCTION_BLOCK + 5).astype(np.float32)
+        self.moments.update_batch(data)
+        exact = data.astype(np.float64)
+        self.assertAlmostEqual(self.moments.mean, np.mean(exact), 9, 'incorrect mean of float32 data')
+        self.assertAlmostEqual(self.moments.stdev(), np.std(exact, ddof=1), 9, 'incorrect standard deviation of float32 data')
+        self.assertFalse(hasattr(self.moments, '__dict__'), 'accumulator should use slots')
+
+    def test_too_few_observations(self) -> None:
+        self.assertTrue(np.isnan(self.moments.variance(True)) and np.isnan(self.moments.variance(False)), 'empty variance should be nan')
+        self.moments.update(self.data[0])
+        self.assertTrue(np.isnan(self.moments.stdev(True)), 'sample variance of one observation should be nan')
+        self.assertEqual(self.moments.stdev(False), 0, 'incorrect population variance of one observation')
+
+        gaussian = g.Gaussian.from_parameters()
+        gaussian.data = np.array([])
+        with self.assertRaises(ValueError):
+            gaussian.analyze_data_set()
+
+    def test_merge(self) -> None:
+        data = np.random.default_rng(0).normal(1e6, 3, size=10000)
+        shards = [r.RunningMoments().update_batch(shard) for shard in np.array_split(data, 7)]
+        merged = r.RunningMoments()
+        for shard in shards:
+            merged.merge(shard)
+        self.assertEqual(merged.count, 10000, 'incorrect count')
+        self.assertAlmostEqual(merged.mean, np.mean(data), 6, 'incorrect merged mean')
+        self.assertAlmostEqual(merged.stdev(), np.std(data, ddof=1), 8, 'incorrect merged standard deviation')
+        self.assertEqual((shards[0] + shards[1]).count, 2858, 'incorrect sum of shards')
+        self.assertEqual(shards[0].count, 1429, 'adding accumulators modified an input')
+
+    def test_gaussian_from_moments(self) -> None:
+        self.moments.update_batch(self.data)
+        gaussian = g.Gaussian.from_moments(self.moments)
+        self.assertIsNone(gaussian.data, 'Gaussian should not hold the raw data')
+        self.assertEqual(gaussian.n, 11, 'incorrect number of observations')
+        self.assertEqual(round(gaussian.mean, 2), 78.09, 'incorrect mean')
+        self.assertEqual(round(gaussian.stdev, 2), 92.87, 'incorrect standard deviation')
+
+        fitted = g.Gaussian(file_name='numbers_gaussian.txt')
+        self.assertAlmostEqual(fitted.moments().stdev(), fitted.stdev, 10, 'moments do not match the fitted data')
+
+class TestRollingMomentsClass(unittest.TestCase):
+    def setUp(self) -> None:
+        self.data = np.random.default_rng(1).normal(1e6, 2, size=3000) + np.linspace(0, 30, 3000)
+        self.window = 100
+        windows = np.lib.stride_tricks.sliding_window_view(self.data, self.window)
+        self.expected_mean = windows.mean(axis=1)
+        self.expected_stdev = windows.std(axis=1, ddof=1)
+
+    def test_append_evict(self) -> None:
+        rolling = r.RollingMoments(self.window)
+        means, stdevs = [], []
+        for x in self.data:
+            rolling.append(x)
+            if rolling.count == self.window:
+                means.append(rolling.mean)
+                stdevs.append(rolling.stdev())
+        self.assertTrue(np.allclose(means, self.expected_mean, rtol=0, atol=1e-8), 'incorrect rolling means')
+        self.assertTrue(np.allclose(stdevs, self.expected_stdev, rtol=0, atol=1e-7), 'incorrect rolling standard deviations')
+
+        self.assertEqual(rolling.evict(), self.data[-self.window], 'oldest observation was not evicted')
+        self.assertEqual(rolling.count, self.window - 1, 'incorrect count after eviction')
+        self.assertAlmostEqual(rolling.mean, np.mean(self.data[-self.window + 1:]), 8, 'incorrect mean after eviction')
+        with self.assertRaises(TypeError):
+            rolling.merge(r.RunningMoments())
+        with self.assertRaises(TypeError):
+            rolling + r.RunningMoments()
+
+    def test_update_batch(self) -> None:
+        rolling = r.RollingMoments(self.window).update_batch(self.data)
+        self.assertAlmostEqual(rolling.stdev(False), np.std(self.data[-self.window:]), 8, 'incorrect moments of the last window')
+        self.assertAlmostEqual(g.Gaussian.from_moments(rolling).mean, self.expected_mean[-1], 8, 'Gaussian does not match the window')
+
+    def test_rolling_moments(self) -> None:
+        mean, stdev = r.rolling_moments(self.data, self.window)
+        self.assertEqual(len(mean), len(self.data) - self.window + 1, 'incorrect number of windows')
+        self.assertTrue(np.allclose(mean, self.expected_mean, rtol=0, atol=1e-8), 'incorrect batch means')
+        self.assertTrue(np.allclose(stdev, self.expected_stdev, rtol=0, atol=1e-7), 'incorrect batch standard deviations')
+
+        gaussian = g.Gaussian.from_parameters()
+        gaussian.data = self.data
+        self.assertTrue(np.array_equal(gaussian.rolling_moments(self.window)[1], stdev), 'incorrect Gaussian rolling moments')
+        with self.assertRaises(ValueError):
+            r.rolling_moments(self.data[:5], 10)
+
+    def test_rolling_moments_shift(self) -> None:
+        rng = np.random.default_rng(7)
+        shifted = np.concatenate([rng.normal(0, 1, 20000), rng.normal(1e6, 1, 20000)])
+        drifting = np.linspace(0, 1e4, 40000) + rng.normal(0, 0.01, 40000)
+
+        for data in (shifted, drifting):
+            windows = np.lib.stride_tricks.sliding_window_view(data, 50)
+            mean, stdev = r.rolling_moments(data, 50)
+            self.assertTrue(np.allclose(mean, windows.mean(axis=1), rtol=0, atol=1e-8), 'incorrect batch means')
+            self.assertTrue(np.allclose(stdev, windows.std(axis=1, ddof=1), rtol=1e-4, atol=0), 'incorrect batch standard deviations')
+
+# Run the test
+if __name__ == "__main__":
+    
+    tests_loaded = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+    result = unittest.TextTestRunner().run(tests_loaded)
+    result = ", ".join(str(result).split()[1:]).replace(">","")
+
+    # Add to the log file
+    filepath = os.path.join('../logs/', 'log_file.txt')
+    new_line = '\n'
+    with open(filepath, 'a') as f:
+        f.write(f'Running Moments - {str(datetime.datetime.now())}, {result}{new_line}')
+        f.close()
@@ -0,0 +1,79 @@
+# %%
+import sys
+import unittest
+import datetime
+import os
+
+# Add the Sampling Module to the system path and import the package to test
+sys.path.insert(0, os.path.normpath(os.getcwd() + os.sep + os.pardir))
+import numpy as np
+import Sampling as sm
+import Gaussian_Distribution as g
+import Binomial_Distribution as b
+
+# Code for the unittest class
+class TestSampling(unittest.TestCase):
+    def setUp(self) -> None:
+        self.gaussian = g.Gaussian.from_parameters(10, 2)
+        self.binomial = b.Binomial(.3, 20)
+
+    def test_reproducible(self) -> None:
+        default = sm.BLOCK_SIZE
+        try:
+            sm.BLOCK_SIZE = 1000
+            first = self.gaussian.sample(10500, rng=42)
+            self.assertTrue(np.array_equal(first, self.gaussian.sample(10500, rng=42, threads=4)),\
+                'sample depends on the number of threads')
+        finally:
+            sm.BLOCK_SIZE = default
+        self.assertFalse(np.array_equal(first, self.gaussian.sample(10500, rng=43)), 'different seeds gave the same sample')
+        generator = np.random.default_rng(0)
+        self.assertFalse(np.array_equal(self.gaussian.sample(10, rng=generator), self.gaussian.sample(10, rng=generator)),\
+            'a generator should advance between calls')
+
+    def test_gaussian(self) -> None:
+        values = self.gaussian.sample(200000, rng=1)
+        self.assertAlmostEqual(np.mean(values), 10, 1, 'incorrect mean of the sample')
+        self.assertAlmostEqual(np.std(values), 2, 1, 'incorrect standard deviation of the sample')
+        self.assertIsInstance(self.gaussian.sample(rng=1), float, 'a single draw should be a float')
+        self.assertEqual(self.gaussian.sample((3, 4), dtype='float32').dtype, np.float32, 'incorrect dtype')
+
+    def test_out(self) -> None:
+        out = np.empty((50, 20), dtype=np.float32)
+        self.assertIs(self.gaussian.sample(out=out, rng=2), out, 'out was not filled in place')
+        self.assertTrue(np.array_equal(out.ravel(), self.gaussian.sample(1000, rng=2, dtype='float32')),\
+            'out and allocated samples differ')
+        with self.assertRaises(ValueError):
+            self.gaussian.sample(10, out=out)
+        with self.assertRaises(ValueError):
+            self.gaussian.sample(out=out[:, ::2])
+
+    def test_binomial(self) -> None:
+        counts = self.binomial.sample(100000, rng=3, threads=2)
+        self.assertEqual(counts.dtype, np.int64, 'incorrect dtype of the counts')
+        self.assertAlmostEqual(np.mean(counts), 6, 1, 'incorrect mean of the counts')
+        outcomes = self.binomial.sample(100000, rng=3, outcomes=True)
+        self.assertEqual(outcomes.dtype, np.uint8, 'incorrect dtype of the outcomes')
+        self.assertEqual(set(np.unique(outcomes).tolist()), {0, 1}, 'outcomes should be 0 or 1')
+        self.assertAlmostEqual(np.mean(outcomes), .3, 2, 'incorrect probability of the outcomes')
+        self.binomial.read_data_file('numbers_binomial.txt')
+        self.binomial.analyze_data_set(True)
+        self.assertEqual(self.binomial.data.dtype, np.uint8, 'analyze_data_set did not sample the outcomes')
+        self.assertEqual(len(self.binomial.data), 20, 'incorrect number of outcomes')
+
+# Run the test
+if __name__ == "__main__":
+
+    tests = TestSampling()
+
+    tests_loaded = unittest.TestLoader().loadTestsFromModule(tests)
+
+    result = unittest.TextTestRunner().run(tests_loaded)
+    result = ", ".join(str(result).split()[1:]).replace(">","")
+
+    # Add to the log file
+    filepath = os.path.join('../logs/', 'log_file.txt')
+    new_line = '\n'
+    with open(filepath, 'a') as f:
+        f.write(f'Sampling - {str(datetime.datetime.now())}, {result}{new_line}')
+        f.close()
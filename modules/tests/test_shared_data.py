@@ -0,0 +1,74 @@
+# %%
+import sys
+import unittest
+import datetime
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+# Add the Shared Data Module to the system path and import the package to test
+sys.path.insert(0, os.path.normpath(os.getcwd() + os.sep + os.pardir))
+import numpy as np
+import Shared_Data as sd
+import Gaussian_Distribution as g
+import Binomial_Distribution as b
+
+def mean_of_shared(handle: sd.SharedHandle) -> float:
+    view = sd.attach(handle)
+    result = float(np.mean(view.data))
+    del view
+    sd.detach(handle)
+    return result
+
+# Code for the unittest class
+class TestSharedData(unittest.TestCase):
+    def setUp(self) -> None:
+        self.gaussian = g.Gaussian(file_name='numbers_gaussian.txt')
+
+    def test_attach(self) -> None:
+        with self.gaussian.share() as shared:
+            self.assertLess(len(pickle.dumps(shared.handle)), 400, 'handle should not carry the data')
+            view = sd.attach(shared.handle)
+            self.assertIsInstance(view, g.Gaussian, 'incorrect class of the view')
+            self.assertTrue(np.array_equal(view.data, self.gaussian.data), 'shared data differs')
+            self.assertEqual((view.mean, view.stdev, view.n), (self.gaussian.mean, self.gaussian.stdev, self.gaussian.n),\
+                'incorrect parameters')
+            with self.assertRaises(ValueError):
+                view.data[0] = 0
+            del view
+            sd.detach(shared.handle)
+
+    def test_workers(self) -> None:
+        with self.gaussian.share() as shared:
+            with ProcessPoolExecutor(max_workers=2) as executor:
+                means = list(executor.map(mean_of_shared, [shared.handle] * 4))
+        self.assertTrue(np.allclose(means, np.mean(self.gaussian.data)), 'workers read incorrect data')
+        with self.assertRaises(FileNotFoundError):
+            sd.attach(shared.handle)
+
+    def test_binomial(self) -> None:
+        binomial = b.Binomial(file_name='numbers_binomial.txt')
+        with binomial.share() as shared:
+            view = sd.attach(shared.handle)
+            self.assertEqual((view.n, view.prob), (binomial.n, binomial.prob), 'incorrect parameters')
+            del view
+            sd.detach(shared.handle)
+        with self.assertRaises(ValueError):
+            b.Binomial.from_counts(3, 5).share()
+
+# Run the test
+if __name__ == "__main__":
+
+    tests = TestSharedData()
+
+    tests_loaded = unittest.TestLoader().loadTestsFromModule(tests)
+
+    result = unittest.TextTestRunner().run(tests_loaded)
+    result = ", ".join(str(result).split()[1:]).replace(">","")
+
+    # Add to the log file
+    filepath = os.path.join('../logs/', 'log_file.txt')
+    new_line = '\n'
+    with open(filepath, 'a') as f:
+        f.write(f'Shared Data - {str(datetime.datetime.now())}, {result}{new_line}')
+        f.close()
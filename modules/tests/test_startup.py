@@ -0,0 +1,35 @@
+# %%
+import sys
+import unittest
+import datetime
+import os
+
+# Add the benchmarks folder to the system path and import the start-up benchmark
+sys.path.insert(0, os.path.normpath(os.getcwd() + os.sep + os.pardir + os.sep + 'benchmarks'))
+import bench_startup as bs
+
+# Code for the unittest class
+class TestStartup(unittest.TestCase):
+    def test_deferred_imports(self) -> None:
+        _, loaded = bs.time_import('import Gaussian_Distribution, Binomial_Distribution, Batch_Processing', repeat=1)
+        self.assertEqual(loaded, [], 'plotting, scipy, asyncio or multiprocessing modules were imported at load time')
+
+    def test_benchmark(self) -> None:
+        self.assertEqual(bs.main(['--repeat', '1']), 0, 'start-up benchmark failed')
+
+# Run the test
+if __name__ == "__main__":
+    
+    tests = TestStartup()
+
+    tests_loaded = unittest.TestLoader().loadTestsFromModule(tests)
+
+    result = unittest.TextTestRunner().run(tests_loaded)
+    result = ", ".join(str(result).split()[1:]).replace(">","")
+
+    # Add to the log file
+    filepath = os.path.join('../logs/', 'log_file.txt')
+    new_line = '\n'
+    with open(filepath, 'a') as f:
+        f.write(f'Startup - {str(datetime.datetime.now())}, {result}{new_line}')
+        f.close()